@@ -2,13 +2,14 @@
 
 import sys
 from .cli import cli
-from .ui import main as gui_main
 
 if __name__ == '__main__':
     # Check for --gui flag before passing to click
     if '--gui' in sys.argv:
         sys.argv.remove('--gui')  # Remove --gui argument
+        # PyQt6 is only loaded when the GUI is asked for
+        from .ui import main as gui_main
         gui_main()
     else:
         # Run CLI
-        cli()
\ No newline at end of file
+        cli()
@@ -0,0 +1 @@
+"""Benchmarks for Obsidian to Hugo converter."""
@@ -0,0 +1,133 @@
+"""Peak memory of a full conversion, in the default and the streaming mode.
+
+Run with ``python -m obsidian_to_hugo.benchmarks.memory --notes 5000 --large-note-mb 8``.
+"""
+
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..converters.hugo_converter import HugoConverter
+from ..core.models import ConversionConfig, format_bytes
+from .parallel import _digest_tree
+from .synthetic_vault import generate_vault
+from .transforms import build_large_note
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss() -> int:
+    """Return the peak resident set size of the process in bytes, 0 if unknown."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_conversion(config: ConversionConfig) -> Dict:
+    """Convert a vault under ``tracemalloc`` and return its peak and retained memory."""
+    converter = HugoConverter(config)
+    converter.console = Console(quiet=True)
+
+    tracemalloc.start()
+    try:
+        stats = converter.convert()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "streaming": config.streaming,
+        "peak": peak,
+        "retained": retained,
+        "converted": stats.converted_files,
+        "output_digest": _digest_tree(config.hugo_content_path),
+    }
+
+
+def run_benchmark(notes: int, large_notes: int, large_note_mb: float) -> List[Dict]:
+    """Convert the same vault in both modes and measure each run."""
+    work_dir = Path(tempfile.mkdtemp(prefix="o2h-bench-"))
+    results = []
+
+    try:
+        vault = work_dir / "vault"
+        generate_vault(vault, notes=notes, attachments=0)
+        for index in range(large_notes):
+            content, _ = build_large_note(int(large_note_mb * 1024 * 1024), seed=index)
+            (vault / f"large-{index}.md").write_text(content, encoding="utf-8")
+
+        for streaming in (False, True):
+            site = work_dir / f"site-{'streaming' if streaming else 'default'}"
+            config = ConversionConfig(
+                obsidian_vault_path=vault,
+                hugo_content_path=site / "content",
+                hugo_static_path=site / "static",
+                hugo_archetypes_path=site / "archetypes",
+                parse_cache=False,
+                streaming=streaming,
+            )
+            results.append(measure_conversion(config))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+@click.command()
+@click.option("--notes", type=int, default=5000, help="Number of synthetic notes")
+@click.option("--large-notes", type=int, default=1, help="Number of large notes added to the vault")
+@click.option("--large-note-mb", type=float, default=8.0, help="Size of each large note in MB")
+@click.option(
+    "--budget-mb",
+    type=float,
+    default=None,
+    help="Fail when the streaming run allocates more than this many MB at its peak",
+)
+def main(notes: int, large_notes: int, large_note_mb: float, budget_mb: float):
+    """Measure the peak memory of a conversion with tracemalloc."""
+    console = Console()
+
+    results = run_benchmark(notes, large_notes, large_note_mb)
+    baseline = results[0]
+
+    table = Table(title=f"Conversion memory, {notes} notes and {large_notes} x {large_note_mb:g} MB")
+    table.add_column("Mode", style="cyan")
+    table.add_column("Peak", style="green")
+    table.add_column("Retained", style="green")
+    table.add_column("Output", style="green")
+
+    for result in results:
+        identical = result["output_digest"] == baseline["output_digest"]
+        table.add_row(
+            "streaming" if result["streaming"] else "default",
+            format_bytes(result["peak"]),
+            format_bytes(result["retained"]),
+            "identical" if identical else "[red]DIFFERS[/red]",
+        )
+
+    console.print(table)
+    if _max_rss():
+        console.print(f"Peak RSS of the benchmark process: {format_bytes(_max_rss())}")
+
+    if budget_mb is not None:
+        peak = results[-1]["peak"]
+        if peak > budget_mb * 1024 * 1024:
+            console.print(f"[red]Streaming peak {format_bytes(peak)} exceeds the {budget_mb:g} MB budget[/red]")
+            sys.exit(1)
+        console.print(f"[green]Streaming peak within the {budget_mb:g} MB budget[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark of conversion throughput against the number of worker processes.
+
+Run with ``python -m obsidian_to_hugo.benchmarks.parallel --notes 5000``.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..converters.hugo_converter import HugoConverter
+from ..core.models import ConversionConfig
+from .synthetic_vault import generate_vault
+
+
+def _digest_tree(root: Path) -> str:
+    """Hash every file below ``root`` together with its relative path."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(root.rglob("*.md")):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def run_benchmark(notes: int, jobs_list: Sequence[int], repeat: int = 1) -> List[Dict]:
+    """Convert the same synthetic vault once per jobs setting and time it."""
+    work_dir = Path(tempfile.mkdtemp(prefix="o2h-bench-"))
+    results = []
+
+    try:
+        vault = work_dir / "vault"
+        generate_vault(vault, notes=notes)
+
+        for jobs in jobs_list:
+            best = float("inf")
+            for _ in range(repeat):
+                site = work_dir / f"site-{jobs}"
+                shutil.rmtree(site, ignore_errors=True)
+                config = ConversionConfig(
+                    obsidian_vault_path=vault,
+                    hugo_content_path=site / "content",
+                    hugo_static_path=site / "static",
+                    hugo_archetypes_path=site / "archetypes",
+                    convert_attachments=False,
+                    jobs=jobs,
+                )
+                converter = HugoConverter(config)
+                converter.console = Console(quiet=True)
+
+                start = time.perf_counter()
+                converter.convert()
+                best = min(best, time.perf_counter() - start)
+
+            results.append({
+                "jobs": jobs,
+                "seconds": best,
+                "notes_per_second": notes / best,
+                "output_digest": _digest_tree(site / "content"),
+            })
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+@click.command()
+@click.option("--notes", type=int, default=2000, help="Number of synthetic notes")
+@click.option("--jobs", "jobs_list", type=int, multiple=True, help="Worker counts to measure")
+@click.option("--repeat", type=int, default=1, help="Runs per setting, the best one is kept")
+def main(notes: int, jobs_list: tuple, repeat: int):
+    """Measure how conversion scales with the number of worker processes."""
+    console = Console()
+
+    if not jobs_list:
+        cpu_count = os.cpu_count() or 1
+        jobs_list = tuple(sorted({1, *(2 ** i for i in range(1, 6) if 2 ** i <= cpu_count), cpu_count}))
+
+    results = run_benchmark(notes, jobs_list, repeat)
+    baseline = results[0]
+
+    table = Table(title=f"Parallel conversion, {notes} notes")
+    table.add_column("Jobs", style="cyan")
+    table.add_column("Time", style="green")
+    table.add_column("Notes/s", style="green")
+    table.add_column("Speedup", style="green")
+    table.add_column("Output", style="green")
+
+    for result in results:
+        identical = result["output_digest"] == baseline["output_digest"]
+        table.add_row(
+            str(result["jobs"]),
+            f"{result['seconds']:.2f}s",
+            f"{result['notes_per_second']:.0f}",
+            f"{baseline['seconds'] / result['seconds']:.2f}x",
+            "identical" if identical else "[red]DIFFERS[/red]",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Benchmark suite covering every stage of the conversion pipeline.
+
+Run with ``obsidian-to-hugo bench`` or
+``python -m obsidian_to_hugo.benchmarks.suite --notes 2000``.
+"""
+
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..converters.hugo_converter import HugoConverter
+from ..core.models import ConversionConfig, ObsidianNote
+from ..utils.obsidian_parser import ObsidianParser
+from ..utils.vault_scanner import VaultScanner
+from .synthetic_vault import generate_vault
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark."""
+
+    best: float
+    mean: float
+    runs: int
+    items: int
+
+    @property
+    def per_item(self) -> float:
+        return self.best / self.items if self.items else self.best
+
+
+def _measure(
+    func: Callable[[], object],
+    repeat: int,
+    items: int,
+    setup: Optional[Callable[[], object]] = None,
+) -> BenchmarkResult:
+    """Run ``func`` ``repeat`` times, calling ``setup`` untimed before each run."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return BenchmarkResult(min(timings), statistics.mean(timings), repeat, items)
+
+
+def _config(vault: Path, site: Path, **overrides) -> ConversionConfig:
+    settings = dict(
+        obsidian_vault_path=vault,
+        hugo_content_path=site / "content",
+        hugo_static_path=site / "static",
+        hugo_archetypes_path=site / "archetypes",
+        parse_cache=False,
+    )
+    settings.update(overrides)
+    return ConversionConfig(**settings)
+
+
+def _quiet_converter(config: ConversionConfig) -> HugoConverter:
+    converter = HugoConverter(config)
+    converter.console = Console(quiet=True)
+    return converter
+
+
+def bench_vault(name: str, vault: Path, work_dir: Path, repeat: int) -> Dict[str, BenchmarkResult]:
+    """Time each pipeline stage on one vault."""
+    results: Dict[str, BenchmarkResult] = {}
+    site = work_dir / f"site-{name}"
+
+    inventory = VaultScanner(vault, attachment_extensions=_config(vault, site).attachment_extensions).scan()
+    note_paths = inventory.note_paths
+    notes = len(note_paths)
+
+    results["scan"] = _measure(lambda: VaultScanner(vault).scan(), repeat, notes)
+
+    parser = ObsidianParser()
+    results["parse_file"] = _measure(lambda: [parser.parse_file(path) for path in note_paths], repeat, notes)
+    parsed = [parser.parse_file(path) for path in note_paths]
+    bodies = [note.content for note in parsed]
+
+    note_fields = [{item.name: getattr(note, item.name) for item in fields(note)} for note in parsed]
+    results["note_model"] = _measure(lambda: [ObsidianNote(**values) for values in note_fields], repeat, notes)
+
+    converter = _quiet_converter(_config(vault, site))
+    converter._build_link_mapping(note_paths)
+    link_mapping = converter.link_mapping
+
+    passes = {
+        "convert_wikilinks": lambda body: parser.convert_wikilinks(body, link_mapping),
+        "convert_callouts": parser.convert_callouts,
+        "convert_code_blocks": parser.convert_code_blocks,
+        "convert_media_links": parser.convert_media_links,
+        "strip_tags": parser.strip_tags,
+        "transform": lambda body: parser.transform(body, link_mapping),
+    }
+    for pass_name, func in passes.items():
+        results[f"pass.{pass_name}"] = _measure(lambda func=func: [func(body) for body in bodies], repeat, notes)
+
+    results["build_link_mapping"] = _measure(lambda: converter._build_link_mapping(note_paths), repeat, notes)
+
+    if inventory.attachments:
+        static = site / "static"
+
+        def reset_static():
+            shutil.rmtree(static, ignore_errors=True)
+            converter.manifest.attachments = set()
+
+        attachments = len(inventory.attachments)
+        results["copy_attachments.cold"] = _measure(converter._copy_attachments, repeat, attachments, reset_static)
+        results["copy_attachments.warm"] = _measure(converter._copy_attachments, repeat, attachments)
+
+    def reset_site():
+        shutil.rmtree(site, ignore_errors=True)
+
+    config = _config(vault, site)
+    results["convert.full"] = _measure(lambda: _quiet_converter(config).convert(), repeat, notes, reset_site)
+
+    incremental = _config(vault, site, incremental=True)
+    results["convert.incremental"] = _measure(lambda: _quiet_converter(incremental).convert(), repeat, notes)
+
+    return results
+
+
+def run_suite(
+    notes: int = 1000,
+    paragraphs: int = 20,
+    link_density: float = 1.0,
+    tag_density: float = 1.0,
+    code_ratio: float = 0.1,
+    attachments: int = 100,
+    attachment_size: int = 64 * 1024,
+    corpus: Optional[Path] = None,
+    repeat: int = 3,
+) -> Dict:
+    """Run every benchmark and return the results in their JSON form."""
+    work_dir = Path(tempfile.mkdtemp(prefix="o2h-bench-"))
+    parameters = dict(
+        notes=notes,
+        paragraphs=paragraphs,
+        link_density=link_density,
+        tag_density=tag_density,
+        code_ratio=code_ratio,
+        attachments=attachments,
+        attachment_size=attachment_size,
+    )
+    benchmarks = {}
+
+    try:
+        vault = work_dir / "synthetic"
+        generate_vault(vault, **parameters)
+        for name, result in bench_vault("synthetic", vault, work_dir, repeat).items():
+            benchmarks[f"synthetic.{name}"] = result
+
+        if corpus is not None and corpus.is_dir():
+            for name, result in bench_vault("corpus", corpus, work_dir, repeat).items():
+                benchmarks[f"corpus.{name}"] = result
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": {**parameters, "corpus": str(corpus) if corpus else None, "repeat": repeat},
+        "benchmarks": {name: asdict(result) for name, result in benchmarks.items()},
+    }
+
+
+def find_regressions(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Return a line for every benchmark slower than the baseline by more than ``threshold``."""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous or not previous["best"]:
+            continue
+        ratio = result["best"] / previous["best"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {previous['best'] * 1000:.1f} ms -> {result['best'] * 1000:.1f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+@click.command()
+@click.option("--notes", type=int, default=1000, help="Number of synthetic notes")
+@click.option("--paragraphs", type=int, default=20, help="Paragraphs per note, sets the note size")
+@click.option("--link-density", type=float, default=1.0, help="Mean wikilinks per paragraph")
+@click.option("--tag-density", type=float, default=1.0, help="Mean tags per paragraph")
+@click.option("--code-ratio", type=float, default=0.1, help="Share of paragraphs followed by a code block")
+@click.option("--attachments", type=int, default=100, help="Number of synthetic attachments")
+@click.option("--attachment-size", type=int, default=64 * 1024, help="Size of each attachment in bytes")
+@click.option(
+    "--corpus",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Real-world vault to benchmark as well, such as the repository's content/ tree",
+)
+@click.option("--repeat", type=int, default=3, help="Runs per benchmark, the best one is reported")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("benchmark-results.json"),
+    help="Where to save the JSON results",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Earlier results to compare against, regressions make the command fail",
+)
+@click.option("--threshold", type=float, default=0.1, help="Slowdown tolerated before a regression is reported")
+def main(
+    notes: int,
+    paragraphs: int,
+    link_density: float,
+    tag_density: float,
+    code_ratio: float,
+    attachments: int,
+    attachment_size: int,
+    corpus: Optional[Path],
+    repeat: int,
+    output: Path,
+    baseline: Optional[Path],
+    threshold: float,
+):
+    """Benchmark the conversion pipeline stage by stage."""
+    console = Console()
+
+    results = run_suite(
+        notes=notes,
+        paragraphs=paragraphs,
+        link_density=link_density,
+        tag_density=tag_density,
+        code_ratio=code_ratio,
+        attachments=attachments,
+        attachment_size=attachment_size,
+        corpus=corpus,
+        repeat=repeat,
+    )
+
+    table = Table(title="Conversion benchmarks")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Best", style="green")
+    table.add_column("Mean", style="green")
+    table.add_column("Per item", style="green")
+
+    for name, result in results["benchmarks"].items():
+        table.add_row(
+            name,
+            f"{result['best'] * 1000:.1f} ms",
+            f"{result['mean'] * 1000:.1f} ms",
+            f"{BenchmarkResult(**result).per_item * 1e6:.0f} µs",
+        )
+
+    console.print(table)
+
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    console.print(f"[green]Results saved to {output}[/green]")
+
+    if baseline is not None:
+        regressions = find_regressions(results, json.loads(baseline.read_text(encoding="utf-8")), threshold)
+        for line in regressions:
+            console.print(f"[red]Regression: {line}[/red]")
+        if regressions:
+            sys.exit(1)
+        console.print("[green]No regressions against the baseline[/green]")
+
+
+if __name__ == "__main__":
+    main()
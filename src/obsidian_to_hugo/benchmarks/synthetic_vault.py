@@ -0,0 +1,105 @@
+"""Deterministic generator of synthetic Obsidian vaults for benchmarks."""
+
+import random
+from pathlib import Path
+from typing import List
+
+WORDS = (
+    "obsidian hugo note vault link graph theme content static archive draft "
+    "project idea meeting research summary chapter section paragraph review "
+    "design build release deploy server client cache index render page"
+).split()
+
+CALLOUT_TYPES = ["note", "warning", "tip", "info", "example"]
+
+ATTACHMENT_KINDS = [("images", "png"), ("documents", "pdf"), ("models", "glb")]
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + "."
+
+
+def _note_name(index: int) -> str:
+    return f"note-{index:05d}"
+
+
+def _note_path(index: int, folders: int) -> Path:
+    return Path(f"folder-{index % folders:03d}") / f"{_note_name(index)}.md"
+
+
+def _attachment_path(index: int) -> Path:
+    folder, extension = ATTACHMENT_KINDS[index % len(ATTACHMENT_KINDS)]
+    return Path("attachments") / folder / f"file-{index:05d}.{extension}"
+
+
+def _count(rng: random.Random, density: float) -> int:
+    """Return how many items a paragraph gets for a mean of ``density``."""
+    whole = int(density)
+    return whole + (1 if rng.random() < density - whole else 0)
+
+
+def generate_vault(
+    root: Path,
+    notes: int = 1000,
+    paragraphs: int = 20,
+    folders: int = 20,
+    seed: int = 0,
+    link_density: float = 1.0,
+    tag_density: float = 1.0,
+    code_ratio: float = 0.1,
+    attachments: int = 0,
+    attachment_size: int = 64 * 1024,
+) -> List[Path]:
+    """Write a synthetic vault to ``root`` and return the created note paths.
+
+    ``paragraphs`` sets the note size, ``link_density`` and ``tag_density``
+    the mean number of wikilinks and tags per paragraph, and ``code_ratio``
+    the share of paragraphs followed by a code block. ``attachments`` files
+    of ``attachment_size`` bytes are written and embedded from the notes.
+    The same arguments always produce byte-identical vaults.
+    """
+    rng = random.Random(seed)
+    created = []
+
+    for index in range(attachments):
+        path = root / _attachment_path(index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(rng.randbytes(attachment_size))
+
+    for index in range(notes):
+        lines = [
+            "---",
+            f"title: Synthetic {_note_name(index)}",
+            f"tags: [{rng.choice(WORDS)}, {rng.choice(WORDS)}]",
+            f"created: 2024-01-{index % 28 + 1:02d}",
+            "---",
+            "",
+            f"# {_sentence(rng, 4)}",
+            "",
+        ]
+
+        for paragraph in range(paragraphs):
+            text = [_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(2, 5))]
+            for _ in range(_count(rng, link_density)):
+                text.append(f"See [[{_note_name(rng.randrange(notes))}]].")
+            for _ in range(_count(rng, tag_density)):
+                text.append(f"#{rng.choice(WORDS)}")
+            lines.extend([f"## {_sentence(rng, 3)}" if paragraph % 5 == 0 else "", " ".join(text), ""])
+
+            roll = rng.random()
+            if roll < code_ratio:
+                lines.extend(["```python", f"print({rng.choice(WORDS)!r})  # [[not-a-link]] #not-a-tag", "```", ""])
+            elif roll < code_ratio + 0.05:
+                lines.extend([f"> [!{rng.choice(CALLOUT_TYPES)}] {_sentence(rng, 3)}", "> Body.", ""])
+            elif roll < code_ratio + 0.1:
+                if attachments:
+                    lines.extend([f"![[{_attachment_path(rng.randrange(attachments)).name}]]", ""])
+                else:
+                    lines.extend([f"![diagram](images/{rng.choice(WORDS)}.png)", ""])
+
+        path = root / _note_path(index, folders)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines), encoding="utf-8")
+        created.append(path)
+
+    return created
@@ -0,0 +1,112 @@
+"""Micro-benchmark of the fused content transform against the pass chain.
+
+Run with ``python -m obsidian_to_hugo.benchmarks.transforms --size-mb 4``.
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..utils.obsidian_parser import ObsidianParser
+from .synthetic_vault import CALLOUT_TYPES, WORDS
+
+
+def build_large_note(size_bytes: int, seed: int = 0) -> Tuple[str, Dict[str, str]]:
+    """Return a note of roughly ``size_bytes`` and a matching link mapping."""
+    rng = random.Random(seed)
+    link_mapping = {f"note-{i:05d}": f"folder/note-{i:05d}" for i in range(500)}
+    targets = list(link_mapping)
+    blocks = []
+    size = 0
+
+    while size < size_bytes:
+        paragraphs = []
+        for _ in range(rng.randint(3, 6)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(40, 120))]
+            words[rng.randrange(len(words))] = f"[[{rng.choice(targets)}]]"
+            words[rng.randrange(len(words))] = f"#{rng.choice(WORDS)}"
+            if rng.random() < 0.3:
+                words[rng.randrange(len(words))] = f"[{rng.choice(WORDS)}](page.md)"
+            paragraphs.append(" ".join(words))
+
+        roll = rng.random()
+        if roll < 0.25:
+            paragraphs.append(f"```python\nprint({rng.choice(WORDS)!r})  # comment\n```")
+        elif roll < 0.4:
+            paragraphs.append(f"> [!{rng.choice(CALLOUT_TYPES)}] {rng.choice(WORDS)}\n> Body.")
+        elif roll < 0.6:
+            paragraphs.append(f"![diagram](images/{rng.choice(WORDS)}.png)")
+
+        block = f"## {rng.choice(WORDS).title()}\n\n" + "\n\n".join(paragraphs) + "\n\n"
+        blocks.append(block)
+        size += len(block)
+
+    return "".join(blocks), link_mapping
+
+
+def _measure(func: Callable[[], str], repeat: int) -> Tuple[float, int]:
+    """Return the best wall time and the peak traced allocation of ``func``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def run_benchmark(size_mb: float, repeat: int = 5) -> Dict[str, Tuple[float, int]]:
+    """Time both transform implementations on the same large note."""
+    parser = ObsidianParser()
+    content, link_mapping = build_large_note(int(size_mb * 1024 * 1024))
+
+    chain = parser._transform_in_passes(content, link_mapping, True, True)
+    fused = parser.transform(content, link_mapping)
+    if chain != fused:
+        raise AssertionError("fused transform output differs from the pass chain")
+
+    return {
+        "passes": _measure(
+            lambda: parser._transform_in_passes(content, link_mapping, True, True), repeat
+        ),
+        "fused": _measure(lambda: parser.transform(content, link_mapping), repeat),
+    }
+
+
+@click.command()
+@click.option("--size-mb", type=float, default=4.0, help="Size of the generated note")
+@click.option("--repeat", type=int, default=5, help="Runs per implementation, the best is kept")
+def main(size_mb: float, repeat: int):
+    """Compare the fused transform with the sequential passes."""
+    results = run_benchmark(size_mb, repeat)
+    passes_time, passes_peak = results["passes"]
+
+    table = Table(title=f"Content transform, {size_mb:g} MB note")
+    table.add_column("Implementation", style="cyan")
+    table.add_column("Time", style="green")
+    table.add_column("Speedup", style="green")
+    table.add_column("Peak allocation", style="green")
+
+    for name, (seconds, peak) in results.items():
+        table.add_row(
+            name,
+            f"{seconds * 1000:.1f} ms",
+            f"{passes_time / seconds:.2f}x",
+            f"{peak / 1024 / 1024:.1f} MB ({peak / passes_peak:.0%})",
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,77 @@
-"""Command-line interface for Obsidian to Hugo converter."""
+"""Command-line interface for Obsidian to Hugo converter.
 
+Only click and the standard library are imported up front; every command
+imports what it needs when it runs, so ``--help`` and commands handed to a
+running daemon never load pydantic, PyYAML or watchdog.
+"""
+
+import importlib
+import os
+import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from .core.models import ConversionConfig
-from .converters.hugo_converter import HugoConverter
-from .watchers.file_watcher import FileWatcher
+from .core.formats import FRONT_MATTER_FORMATS
+from .daemon.client import SOCKET_ENV, default_socket_path, try_request
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .core.models import ConversionConfig
+    from .core.stats import ConversionStats
+
+# Number of files listed in the slowest files table
+SLOWEST_FILES_SHOWN = 5
+# Number of unresolved and ambiguous links listed after a conversion
+LINK_PROBLEMS_SHOWN = 20
+
+
+class LazyGroup(click.Group):
+    """Group whose heavy subcommands are imported when they are invoked.
+    
+    ``lazy_commands`` maps a command name to ``(module:attribute, short help)``;
+    the short help is shown by ``--help`` without importing the module.
+    """
+    
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, tuple]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name][0].split(':')
+            self.add_command(getattr(importlib.import_module(module_name), attribute), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+        
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        'bench': ('obsidian_to_hugo.benchmarks.suite:main', 'Benchmark every stage of the conversion pipeline.'),
+    },
+)
 @click.version_option(version="0.1.0")
 def cli():
     """Obsidian to Hugo converter with PaperMod theme support."""
@@ -56,6 +113,12 @@ def cli():
     default='hugo-papermod',
     help='Hugo theme name'
 )
+@click.option(
+    '--front-matter-format',
+    type=click.Choice(FRONT_MATTER_FORMATS),
+    default='yaml',
+    help='Front matter format of the generated pages (TOML and JSON parse faster in Hugo)'
+)
 @click.option(
     '--include-patterns',
     multiple=True,
@@ -89,6 +152,22 @@ def cli():
     is_flag=True,
     help='Disable attachments copying'
 )
+@click.option(
+    '--attachment-mode',
+    type=click.Choice(['auto', 'copy', 'hardlink', 'reflink']),
+    default='auto',
+    help='How attachments are placed in the static directory'
+)
+@click.option(
+    '--attachment-checksum',
+    is_flag=True,
+    help='Compare attachment contents when only the modification time differs'
+)
+@click.option(
+    '--referenced-attachments-only',
+    is_flag=True,
+    help='Only publish attachments embedded or linked by converted notes'
+)
 @click.option(
     '--no-toc',
     is_flag=True,
@@ -105,59 +184,216 @@ def cli():
     is_flag=True,
     help='Do not preserve original front matter'
 )
+@click.option(
+    '--no-link-graph',
+    is_flag=True,
+    help='Do not write the links and backlinks of every note to data/graph.json'
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Only convert notes changed since the previous run'
+)
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=0),
+    default=1,
+    help='Number of worker processes (0 = one per CPU core)'
+)
+@click.option(
+    '--streaming',
+    is_flag=True,
+    help='Walk the vault twice instead of keeping every note in memory (implies --jobs 1)'
+)
+@click.option(
+    '--pipeline',
+    is_flag=True,
+    help='Overlap reading, transforming and writing notes in threads (--jobs sets the transform threads)'
+)
+@click.option(
+    '--prefetch',
+    type=click.IntRange(min=1),
+    default=32,
+    help='Number of notes the pipeline reads ahead of the writer'
+)
+@click.option(
+    '--state-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help='Directory for the build manifest (default: .obsidian-to-hugo next to content)'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help='Directory for the parse cache (default: the user cache directory)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Parse every note from scratch'
+)
+@click.option(
+    '--file',
+    'files',
+    multiple=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Only convert this note and the notes linking to it (can be specified multiple times)'
+)
+@click.option(
+    '--no-daemon',
+    is_flag=True,
+    help='Convert in this process even when a daemon is running'
+)
+@click.option(
+    '--profile',
+    is_flag=False,
+    flag_value='',
+    default=None,
+    metavar='[PREFIX]',
+    help='Write a cProfile dump and a Chrome trace to PREFIX.pstats and PREFIX.trace.json '
+         '(default prefix: profile in the state directory)'
+)
 def convert(
     obsidian_vault: Path,
     hugo_content: Path,
     hugo_static: Path,
     hugo_archetypes: Path,
     theme: str,
+    front_matter_format: str,
     include_patterns: tuple,
     exclude_patterns: tuple,
     attachment_extensions: tuple,
     no_wikilinks: bool,
     no_tags: bool,
     no_attachments: bool,
+    attachment_mode: str,
+    attachment_checksum: bool,
+    referenced_attachments_only: bool,
     no_toc: bool,
     toc_max_depth: int,
     no_front_matter: bool,
+    no_link_graph: bool,
+    incremental: bool,
+    jobs: int,
+    streaming: bool,
+    pipeline: bool,
+    prefetch: int,
+    state_dir: Optional[Path],
+    cache_dir: Optional[Path],
+    no_cache: bool,
+    files: tuple,
+    no_daemon: bool,
+    profile: Optional[str],
 ):
     """Convert Obsidian vault to Hugo format."""
+    from rich.console import Console
+    
     console = Console()
     
-    # Create configuration
-    config = ConversionConfig(
+    # Fields of the ConversionConfig, validated here or by the daemon
+    settings = dict(
         obsidian_vault_path=obsidian_vault,
         hugo_content_path=hugo_content,
         hugo_static_path=hugo_static,
         hugo_archetypes_path=hugo_archetypes,
         theme_name=theme,
+        front_matter_format=front_matter_format,
         preserve_front_matter=not no_front_matter,
         convert_wikilinks=not no_wikilinks,
         convert_tags=not no_tags,
         convert_attachments=not no_attachments,
         attachment_extensions=set(attachment_extensions),
+        attachment_mode=attachment_mode,
+        attachment_checksum=attachment_checksum,
+        publish_referenced_attachments=referenced_attachments_only,
         include_patterns=list(include_patterns),
         exclude_patterns=list(exclude_patterns),
         create_toc=not no_toc,
         toc_max_depth=toc_max_depth,
+        link_graph=not no_link_graph,
+        incremental=incremental,
+        jobs=jobs,
+        streaming=streaming,
+        pipeline=pipeline,
+        pipeline_prefetch=prefetch,
+        state_dir=state_dir,
+        parse_cache=not no_cache,
+        cache_dir=cache_dir,
     )
     
     # Display configuration
-    _display_config(console, config)
+    _display_config(console, settings)
+    
+    # Notes named relative to the vault the way the converter sees them
+    note_paths = [
+        obsidian_vault / os.path.relpath(file_path.resolve(), obsidian_vault.resolve())
+        for file_path in files
+    ]
     
     # Perform conversion
     try:
-        converter = HugoConverter(config)
-        stats = converter.convert()
+        # A running daemon has the vault indexed already; profiles are local
+        result = None
+        if not no_daemon and profile is None:
+            args = {'config': _json_settings(settings), 'files': [str(path) for path in note_paths]}
+            result = try_request('convert-file' if note_paths else 'convert', args)
+        
+        if result is not None:
+            from .core.stats import ConversionStats
+            
+            console.print(result['log'], end='', markup=False, highlight=False)
+            stats = ConversionStats.from_dict(result['stats'])
+        else:
+            from .core.models import ConversionConfig
+            
+            config = ConversionConfig(**settings)
+            if profile is None:
+                stats = _run_conversion(config, note_paths)
+            else:
+                from .utils.profiling import profile_run
+                
+                prefix = Path(profile) if profile else config.build_state_path / "profile"
+                with profile_run(prefix) as (pstats_path, trace_path):
+                    stats = _run_conversion(config, note_paths)
         
         # Display results
         _display_results(console, stats)
         
+        if profile is not None:
+            console.print(f"[cyan]Profile saved to {pstats_path} and {trace_path}[/cyan]")
+        
     except Exception as e:
         console.print(f"[red]Conversion failed: {e}[/red]")
         sys.exit(1)
 
 
+def _json_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Return conversion settings in the JSON form sent to the daemon."""
+    data: Dict[str, Any] = {}
+    for name, value in settings.items():
+        if isinstance(value, Path):
+            data[name] = str(value)
+        elif isinstance(value, (set, frozenset)):
+            data[name] = sorted(value)
+        else:
+            data[name] = value
+    return data
+
+
+def _run_conversion(config: "ConversionConfig", note_paths: List[Path]) -> "ConversionStats":
+    """Convert the whole vault, or only the given notes and their referrers."""
+    from .converters.hugo_converter import HugoConverter
+    
+    converter = HugoConverter(config)
+    if not note_paths:
+        return converter.convert()
+    
+    converter.prepare()
+    return converter.update_files(changed=note_paths)
+
+
 @cli.command()
 @click.option(
     '--obsidian-vault',
@@ -193,6 +429,12 @@ def convert(
     default='hugo-papermod',
     help='Hugo theme name'
 )
+@click.option(
+    '--front-matter-format',
+    type=click.Choice(FRONT_MATTER_FORMATS),
+    default='yaml',
+    help='Front matter format of the generated pages (TOML and JSON parse faster in Hugo)'
+)
 @click.option(
     '--include-patterns',
     multiple=True,
@@ -205,16 +447,36 @@ def convert(
     default=[],
     help='File patterns to exclude (can be specified multiple times)'
 )
+@click.option(
+    '--quiet-period',
+    type=click.FloatRange(min=0),
+    default=0.5,
+    help='Seconds without file events before a batch of changes is converted'
+)
+@click.option(
+    '--max-latency',
+    type=click.FloatRange(min=0),
+    default=5.0,
+    help='Longest time in seconds a change waits while events keep arriving'
+)
 def watch(
     obsidian_vault: Path,
     hugo_content: Path,
     hugo_static: Path,
     hugo_archetypes: Path,
     theme: str,
+    front_matter_format: str,
     include_patterns: tuple,
     exclude_patterns: tuple,
+    quiet_period: float,
+    max_latency: float,
 ):
     """Watch Obsidian vault for changes and automatically convert to Hugo."""
+    from rich.console import Console
+    
+    from .core.models import ConversionConfig
+    from .watchers.file_watcher import FileWatcher
+    
     console = Console()
     
     # Create configuration
@@ -224,8 +486,11 @@ def watch(
         hugo_static_path=hugo_static,
         hugo_archetypes_path=hugo_archetypes,
         theme_name=theme,
+        front_matter_format=front_matter_format,
         include_patterns=list(include_patterns),
         exclude_patterns=list(exclude_patterns),
+        watch_quiet_period=quiet_period,
+        watch_max_latency=max_latency,
     )
     
     # Start file watcher
@@ -247,45 +512,84 @@ def watch(
     required=True,
     help='Path to Obsidian vault directory'
 )
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help='Directory for the parse cache (default: the user cache directory)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Parse every note from scratch'
+)
+@click.option(
+    '--metadata-only',
+    is_flag=True,
+    help='Only read front matter: titles, aliases and front matter tags, no links'
+)
+@click.option(
+    '--no-daemon',
+    is_flag=True,
+    help='Analyze in this process even when a daemon is running'
+)
 def analyze(
     obsidian_vault: Path,
+    cache_dir: Optional[Path],
+    no_cache: bool,
+    metadata_only: bool,
+    no_daemon: bool,
 ):
     """Analyze Obsidian vault structure and content."""
+    from rich.console import Console
+    from rich.table import Table
+    
     console = Console()
     
     try:
-        from .utils.obsidian_parser import ObsidianParser
-        
-        parser = ObsidianParser()
+        result = None
+        if not no_daemon:
+            result = try_request('analyze', {
+                'vault': str(obsidian_vault),
+                'cache_dir': str(cache_dir) if cache_dir else None,
+                'no_cache': no_cache,
+                'metadata_only': metadata_only,
+            })
         
-        # Find all markdown files
-        md_files = list(obsidian_vault.rglob('*.md'))
+        if result is not None:
+            from .utils.vault_analysis import VaultAnalysis
+            
+            analysis = VaultAnalysis.from_dict(result['analysis'])
+        else:
+            from .utils.obsidian_parser import ObsidianParser
+            from .utils.parse_cache import ParseCache, default_cache_dir
+            from .utils.vault_analysis import analyze_vault
+            
+            cache = None if no_cache else ParseCache((cache_dir or default_cache_dir()) / "parse")
+            # Finds notes and attachments in one walk
+            analysis = analyze_vault(obsidian_vault, ObsidianParser(cache=cache), metadata_only=metadata_only)
         
-        if not md_files:
+        if not analysis.total_files:
             console.print("[yellow]No markdown files found in the vault[/yellow]")
             return
         
-        # Analyze files
-        total_tags = set()
-        total_links = set()
-        total_files = len(md_files)
+        for file_path, error in analysis.errors:
+            console.print(f"[red]Error analyzing {file_path}: {error}[/red]")
         
-        for file_path in md_files:
-            try:
-                note = parser.parse_file(file_path)
-                total_tags.update(note.tags)
-                total_links.update(note.links)
-            except Exception as e:
-                console.print(f"[red]Error analyzing {file_path}: {e}[/red]")
+        total_tags = analysis.tags
+        total_links = analysis.links
         
         # Display analysis results
         analysis_table = Table(title="Obsidian Vault Analysis")
         analysis_table.add_column("Metric", style="cyan")
         analysis_table.add_column("Value", style="green")
         
-        analysis_table.add_row("Total Files", str(total_files))
+        analysis_table.add_row("Total Files", str(analysis.total_files))
+        analysis_table.add_row("Attachments", str(analysis.attachments))
         analysis_table.add_row("Unique Tags", str(len(total_tags)))
-        analysis_table.add_row("Unique Links", str(len(total_links)))
+        analysis_table.add_row("Aliases", str(analysis.aliases))
+        if not metadata_only:
+            analysis_table.add_row("Unique Links", str(len(total_links)))
         analysis_table.add_row("Vault Path", str(obsidian_vault))
         
         console.print(analysis_table)
@@ -301,8 +605,76 @@ def analyze(
         sys.exit(1)
 
 
-def _display_config(console: Console, config: ConversionConfig):
+@cli.command()
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f'Control socket path (default: ${SOCKET_ENV} or the user runtime directory)'
+)
+def serve(socket_path: Optional[Path]):
+    """Run a daemon that keeps vaults indexed for convert and analyze."""
+    from rich.console import Console
+    
+    console = Console()
+    
+    from .daemon.server import ConversionDaemon
+    
+    daemon = ConversionDaemon(socket_path)
+    # Stop cleanly, removing the socket, on kill as on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        daemon.server = daemon.bind()
+        console.print(f"[green]Daemon listening on {daemon.socket_path}. Press Ctrl+C to stop[/green]")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Daemon stopped[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Daemon failed: {e}[/red]")
+        sys.exit(1)
+
+
+@cli.command()
+def stats():
+    """Show the state of the running daemon."""
+    from rich.console import Console
+    from rich.table import Table
+    
+    console = Console()
+    
+    from .daemon.client import CONNECT_TIMEOUT, DaemonError
+    
+    try:
+        result = try_request('stats', timeout=CONNECT_TIMEOUT)
+    except DaemonError as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
+    if result is None:
+        console.print(f"[yellow]No daemon is listening on {default_socket_path()}[/yellow]")
+        sys.exit(1)
+    
+    stats_table = Table(title="Daemon")
+    stats_table.add_column("Property", style="cyan")
+    stats_table.add_column("Value", style="green")
+    
+    stats_table.add_row("PID", str(result['pid']))
+    stats_table.add_row("Socket", result['socket'])
+    stats_table.add_row("Uptime", f"{result['uptime']:.0f}s")
+    stats_table.add_row("Requests", str(result['requests']))
+    for vault in result['vaults']:
+        stats_table.add_row(
+            "Vault", f"{vault['vault']} ({vault['notes']} notes, {vault['manifest_entries']} built)"
+        )
+    
+    console.print(stats_table)
+
+
+def _display_config(console: "Console", settings: Dict[str, Any]):
     """Display conversion configuration."""
+    from rich.table import Table
+    
+    config = SimpleNamespace(**settings)
     config_table = Table(title="Conversion Configuration")
     config_table.add_column("Setting", style="cyan")
     config_table.add_column("Value", style="green")
@@ -312,19 +684,34 @@ def _display_config(console: Console, config: ConversionConfig):
     config_table.add_row("Hugo Static", str(config.hugo_static_path))
     config_table.add_row("Hugo Archetypes", str(config.hugo_archetypes_path))
     config_table.add_row("Theme", config.theme_name)
+    config_table.add_row("Front Matter", config.front_matter_format)
     config_table.add_row("Include Patterns", ", ".join(config.include_patterns))
     config_table.add_row("Exclude Patterns", ", ".join(config.exclude_patterns) or "None")
     config_table.add_row("Convert Wikilinks", str(config.convert_wikilinks))
     config_table.add_row("Convert Tags", str(config.convert_tags))
     config_table.add_row("Convert Attachments", str(config.convert_attachments))
+    config_table.add_row("Attachment Mode", config.attachment_mode)
+    config_table.add_row("Referenced Attachments Only", str(config.publish_referenced_attachments))
     config_table.add_row("Create TOC", str(config.create_toc))
+    # Where ConversionConfig.link_graph_path puts it
+    link_graph_path = Path(config.hugo_content_path).parent / "data" / "graph.json"
+    config_table.add_row("Link Graph", str(link_graph_path) if config.link_graph else "False")
     config_table.add_row("TOC Max Depth", str(config.toc_max_depth))
+    config_table.add_row("Incremental", str(config.incremental))
+    config_table.add_row("Jobs", str(config.jobs or "auto"))
+    config_table.add_row("Streaming", str(config.streaming))
+    config_table.add_row("Pipeline", str(config.pipeline))
     
     console.print(config_table)
 
 
-def _display_results(console: Console, stats):
+def _display_results(console: "Console", stats: "ConversionStats"):
     """Display conversion results."""
+    from rich.markup import escape
+    from rich.table import Table
+    
+    from .core.stats import format_bytes
+    
     results_table = Table(title="Conversion Results")
     results_table.add_column("Metric", style="cyan")
     results_table.add_column("Value", style="green")
@@ -334,12 +721,61 @@ def _display_results(console: Console, stats):
     results_table.add_row("Converted Files", str(stats.converted_files))
     results_table.add_row("Skipped Files", str(stats.skipped_files))
     results_table.add_row("Error Files", str(stats.error_files))
+    results_table.add_row("Removed Files", str(stats.removed_files))
+    results_table.add_row("Unchanged Outputs", str(stats.unchanged_outputs))
     results_table.add_row("Attachments Copied", str(stats.attachments_copied))
+    results_table.add_row("Attachments Unchanged", str(stats.attachments_skipped))
+    results_table.add_row("Attachments Removed", str(stats.attachments_removed))
+    results_table.add_row("Bytes Copied", format_bytes(stats.bytes_copied))
+    results_table.add_row("Bytes Skipped", format_bytes(stats.bytes_skipped))
     results_table.add_row("Links Converted", str(stats.links_converted))
+    results_table.add_row("Unresolved Links", str(len(stats.unresolved_links)))
+    results_table.add_row("Ambiguous Links", str(len(stats.ambiguous_links)))
     results_table.add_row("Tags Processed", str(stats.tags_processed))
     
     console.print(results_table)
     
+    if stats.stage_times:
+        stages_table = Table(title="Stage Timings")
+        stages_table.add_column("Stage", style="cyan")
+        stages_table.add_column("Time", style="green")
+        stages_table.add_column("Share", style="green")
+        
+        # Worker processes add up their stage times, which can exceed the
+        # wall-clock processing time, so shares are of the stage total
+        total = sum(stats.stage_times.values())
+        for stage, seconds in stats.stage_times.items():
+            share = seconds / total if total else 0.0
+            stages_table.add_row(stage, f"{seconds:.3f}s", f"{share:.0%}")
+        
+        console.print(stages_table)
+    
+    slowest = stats.slowest(SLOWEST_FILES_SHOWN)
+    if slowest:
+        slowest_table = Table(title="Slowest Files")
+        slowest_table.add_column("File", style="cyan")
+        slowest_table.add_column("Time", style="green")
+        
+        for seconds, file_path in slowest:
+            slowest_table.add_row(file_path, f"{seconds * 1000:.1f} ms")
+        
+        console.print(slowest_table)
+    
+    problems = [("unresolved", note, target) for note, target in stats.unresolved_links]
+    problems += [("ambiguous", note, target) for note, target in stats.ambiguous_links]
+    if problems:
+        links_table = Table(title="Link Problems")
+        links_table.add_column("Note", style="cyan")
+        links_table.add_column("Link", style="yellow")
+        links_table.add_column("Problem", style="red")
+        
+        for problem, note, target in problems[:LINK_PROBLEMS_SHOWN]:
+            links_table.add_row(escape(note), escape(f"[[{target}]]"), problem)
+        
+        console.print(links_table)
+        if len(problems) > LINK_PROBLEMS_SHOWN:
+            console.print(f"[yellow]... and {len(problems) - LINK_PROBLEMS_SHOWN} more link problems[/yellow]")
+    
     if stats.error_files > 0:
         console.print("[yellow]Some files had errors during conversion[/yellow]")
     else:
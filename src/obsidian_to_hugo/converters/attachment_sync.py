@@ -0,0 +1,205 @@
+"""Incremental synchronisation of vault attachments to the Hugo static directory."""
+
+import errno
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from ..core.manifest import hash_file
+from ..utils.vault_scanner import VaultFile
+
+# ioctl request cloning one file into another (Linux, btrfs/XFS/bcachefs)
+FICLONE = 0x40049409
+
+ATTACHMENT_MODES = ("auto", "copy", "hardlink", "reflink")
+
+# Errors meaning "this filesystem cannot do it", the next method is tried
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.EMLINK,
+}
+
+
+@dataclass
+class SyncResult:
+    """What a synchronisation run did."""
+
+    copied: int = 0
+    skipped: int = 0
+    removed: int = 0
+    bytes_copied: int = 0
+    bytes_skipped: int = 0
+
+
+class AttachmentSync:
+    """Mirrors attachments into a target directory, touching only what changed.
+
+    A target is up to date when its size and modification time match the
+    source, or when it is a hard link to the source. With ``checksum`` set,
+    files of equal size but different mtime are compared by content before
+    being copied again. New copies are written next to the target and moved
+    into place, so a target hard-linked to its source is never written
+    through.
+    """
+
+    def __init__(
+        self,
+        source_root: Path,
+        target_root: Path,
+        mode: str = "auto",
+        checksum: bool = False,
+    ):
+        if mode not in ATTACHMENT_MODES:
+            raise ValueError(f"Unknown attachment mode: {mode}")
+
+        self.source_root = source_root
+        self.target_root = target_root
+        self.mode = mode
+        self.checksum = checksum
+        self._can_hardlink = mode == "hardlink"
+        self._can_reflink = mode in ("auto", "reflink") and fcntl is not None
+        self._can_copy_range = mode in ("auto", "reflink") and hasattr(os, "copy_file_range")
+
+    def sync(
+        self,
+        sources: Iterable[Union[VaultFile, Path]],
+        previous: Iterable[str] = (),
+    ) -> Tuple[SyncResult, Set[str]]:
+        """Bring every source up to date and delete targets no longer synced.
+
+        Sources from a vault scan carry their stat data, plain paths are
+        stat-ed here.
+
+        ``previous`` holds the relative paths written by the last run; of
+        the files in the target directory only those are ever deleted.
+        Returns the result and the relative paths now owned by the sync.
+        """
+        result = SyncResult()
+        synced = set()
+
+        for item in sources:
+            source = item if isinstance(item, VaultFile) else VaultFile.from_path(item, self.source_root)
+            target_path = self.target_root / source.relative_path
+            synced.add(source.relative_path)
+
+            if self._is_up_to_date(source, target_path):
+                result.skipped += 1
+                result.bytes_skipped += source.size
+                continue
+
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._transfer(source.path, target_path)
+            result.copied += 1
+            result.bytes_copied += source.size
+
+        for relative_path in set(previous) - synced:
+            target_path = self.target_root / relative_path
+            try:
+                target_path.unlink()
+            except FileNotFoundError:
+                continue
+            result.removed += 1
+            self._remove_empty_parents(target_path.parent)
+
+        return result, synced
+
+    def _is_up_to_date(self, source: VaultFile, target_path: Path) -> bool:
+        """Check whether the target already holds the source's content."""
+        try:
+            target_stat = target_path.stat()
+        except OSError:
+            return False
+
+        if source.inode and (source.inode, source.device) == (target_stat.st_ino, target_stat.st_dev):
+            return True
+
+        if source.size != target_stat.st_size:
+            return False
+
+        if source.mtime_ns == target_stat.st_mtime_ns:
+            return True
+
+        if self.checksum and hash_file(source.path) == hash_file(target_path):
+            # Same content, record the source mtime so the next check is cheap
+            os.utime(target_path, ns=(target_stat.st_atime_ns, source.mtime_ns))
+            return True
+
+        return False
+
+    def _transfer(self, source_path: Path, target_path: Path):
+        """Place the source's content at ``target_path`` atomically."""
+        tmp_path = target_path.with_name(f".{target_path.name}.tmp")
+
+        try:
+            if not (self._can_hardlink and self._hardlink(source_path, tmp_path)):
+                self._copy(source_path, tmp_path)
+                shutil.copystat(source_path, tmp_path)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _hardlink(self, source_path: Path, tmp_path: Path) -> bool:
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(source_path, tmp_path)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            # Different device or no link support, copy from now on
+            self._can_hardlink = False
+            return False
+        return True
+
+    def _copy(self, source_path: Path, tmp_path: Path):
+        """Copy the bytes with the cheapest method the filesystem supports."""
+        with open(source_path, "rb") as source, open(tmp_path, "wb") as target:
+            if self._can_reflink:
+                try:
+                    fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+                    return
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    self._can_reflink = False
+
+            if self._can_copy_range:
+                try:
+                    self._copy_file_range(source.fileno(), target.fileno())
+                    return
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    self._can_copy_range = False
+                    source.seek(0)
+                    target.seek(0)
+                    target.truncate()
+
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+    @staticmethod
+    def _copy_file_range(source_fd: int, target_fd: int):
+        """Copy inside the kernel, which avoids moving data through user space."""
+        while os.copy_file_range(source_fd, target_fd, 1 << 30):
+            pass
+
+    def _remove_empty_parents(self, directory: Path):
+        """Delete directories emptied by removals, up to the target root."""
+        while directory != self.target_root and self.target_root in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
@@ -1,15 +1,50 @@
 """Converter for transforming Obsidian notes to Hugo format."""
 
-import shutil
+import json
+import os
+import posixpath
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+from urllib.parse import unquote
 
-import frontmatter
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..core.link_graph import LinkGraph
+from ..core.manifest import BuildManifest, ManifestEntry, hash_bytes
 from ..core.models import ConversionConfig, ConversionStats, HugoPost, ObsidianNote
+from ..utils.front_matter import read_front_matter, render_post
+from ..utils.fs import write_if_changed
+from ..utils.link_index import LinkIndex, LinkReferrers, NoteLinks, note_aliases
 from ..utils.obsidian_parser import ObsidianParser
+from ..utils.parse_cache import ParseCache
+from ..utils.path_matcher import PathMatcher
+from ..utils.profiling import trace_span
+from ..utils.vault_scanner import IGNORED_DIRECTORIES, VaultFile, VaultInventory, VaultScanner
+from .attachment_sync import AttachmentSync
+
+
+@dataclass(slots=True)
+class NoteSource:
+    """A note as read from the vault, before parsing."""
+    
+    path: Path
+    mtime_ns: int
+    size: int
+    content_hash: str
+    text: Optional[str]
+
+
+@dataclass(slots=True)
+class NoteOutput:
+    """The rendered Hugo page of a note, ready to be written."""
+    
+    key: str
+    file_path: Path
+    data: bytes
+    entry: ManifestEntry
 
 
 class HugoConverter:
@@ -17,27 +52,44 @@ class HugoConverter:
     
     def __init__(self, config: ConversionConfig):
         self.config = config
-        self.parser = ObsidianParser()
+        self.parser = ObsidianParser(
+            cache=ParseCache(config.parse_cache_path) if config.parse_cache else None
+        )
         self.console = Console()
-        self.link_mapping: Dict[str, str] = {}
+        self.link_mapping = LinkIndex()
+        self.link_graph: Optional[LinkGraph] = None
+        # Notes by the link targets they use, built on the first update
+        self.referrers: Optional[LinkReferrers] = None
+        self.manifest = BuildManifest(config.manifest_path)
+        self.inventory: Optional[VaultInventory] = None
+        # Manifest keys of the notes found by the last scan
+        self.note_keys: Set[str] = set()
+        self._matcher: Optional[PathMatcher] = None
+        self._prepared = False
         
     def convert(self) -> ConversionStats:
         """Convert all Obsidian files to Hugo format."""
         stats = ConversionStats()
+        start = time.perf_counter()
         
-        # Find all markdown files in Obsidian vault
-        obsidian_files = self._find_markdown_files()
-        stats.total_files = len(obsidian_files)
+        # Find all markdown files and build link mapping for wikilinks conversion
+        self.prepare(stats)
+        stats.total_files = len(self.note_keys)
+        
+        # Remove outputs whose source notes no longer exist
+        self._remove_orphaned_outputs(self.note_keys, stats)
         
         if stats.total_files == 0:
+            self._update_link_graph(stats)
+            self._save_manifest(stats)
             self.console.print("[yellow]No markdown files found in Obsidian vault[/yellow]")
+            stats.processing_time = time.perf_counter() - start
             return stats
         
         # Create Hugo content directory structure
         self._create_hugo_structure()
         
-        # Build link mapping for wikilinks conversion
-        self._build_link_mapping(obsidian_files)
+        fingerprint = self.config.fingerprint()
         
         # Convert files
         with Progress(
@@ -47,42 +99,442 @@ class HugoConverter:
         ) as progress:
             task = progress.add_task("Converting files...", total=stats.total_files)
             
-            for file_path in obsidian_files:
-                try:
-                    self._convert_single_file(file_path, stats)
-                    stats.converted_files += 1
-                except Exception as e:
-                    self.console.print(f"[red]Error converting {file_path}: {e}[/red]")
-                    stats.error_files += 1
-                
+            # Serial conversion handles each note as the walk reaches it,
+            # worker processes and the pipeline get the collected paths
+            jobs = 1 if self.config.streaming else self._worker_count()
+            pipeline = self.config.pipeline and not self.config.streaming
+            pending_files = []
+            for note in self._iter_notes():
+                if self.config.incremental and self._is_up_to_date(note.path, fingerprint, note):
+                    # The recorded output is still valid
+                    stats.skipped_files += 1
+                    progress.advance(task)
+                elif jobs > 1 or pipeline:
+                    pending_files.append(note.path)
+                else:
+                    self._convert_tracked_note(note.path, stats)
+                    progress.advance(task)
+            
+            if pipeline and pending_files:
+                self._convert_pipelined(
+                    pending_files, jobs, stats, lambda count: progress.advance(task, count)
+                )
+            elif len(pending_files) > 1:
+                self._convert_parallel(
+                    pending_files, jobs, stats, lambda count: progress.advance(task, count)
+                )
+            elif pending_files:
+                self._convert_tracked_note(pending_files[0], stats)
                 progress.advance(task)
         
         # Copy attachments
         if self.config.convert_attachments:
-            stats.attachments_copied = self._copy_attachments()
+            with stats.time_stage("attachments"):
+                self._copy_attachments(stats)
+        
+        self.link_graph = None
+        self._update_link_graph(stats)
+        self._save_manifest(stats)
         
+        stats.processing_time = time.perf_counter() - start
         return stats
     
-    def _find_markdown_files(self) -> List[Path]:
-        """Find all markdown files in the Obsidian vault."""
-        files = []
-        
-        for pattern in self.config.include_patterns:
-            files.extend(self.config.obsidian_vault_path.rglob(pattern))
-        
-        # Filter out excluded patterns
-        filtered_files = []
-        for file_path in files:
-            should_include = True
-            for pattern in self.config.exclude_patterns:
-                if file_path.match(pattern):
-                    should_include = False
+    def prepare(self, stats: Optional[ConversionStats] = None) -> List[Path]:
+        """Load the build manifest and index the vault's notes.
+        
+        Called by :meth:`convert`; long-running callers such as the file
+        watcher call it once and then use :meth:`update_files`. Returns the
+        notes found, except in streaming mode, where only the link index is
+        kept and :meth:`convert` walks the vault a second time.
+        """
+        if stats is None:
+            stats = ConversionStats()
+        
+        with stats.time_stage("manifest"):
+            self.manifest = BuildManifest.load(self.config.manifest_path)
+        self.referrers = None
+        
+        if self.config.streaming:
+            with stats.time_stage("link_map"):
+                self.inventory = self._index_vault()
+            self._prepared = True
+            return []
+        
+        with stats.time_stage("scan"):
+            self.inventory = self._scan_vault()
+        obsidian_files = self.inventory.note_paths
+        self.note_keys = {note.relative_path for note in self.inventory.notes}
+        
+        with stats.time_stage("link_map"):
+            self._build_link_mapping(obsidian_files)
+        self._prepared = True
+        
+        return obsidian_files
+    
+    def convert_file(self, file_path: Path) -> ConversionStats:
+        """Convert a single note and the notes whose links depend on it."""
+        return self.update_files(changed=[file_path])
+    
+    def remove_file(self, file_path: Path) -> ConversionStats:
+        """Remove the output of a deleted note and update the notes linking to it."""
+        return self.update_files(removed=[file_path])
+    
+    def move_file(self, src_path: Path, dest_path: Path) -> ConversionStats:
+        """Move the output of a renamed note and update the notes linking to it."""
+        changed = [dest_path] if self._is_note_path(dest_path) else []
+        return self.update_files(changed=changed, removed=[src_path])
+    
+    def update_files(
+        self,
+        changed: Iterable[Path] = (),
+        removed: Iterable[Path] = (),
+    ) -> ConversionStats:
+        """Apply a set of vault changes without converting the whole vault.
+        
+        Changed notes are converted, the outputs of removed notes deleted, and
+        every note whose wikilinks resolve to an added, moved or retitled note
+        is converted again so its links stay valid. Those notes are found
+        through :attr:`referrers`, so only notes that could link to a changed
+        name are checked. Changed or removed attachments, and notes embedding
+        different files, sync the attachments to the static directory.
+        """
+        stats = ConversionStats()
+        start = time.perf_counter()
+        
+        if not self._prepared:
+            self.prepare(stats)
+        # Names links may reach changed notes by, and URLs that went away
+        changed_names: Set[str] = set()
+        stale_urls: Set[str] = set()
+        changed_urls: Set[str] = set()
+        references_changed = False
+        attachments_changed = False
+        removed_keys: List[str] = []
+        
+        for removed_path in removed:
+            file_path = Path(removed_path)
+            if self._is_attachment_path(file_path):
+                attachments_changed = True
+                continue
+            
+            key = self._manifest_key(file_path)
+            removed_keys.append(key)
+            entry = self.manifest.remove(key)
+            if entry is not None:
+                references_changed = references_changed or bool(entry.attachments)
+                try:
+                    (self.config.hugo_content_path / entry.output_path).unlink()
+                    stats.removed_files += 1
+                except FileNotFoundError:
+                    pass
+            
+            names = self.link_mapping.lookup_names(key)
+            url = self.link_mapping.remove(key)
+            if url is not None:
+                changed_names.update(names)
+                stale_urls.add(url)
+        
+        changed_files: List[Path] = []
+        for changed_path in changed:
+            file_path = Path(changed_path)
+            if self._is_attachment_path(file_path):
+                attachments_changed = True
+                continue
+            if not file_path.is_file() or not self._is_note_path(file_path):
+                continue
+            
+            key = self._manifest_key(file_path)
+            names = self.link_mapping.lookup_names(key)
+            if self.link_mapping.add(key, self._hugo_url(file_path), self._note_aliases(file_path)):
+                # Aliases dropped and added both change what links resolve to
+                changed_names.update(names, self.link_mapping.lookup_names(key))
+            
+            changed_files.append(file_path)
+        
+        self._create_hugo_structure()
+        
+        previous_titles = {}
+        previous_attachments = {}
+        for file_path in dict.fromkeys(changed_files):
+            entry = self.manifest.get(self._manifest_key(file_path))
+            previous_titles[file_path] = entry.title if entry else None
+            previous_attachments[file_path] = entry.attachments if entry else []
+            self._convert_tracked_file(file_path, stats)
+        
+        for file_path, previous_title in previous_titles.items():
+            entry = self.manifest.get(self._manifest_key(file_path))
+            if entry is not None and previous_title not in (None, entry.title):
+                changed_urls.add(self._hugo_url(file_path))
+            if entry is not None and entry.attachments != previous_attachments[file_path]:
+                references_changed = True
+        
+        # Notes linking to something that appeared, vanished or was retitled
+        converted_files = list(previous_titles)
+        for file_path in self._find_referrers(changed_names, stale_urls, changed_urls):
+            if file_path not in previous_titles:
+                self._convert_tracked_file(file_path, stats)
+                converted_files.append(file_path)
+        
+        # Publish new, edited and newly embedded files, drop removed ones and,
+        # when only referenced files are published, ones no longer embedded.
+        # The sync skips unchanged files, so this costs a scan and a stat each
+        if self.config.convert_attachments and (references_changed or attachments_changed):
+            with stats.time_stage("scan"):
+                self.inventory = self._scan_vault()
+            with stats.time_stage("attachments"):
+                self._copy_attachments(stats)
+        
+        converted_keys = [self._manifest_key(file_path) for file_path in converted_files]
+        self._update_referrers(removed_keys, converted_keys)
+        self._update_link_graph(stats, removed_keys, converted_keys)
+        self._save_manifest(stats)
+        
+        stats.processing_time = time.perf_counter() - start
+        return stats
+    
+    def _convert_tracked_file(self, file_path: Path, stats: ConversionStats):
+        """Convert one file as part of an update, reporting errors."""
+        stats.total_files += 1
+        self._convert_tracked_note(file_path, stats)
+    
+    def _convert_tracked_note(self, file_path: Path, stats: ConversionStats):
+        """Convert one file, reporting errors."""
+        error = self._try_convert_file(file_path, stats)
+        if error:
+            self.console.print(f"[red]Error converting {file_path}: {error}[/red]")
+    
+    def _is_note_path(self, file_path: Path) -> bool:
+        """Check whether a single path is a note according to the patterns."""
+        try:
+            relative_path = file_path.relative_to(self.config.obsidian_vault_path)
+        except ValueError:
+            return False
+        
+        if IGNORED_DIRECTORIES.intersection(relative_path.parts[:-1]):
+            return False
+        
+        return self.matcher.matches(relative_path.as_posix())
+    
+    def _is_attachment_path(self, file_path: Path) -> bool:
+        """Check whether a single path is an attachment the sync would publish."""
+        try:
+            relative_path = file_path.relative_to(self.config.obsidian_vault_path)
+        except ValueError:
+            return False
+        
+        if IGNORED_DIRECTORIES.intersection(relative_path.parts[:-1]):
+            return False
+        
+        relative_posix = relative_path.as_posix()
+        if self.matcher.is_included(relative_posix) or self.matcher.is_excluded(relative_posix):
+            return False
+        
+        extension = file_path.suffix.lower().lstrip('.')
+        return bool(extension) and extension in {
+            allowed.lower().lstrip('.') for allowed in self.config.attachment_extensions
+        }
+    
+    def _hugo_url(self, file_path: Path) -> str:
+        """Return the link mapping value of a vault note."""
+        relative_path = file_path.relative_to(self.config.obsidian_vault_path)
+        return str(self._convert_to_hugo_path(relative_path))
+    
+    def _find_referrers(self, names: Set[str], stale_urls: Set[str], changed_urls: Set[str]) -> List[Path]:
+        """Return the notes whose recorded links now resolve differently or point at changed URLs.
+        
+        Only the notes filed under one of the names or URLs are checked.
+        """
+        if not names and not stale_urls and not changed_urls:
+            return []
+        
+        referrers = []
+        for key in sorted(self._link_referrers().find(names, stale_urls | changed_urls)):
+            entry = self.manifest.get(key)
+            if entry is None:
+                continue
+            links = self.link_mapping.for_note(key)
+            for link_target, resolved in entry.links.items():
+                if resolved in changed_urls or links.get(link_target) != resolved:
+                    referrers.append(self.config.obsidian_vault_path / key)
                     break
+        
+        return referrers
+    
+    def _link_referrers(self) -> LinkReferrers:
+        """Return the reverse link index, building it from the manifest on first use."""
+        if self.referrers is None:
+            self.referrers = LinkReferrers()
+            for key, entry in self.manifest.entries.items():
+                self.referrers.set_links(key, entry.links)
+        return self.referrers
+    
+    def _update_referrers(self, removed_keys: Iterable[str], converted_keys: Iterable[str]):
+        """Refile the links of the notes an update removed or converted."""
+        if self.referrers is None:
+            return
+        
+        for key in removed_keys:
+            self.referrers.remove(key)
+        for key in converted_keys:
+            entry = self.manifest.get(key)
+            if entry is None:
+                self.referrers.remove(key)
+            else:
+                self.referrers.set_links(key, entry.links)
+    
+    def _update_link_graph(
+        self,
+        stats: ConversionStats,
+        removed_keys: Iterable[str] = (),
+        converted_keys: Iterable[str] = (),
+    ):
+        """Bring the link graph up to date and write it to the Hugo data directory.
+        
+        The graph is built from the manifest on the first call; later calls
+        only replace the links of the given notes.
+        """
+        if not self.config.link_graph:
+            return
+        
+        with stats.time_stage("graph"):
+            if self.link_graph is None:
+                self.link_graph = LinkGraph()
+                converted_keys = list(self.manifest)
+            
+            for key in removed_keys:
+                self.link_graph.remove_node(key)
+            for key in converted_keys:
+                entry = self.manifest.get(key)
+                if entry is not None:
+                    self.link_graph.set_links(key, self._linked_keys(entry))
             
-            if should_include:
-                filtered_files.append(file_path)
+            titles = {key: entry.title for key, entry in self.manifest.entries.items()}
+            data = self.link_graph.to_data(self.link_mapping.notes(), titles)
+            try:
+                write_if_changed(
+                    self.config.link_graph_path, json.dumps(data, ensure_ascii=False).encode('utf-8')
+                )
+            except OSError as e:
+                self.console.print(f"[yellow]Could not write link graph: {e}[/yellow]")
+    
+    def _linked_keys(self, entry: ManifestEntry) -> Iterator[str]:
+        """Return the notes a recorded build links to."""
+        for url in entry.links.values():
+            key = self.link_mapping.key_for_url(url) if url is not None else None
+            if key is not None:
+                yield key
+    
+    def _worker_count(self) -> int:
+        """Return the number of worker processes to convert with."""
+        if self.config.jobs <= 0:
+            return os.cpu_count() or 1
+        return self.config.jobs
+    
+    def _try_convert_file(self, file_path: Path, stats: ConversionStats) -> Optional[str]:
+        """Convert a file, counting the outcome and returning the error message if any."""
+        start = time.perf_counter()
+        try:
+            self._convert_single_file(file_path, stats)
+            stats.converted_files += 1
+            return None
+        except Exception as e:
+            stats.error_files += 1
+            return str(e)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.record_file_time(str(file_path), elapsed)
+            trace_span(file_path.name, start, elapsed, category="file", path=str(file_path))
+    
+    def _convert_parallel(
+        self,
+        file_paths: List[Path],
+        jobs: int,
+        stats: ConversionStats,
+        on_progress: Callable[[int], None],
+    ):
+        """Convert files in a process pool and merge the workers' results."""
+        from .parallel import convert_in_pool
+        
+        result = convert_in_pool(self.config, self.link_mapping, file_paths, jobs, on_progress)
+        
+        stats.merge(result.stats)
+        for key, entry in result.manifest_entries.items():
+            self.manifest.set(key, entry)
+        for file_path, error in result.errors:
+            self.console.print(f"[red]Error converting {file_path}: {error}[/red]")
+    
+    def _convert_pipelined(
+        self,
+        file_paths: List[Path],
+        workers: int,
+        stats: ConversionStats,
+        on_progress: Callable[[int], None],
+    ):
+        """Convert files in the threaded read, transform and write pipeline."""
+        from .pipeline import convert_pipelined
+        
+        pipeline_stats, errors = convert_pipelined(
+            self, file_paths, workers, on_progress, prefetch=self.config.pipeline_prefetch
+        )
         
-        return filtered_files
+        stats.merge(pipeline_stats)
+        for file_path, error in errors:
+            self.console.print(f"[red]Error converting {file_path}: {error}[/red]")
+    
+    def _find_markdown_files(self) -> List[Path]:
+        """Find all markdown files in the Obsidian vault."""
+        return self._scan_vault().note_paths
+    
+    @property
+    def matcher(self) -> PathMatcher:
+        """Matcher compiled from the current include and exclude patterns."""
+        if (
+            self._matcher is None
+            or self._matcher.include_patterns != self.config.include_patterns
+            or self._matcher.exclude_patterns != self.config.exclude_patterns
+        ):
+            self._matcher = PathMatcher(self.config.include_patterns, self.config.exclude_patterns)
+        return self._matcher
+    
+    def _scanner(self) -> VaultScanner:
+        """Return a scanner for the vault with the current patterns."""
+        return VaultScanner(
+            self.config.obsidian_vault_path,
+            matcher=self.matcher,
+            attachment_extensions=self.config.attachment_extensions,
+        )
+    
+    def _scan_vault(self) -> VaultInventory:
+        """Walk the vault once for both notes and attachments."""
+        return self._scanner().scan()
+    
+    def _index_vault(self) -> VaultInventory:
+        """Walk the vault into the link index, keeping no per-note objects.
+        
+        Returns an inventory holding only the attachments.
+        """
+        inventory = VaultInventory()
+        scanner = self._scanner()
+        link_mapping = LinkIndex()
+        note_keys = set()
+        
+        for kind, vault_file in scanner.walk():
+            if kind == 'note':
+                note_keys.add(vault_file.relative_path)
+                self._index_note(link_mapping, vault_file.path, vault_file)
+            else:
+                inventory.attachments.append(vault_file)
+        
+        inventory.directories = scanner.directories_walked
+        self.link_mapping = link_mapping
+        self.note_keys = note_keys
+        return inventory
+    
+    def _iter_notes(self) -> Iterator[VaultFile]:
+        """Return the notes of the vault, walking it again in streaming mode."""
+        if not self.config.streaming:
+            return iter(self.inventory.notes)
+        return (vault_file for kind, vault_file in self._scanner().walk() if kind == 'note')
     
     def _create_hugo_structure(self):
         """Create Hugo content directory structure."""
@@ -91,13 +543,39 @@ class HugoConverter:
         self.config.hugo_archetypes_path.mkdir(parents=True, exist_ok=True)
     
     def _build_link_mapping(self, obsidian_files: List[Path]):
-        """Build mapping from Obsidian filenames to Hugo URLs."""
+        """Index the notes by path, name and alias for wikilink resolution."""
+        scanned = {note.path: note for note in self.inventory.notes} if self.inventory else {}
+        link_mapping = LinkIndex()
+        
         for file_path in obsidian_files:
-            if file_path.suffix == '.md':
-                # Convert filename to URL-friendly format
-                relative_path = file_path.relative_to(self.config.obsidian_vault_path)
-                hugo_path = self._convert_to_hugo_path(relative_path)
-                self.link_mapping[file_path.stem] = str(hugo_path)
+            self._index_note(link_mapping, file_path, scanned.get(file_path))
+        
+        self.link_mapping = link_mapping
+    
+    def _index_note(self, link_mapping: LinkIndex, file_path: Path, vault_file: Optional[VaultFile] = None):
+        """Add a note to a link index."""
+        if file_path.suffix == '.md':
+            link_mapping.add(
+                vault_file.relative_path if vault_file else self._manifest_key(file_path),
+                self._hugo_url(file_path),
+                self._note_aliases(file_path, vault_file),
+            )
+    
+    def _note_aliases(self, file_path: Path, vault_file: Optional[VaultFile] = None) -> List[str]:
+        """Return the aliases of a note, from the manifest if the note is unchanged."""
+        entry = self.manifest.get(self._manifest_key(file_path))
+        if (
+            entry is not None
+            and vault_file is not None
+            and (vault_file.size, vault_file.mtime_ns) == (entry.size, entry.mtime_ns)
+        ):
+            return entry.aliases
+        
+        try:
+            return note_aliases(read_front_matter(file_path))
+        except Exception:
+            # Reported when the note itself fails to convert
+            return []
     
     def _convert_to_hugo_path(self, relative_path: Path) -> Path:
         """Convert Obsidian path to Hugo path."""
@@ -112,62 +590,198 @@ class HugoConverter:
         else:
             return hugo_path
     
+    def _manifest_key(self, file_path: Path) -> str:
+        """Return the manifest key of a vault file."""
+        return file_path.relative_to(self.config.obsidian_vault_path).as_posix()
+    
+    def _is_up_to_date(
+        self, file_path: Path, fingerprint: str, vault_file: Optional[VaultFile] = None
+    ) -> bool:
+        """Check whether the recorded output of a file is still valid.
+        
+        ``vault_file`` carries the stat data of the vault scan, which saves
+        another stat call per note.
+        """
+        entry = self.manifest.get(self._manifest_key(file_path))
+        if entry is None or entry.config_fingerprint != fingerprint:
+            return False
+        
+        if not (self.config.hugo_content_path / entry.output_path).exists():
+            return False
+        
+        # A link target that now resolves differently changes the output
+        links = self.link_mapping.for_note(self._manifest_key(file_path))
+        for link_target, resolved in entry.links.items():
+            if links.get(link_target) != resolved:
+                return False
+        
+        if vault_file is None:
+            try:
+                vault_file = VaultFile.from_path(file_path, self.config.obsidian_vault_path)
+            except OSError:
+                return False
+        if vault_file.size != entry.size:
+            return False
+        if vault_file.mtime_ns == entry.mtime_ns:
+            return True
+        
+        # Touched but possibly not modified, fall back to the content hash
+        if hash_bytes(file_path.read_bytes()) != entry.content_hash:
+            return False
+        
+        entry.mtime_ns = vault_file.mtime_ns
+        return True
+    
+    def _remove_orphaned_outputs(self, current_keys: Set[str], stats: ConversionStats):
+        """Delete generated files whose source note is gone from the vault."""
+        for key in self.manifest:
+            if key in current_keys:
+                continue
+            
+            entry = self.manifest.remove(key)
+            output_file = self.config.hugo_content_path / entry.output_path
+            try:
+                output_file.unlink()
+                stats.removed_files += 1
+            except FileNotFoundError:
+                pass
+    
+    def _save_manifest(self, stats: ConversionStats):
+        """Persist the build manifest, warning instead of failing the run."""
+        try:
+            with stats.time_stage("manifest"):
+                self.manifest.save()
+        except OSError as e:
+            self.console.print(f"[yellow]Could not save build manifest: {e}[/yellow]")
+    
     def _convert_single_file(self, file_path: Path, stats: ConversionStats):
-        """Convert a single Obsidian file to Hugo format."""
+        """Convert a single Obsidian file to Hugo format.
+        
+        Each copy of the note's text is dropped as soon as the next one
+        exists, so peak memory stays at a few times the size of the note.
+        """
+        source = self._read_note(file_path, stats)
+        output = self._render_note(source, stats)
+        del source
+        self._write_output(output, stats)
+    
+    def _read_note(self, file_path: Path, stats: ConversionStats) -> NoteSource:
+        """Read and decode a note, remembering the stat data of the version read."""
+        # Stat before reading so a concurrent edit is picked up next run
+        with stats.time_stage("read"):
+            file_stat = file_path.stat()
+            raw_content = file_path.read_bytes()
+        content_hash = hash_bytes(raw_content)
+        
+        with stats.time_stage("parse"):
+            text = raw_content.decode('utf-8')
+            del raw_content
+        
+        return NoteSource(
+            path=file_path,
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+            content_hash=content_hash,
+            text=text,
+        )
+    
+    def _render_note(self, source: NoteSource, stats: ConversionStats) -> NoteOutput:
+        """Turn a read note into the bytes of its Hugo page and its build record.
+        
+        Takes the text out of ``source``. Only reads shared state, so notes
+        can be rendered by several threads at once.
+        """
+        file_path = source.path
+        
         # Parse Obsidian file
-        obsidian_note = self.parser.parse_file(file_path)
+        with stats.time_stage("parse"):
+            text, source.text = source.text, None
+            obsidian_note = self.parser.parse_content(text, file_path)
+            del text
         
         # Convert content
-        converted_content = self._convert_content(obsidian_note, stats)
+        key = self._manifest_key(file_path)
+        links = self.link_mapping.for_note(key)
+        converted_content = self._convert_content(obsidian_note, stats, links)
         
         # Create Hugo front matter
-        hugo_front_matter = self._create_hugo_front_matter(obsidian_note)
+        with stats.time_stage("front_matter"):
+            hugo_front_matter = self._create_hugo_front_matter(obsidian_note)
         
         # Determine Hugo file path
         relative_path = file_path.relative_to(self.config.obsidian_vault_path)
         hugo_path = self._convert_to_hugo_path(relative_path)
         hugo_file_path = self.config.hugo_content_path / hugo_path.with_suffix('.md')
         
+        # Build record for incremental runs, saved once the output is written
+        entry = ManifestEntry(
+            mtime_ns=source.mtime_ns,
+            size=source.size,
+            content_hash=source.content_hash,
+            config_fingerprint=self.config.fingerprint(),
+            output_path=hugo_file_path.relative_to(self.config.hugo_content_path).as_posix(),
+            title=str(obsidian_note.title),
+            links={link: links.get(link) for link in obsidian_note.links},
+            attachments=obsidian_note.attachments,
+            aliases=note_aliases(obsidian_note.front_matter),
+        )
+        title = obsidian_note.title
+        del obsidian_note
+        
         # Create Hugo post
         hugo_post = HugoPost(
             file_path=hugo_file_path,
-            title=obsidian_note.title,
+            title=title,
             content=converted_content,
             front_matter=hugo_front_matter,
             url=str(hugo_path),
             weight=0,
             draft=False
         )
+        del converted_content
         
-        # Write Hugo file
-        self._write_hugo_file(hugo_post)
+        with stats.time_stage("front_matter"):
+            data = self._render_hugo_file(hugo_post).encode('utf-8')
+            del hugo_post
+        
+        return NoteOutput(key=key, file_path=hugo_file_path, data=data, entry=entry)
+    
+    def _write_output(self, output: NoteOutput, stats: ConversionStats):
+        """Write a rendered page and record its build in the manifest."""
+        with stats.time_stage("write"):
+            if not write_if_changed(output.file_path, output.data):
+                stats.unchanged_outputs += 1
+        
+        self.manifest.set(output.key, output.entry)
     
-    def _convert_content(self, obsidian_note: ObsidianNote, stats: ConversionStats) -> str:
+    def _convert_content(
+        self, obsidian_note: ObsidianNote, stats: ConversionStats, links: Optional[NoteLinks] = None
+    ) -> str:
         """Convert Obsidian content to Hugo format."""
-        content = obsidian_note.content
+        if links is None:
+            links = self.link_mapping.for_note(None)
+        
+        # Wikilinks, callouts, code blocks, media links and tags in one scan
+        with stats.time_stage("transform"):
+            content = self.parser.transform(
+                obsidian_note.content,
+                links,
+                convert_wikilinks=self.config.convert_wikilinks,
+                convert_tags=self.config.convert_tags,
+            )
         
-        # Convert wikilinks
         if self.config.convert_wikilinks:
-            content = self.parser.convert_wikilinks(content, self.link_mapping)
             stats.links_converted += len(obsidian_note.links)
+            stats.unresolved_links.extend((links.source, target) for target in sorted(links.unresolved))
+            stats.ambiguous_links.extend((links.source, target) for target in sorted(links.ambiguous))
         
-        # Convert callouts
-        content = self.parser.convert_callouts(content)
-        
-        # Convert code blocks
-        content = self.parser.convert_code_blocks(content)
-        
-        # Convert media links (PDF, GLTF, images)
-        content = self.parser.convert_media_links(content)
-        
-        # Process tags
         if self.config.convert_tags:
-            content = self._process_tags(content, obsidian_note.tags)
             stats.tags_processed += len(obsidian_note.tags)
         
         # Create table of contents if requested
         if self.config.create_toc:
-            content = self._add_table_of_contents(content)
+            with stats.time_stage("toc"):
+                content = self._add_table_of_contents(content)
         
         return content
     
@@ -186,7 +800,8 @@ class HugoConverter:
         
         # Convert tags
         if obsidian_note.tags:
-            front_matter['tags'] = list(obsidian_note.tags)
+            # Sorted so the output does not depend on set iteration order
+            front_matter['tags'] = sorted(obsidian_note.tags, key=str)
         
         # Set theme-specific fields for PaperMod
         front_matter['showToc'] = self.config.create_toc
@@ -200,9 +815,7 @@ class HugoConverter:
     def _process_tags(self, content: str, tags: set) -> str:
         """Process tags in content."""
         # Remove #tag syntax from content as tags are now in front matter
-        import re
-        tag_pattern = re.compile(r'#([a-zA-Z0-9_-]+)')
-        return tag_pattern.sub('', content)
+        return self.parser.strip_tags(content)
     
     def _add_table_of_contents(self, content: str) -> str:
         """Add Hugo table of contents shortcode."""
@@ -211,40 +824,83 @@ class HugoConverter:
     
     def _write_hugo_file(self, hugo_post: HugoPost):
         """Write Hugo post to file."""
-        # Create directory if it doesn't exist
-        hugo_post.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_text(hugo_post.file_path, self._render_hugo_file(hugo_post))
+    
+    def _render_hugo_file(self, hugo_post: HugoPost) -> str:
+        """Serialize a Hugo post with its front matter."""
+        return render_post(hugo_post.front_matter, hugo_post.content, self.config.front_matter_format)
+    
+    def _write_text(self, file_path: Path, text: str) -> bool:
+        """Write a generated file unless it is unchanged, returning whether it was written."""
+        return write_if_changed(file_path, text.encode('utf-8'))
+    
+    def _copy_attachments(self, stats: Optional[ConversionStats] = None) -> int:
+        """Sync attachments from Obsidian to Hugo static directory.
+        
+        Unchanged attachments are skipped, and attachments copied by an
+        earlier run whose source is gone are deleted. Returns the number of
+        files copied.
+        """
+        sources = self._iter_attachments()
+        if self.config.publish_referenced_attachments:
+            sources = self._referenced_attachments(sources)
+        
+        sync = AttachmentSync(
+            self.config.obsidian_vault_path,
+            self.config.hugo_static_path,
+            mode=self.config.attachment_mode,
+            checksum=self.config.attachment_checksum,
+        )
+        result, synced = sync.sync(sources, self.manifest.attachments)
+        self.manifest.attachments = synced
         
-        # Create front matter string
-        try:
-            front_matter_str = frontmatter.dumps(
-                frontmatter.Post(hugo_post.content, **hugo_post.front_matter)
-            )
-        except AttributeError:
-            # Fallback for different frontmatter versions
-            import yaml
-            front_matter_str = "---\n"
-            front_matter_str += yaml.dump(hugo_post.front_matter, default_flow_style=False, allow_unicode=True)
-            front_matter_str += "---\n\n"
-            front_matter_str += hugo_post.content
-        
-        # Write file
-        hugo_post.file_path.write_text(front_matter_str, encoding='utf-8')
-    
-    def _copy_attachments(self) -> int:
-        """Copy attachments from Obsidian to Hugo static directory."""
-        copied_count = 0
-        
-        for file_path in self.config.obsidian_vault_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.config.attachment_extensions:
-                # Calculate relative path
-                relative_path = file_path.relative_to(self.config.obsidian_vault_path)
-                target_path = self.config.hugo_static_path / relative_path
-                
-                # Create target directory
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy file
-                shutil.copy2(file_path, target_path)
-                copied_count += 1
+        if stats is not None:
+            stats.attachments_copied += result.copied
+            stats.attachments_skipped += result.skipped
+            stats.attachments_removed += result.removed
+            stats.bytes_copied += result.bytes_copied
+            stats.bytes_skipped += result.bytes_skipped
         
-        return copied_count
\ No newline at end of file
+        return result.copied
+    
+    def _referenced_attachments(self, attachments: Iterable[VaultFile]) -> List[VaultFile]:
+        """Keep the attachments that a converted note embeds or links to.
+        
+        References are resolved like Obsidian does: relative to the note,
+        relative to the vault root, and finally by file name anywhere in the
+        vault, preferring the shortest path.
+        """
+        by_path: Dict[str, VaultFile] = {}
+        by_name: Dict[str, str] = {}
+        for attachment in attachments:
+            relative_path = attachment.relative_path
+            by_path[relative_path] = attachment
+            name = attachment.path.name.lower()
+            if name not in by_name or len(relative_path) < len(by_name[name]):
+                by_name[name] = relative_path
+        
+        referenced = set()
+        for key, entry in self.manifest.entries.items():
+            note_dir = posixpath.dirname(key)
+            for link in entry.attachments:
+                # Drop a link title, angle brackets and URL escapes
+                reference = unquote(link.split(' "', 1)[0].strip('<> ')).lstrip('/')
+                if not reference or '://' in reference:
+                    continue
+                
+                candidates = (
+                    posixpath.normpath(posixpath.join(note_dir, reference)),
+                    posixpath.normpath(reference),
+                    by_name.get(posixpath.basename(reference).lower()),
+                )
+                resolved = next((c for c in candidates if c in by_path), None)
+                if resolved is not None:
+                    referenced.add(resolved)
+        
+        return [by_path[relative_path] for relative_path in sorted(referenced)]
+    
+    def _iter_attachments(self) -> Iterator[VaultFile]:
+        """Yield the vault's attachment files found by the last scan."""
+        if self.inventory is None:
+            self.inventory = self._scan_vault()
+        return iter(self.inventory.attachments)
\ No newline at end of file
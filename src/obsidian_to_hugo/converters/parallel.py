@@ -0,0 +1,98 @@
+"""Process pool conversion of Obsidian notes."""
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.manifest import ManifestEntry
+from ..core.models import ConversionConfig, ConversionStats
+from ..utils.link_index import LinkIndex
+from .hugo_converter import HugoConverter
+
+# Upper bound for the number of files sent to a worker in one task
+MAX_CHUNK_SIZE = 64
+
+# Converter owned by the current worker process, set up once by _init_worker.
+# It has to be module state: the pool calls _convert_chunk by name in the
+# worker, so per-worker objects can only be reached through the module, and
+# each worker process has its own copy of it.
+_worker_converter: Optional[HugoConverter] = None
+
+
+@dataclass
+class PoolResult:
+    """Merged outcome of a process pool conversion."""
+
+    stats: ConversionStats = field(default_factory=ConversionStats)
+    errors: List[Tuple[Path, str]] = field(default_factory=list)
+    manifest_entries: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+
+def _init_worker(config: ConversionConfig, link_mapping: LinkIndex):
+    """Create the worker's converter.
+
+    The link mapping is handed over once per worker instead of once per task.
+    """
+    global _worker_converter
+    _worker_converter = HugoConverter(config)
+    _worker_converter.link_mapping = link_mapping
+
+
+def _convert_chunk(file_paths: List[Path]) -> PoolResult:
+    """Convert a chunk of files inside a worker process."""
+    converter = _worker_converter
+    result = PoolResult()
+
+    for file_path in file_paths:
+        error = converter._try_convert_file(file_path, result.stats)
+        if error:
+            result.errors.append((file_path, error))
+
+    # Hand the recorded builds back to the parent, which owns the manifest
+    result.manifest_entries = converter.manifest.entries
+    converter.manifest.entries = {}
+
+    return result
+
+
+def chunk_size(file_count: int, jobs: int) -> int:
+    """Return the task size that keeps every worker busy with a few tasks."""
+    return max(1, min(MAX_CHUNK_SIZE, math.ceil(file_count / (jobs * 4))))
+
+
+def convert_in_pool(
+    config: ConversionConfig,
+    link_mapping: LinkIndex,
+    file_paths: List[Path],
+    jobs: int,
+    on_progress: Callable[[int], None],
+) -> PoolResult:
+    """Convert files with a pool of worker processes.
+
+    Chunks are processed in order, so errors are reported in the same order
+    as in the serial path.
+    """
+    size = chunk_size(len(file_paths), jobs)
+    chunks = [file_paths[i:i + size] for i in range(0, len(file_paths), size)]
+    result = PoolResult()
+
+    # Forking a process that may run watcher or daemon threads can deadlock
+    # the child, so workers start from a clean server process where possible
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(config, link_mapping),
+    ) as executor:
+        for chunk, chunk_result in zip(chunks, executor.map(_convert_chunk, chunks), strict=True):
+            result.stats.merge(chunk_result.stats)
+            result.errors.extend(chunk_result.errors)
+            result.manifest_entries.update(chunk_result.manifest_entries)
+            on_progress(len(chunk))
+
+    return result
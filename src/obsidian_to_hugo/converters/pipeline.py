@@ -0,0 +1,183 @@
+"""Threaded conversion that overlaps reading, transforming and writing notes."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from ..core.models import ConversionStats
+from ..utils.profiling import trace_span
+from .hugo_converter import HugoConverter, NoteOutput, NoteSource
+
+# Number of notes read ahead of the writer by default
+DEFAULT_PREFETCH = 32
+# Upper bound for the number of outputs written in one batch
+WRITE_BATCH_SIZE = 16
+
+# Put in the queue by the reader once every note is submitted
+_DONE = object()
+
+
+@dataclass
+class NoteResult:
+    """Outcome of reading and rendering one note."""
+
+    path: Path
+    stats: ConversionStats = field(default_factory=ConversionStats)
+    output: Optional[NoteOutput] = None
+    error: Optional[str] = None
+    # Wall time spent on the note so far, the writer adds its own share
+    seconds: float = 0.0
+
+
+def _render(converter: HugoConverter, result: NoteResult, source: Optional[NoteSource]) -> NoteResult:
+    """Transform stage: render a note read by the reader, inside a worker thread."""
+    if source is None:
+        # Reading the note failed already
+        return result
+
+    start = time.perf_counter()
+    try:
+        result.output = converter._render_note(source, result.stats)
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        result.seconds += time.perf_counter() - start
+    return result
+
+
+def _read_ahead(
+    converter: HugoConverter,
+    file_paths: List[Path],
+    executor: ThreadPoolExecutor,
+    pending: "queue.Queue[object]",
+    stop: threading.Event,
+):
+    """Reader stage: read notes in order and hand them to the transform threads.
+
+    The queue of pending renders is bounded, so the reader blocks once it is
+    ``prefetch`` notes ahead of the writer.
+    """
+    try:
+        for file_path in file_paths:
+            if stop.is_set():
+                return
+
+            result = NoteResult(file_path)
+            source = None
+            start = time.perf_counter()
+            try:
+                source = converter._read_note(file_path, result.stats)
+            except Exception as e:
+                result.error = str(e)
+            result.seconds = time.perf_counter() - start
+
+            future = executor.submit(_render, converter, result, source)
+            del source
+            _put(pending, future, stop)
+    finally:
+        _put(pending, _DONE, stop)
+
+
+def _put(pending: "queue.Queue[object]", item: object, stop: threading.Event):
+    """Put an item in a bounded queue, giving up once the pipeline is stopped."""
+    while not stop.is_set():
+        try:
+            pending.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def convert_pipelined(
+    converter: HugoConverter,
+    file_paths: List[Path],
+    workers: int,
+    on_progress: Callable[[int], None],
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Tuple[ConversionStats, List[Tuple[Path, str]]]:
+    """Convert files with a reader thread, transform threads and a batching writer.
+
+    The calling thread is the writer. It takes the rendered notes in input
+    order, so the statistics, the manifest and the reported errors are the
+    same as in the serial path whatever order the threads finish in. Returns
+    the merged statistics and the errors by file.
+    """
+    stats = ConversionStats()
+    errors: List[Tuple[Path, str]] = []
+    pending: queue.Queue[object] = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="transform") as executor:
+        reader = threading.Thread(
+            target=_read_ahead,
+            args=(converter, file_paths, executor, pending, stop),
+            name="reader",
+            daemon=True,
+        )
+        reader.start()
+
+        try:
+            finished = False
+            while not finished:
+                item = pending.get()
+                if item is _DONE:
+                    break
+
+                # Take the notes queued behind it too, up to a full batch
+                batch = [item]
+                while len(batch) < WRITE_BATCH_SIZE:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        finished = True
+                        break
+                    batch.append(item)
+
+                _write_batch(converter, batch, stats, errors)
+                on_progress(len(batch))
+        finally:
+            stop.set()
+            reader.join()
+
+    return stats, errors
+
+
+def _write_batch(
+    converter: HugoConverter,
+    batch: List["Future[NoteResult]"],
+    stats: ConversionStats,
+    errors: List[Tuple[Path, str]],
+):
+    """Writer stage: write a batch of rendered notes in input order."""
+    for future in batch:
+        result = future.result()
+        if result.output is not None:
+            start = time.perf_counter()
+            try:
+                converter._write_output(result.output, result.stats)
+            except Exception as e:
+                result.error = str(e)
+            result.seconds += time.perf_counter() - start
+            result.output = None
+
+        if result.error is None:
+            result.stats.converted_files += 1
+        else:
+            result.stats.error_files += 1
+            errors.append((result.path, result.error))
+
+        stats.merge(result.stats)
+        stats.record_file_time(str(result.path), result.seconds)
+        trace_span(
+            result.path.name,
+            time.perf_counter() - result.seconds,
+            result.seconds,
+            category="file",
+            path=str(result.path),
+        )
@@ -0,0 +1,7 @@
+"""Names of the supported output formats.
+
+Kept free of the serializers so the command line can offer them as
+choices without importing PyYAML and toml.
+"""
+
+FRONT_MATTER_FORMATS = ('yaml', 'toml', 'json')
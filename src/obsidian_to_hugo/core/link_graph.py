@@ -0,0 +1,164 @@
+"""Forward and backlink graph of the vault's notes."""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+# Version of the graph.json layout written for Hugo templates
+GRAPH_VERSION = 1
+
+
+class LinkGraph:
+    """Directed graph of the links between notes.
+
+    Notes are nodes with integer IDs, named by their manifest key. Links are
+    kept in compressed sparse row form: the targets of node ``i`` are
+    ``targets[offsets[i]:offsets[i + 1]]``. Replacing the links of one note
+    stores a patch instead of shifting the arrays; :meth:`compact` folds the
+    patches back in, drops removed notes and renumbers the nodes by key.
+    Backlinks are derived from the forward links with a counting sort, so
+    building the whole graph costs O(notes + links).
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._offsets = array('I', [0])
+        self._targets = array('I')
+        # Links of nodes changed since the last compaction, by node ID
+        self._patched: Dict[int, array] = {}
+        # IDs of notes removed since the last compaction, by key
+        self._removed: Dict[str, int] = {}
+        self._back_offsets: Optional[array] = None
+        self._back_sources: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.ids
+
+    def add_node(self, key: str) -> int:
+        """Return the ID of a note, adding it without links if it is new.
+
+        A note removed since the last compaction gets its old ID back, so the
+        links other notes still have to it stay valid.
+        """
+        node = self.ids.get(key)
+        if node is None:
+            node = self._removed.pop(key, None)
+            if node is None:
+                node = len(self.keys)
+                self.keys.append(key)
+            self.ids[key] = node
+            self._patched[node] = array('I')
+            self._back_offsets = None
+        return node
+
+    def set_links(self, key: str, targets: Iterable[str]):
+        """Replace the links of a note; duplicates and self-links are dropped."""
+        source = self.add_node(key)
+        unique = dict.fromkeys(target for target in targets if target != key)
+        self._patched[source] = array('I', (self.add_node(target) for target in unique))
+        self._back_offsets = None
+
+    def remove_node(self, key: str):
+        """Remove a note and the links from and to it."""
+        node = self.ids.pop(key, None)
+        if node is None:
+            return
+        self._removed[key] = node
+        self._patched[node] = array('I')
+        self._back_offsets = None
+
+    def _row(self, node: int) -> array:
+        patched = self._patched.get(node)
+        if patched is not None:
+            return patched
+        if node + 1 >= len(self._offsets):
+            return array('I')
+        return self._targets[self._offsets[node]:self._offsets[node + 1]]
+
+    def compact(self):
+        """Fold patches into the arrays and renumber the live notes by key."""
+        if not self._patched and not self._removed:
+            return
+
+        live = sorted((key, node) for key, node in self.ids.items())
+        renumbered = array('l', [-1]) * len(self.keys)
+        for new_node, (_, old_node) in enumerate(live):
+            renumbered[old_node] = new_node
+
+        offsets = array('I', [0])
+        targets = array('I')
+        for _, old_node in live:
+            targets.extend(renumbered[target] for target in self._row(old_node) if renumbered[target] >= 0)
+            offsets.append(len(targets))
+
+        self.keys = [key for key, _ in live]
+        self.ids = {key: node for node, key in enumerate(self.keys)}
+        self._offsets = offsets
+        self._targets = targets
+        self._patched = {}
+        self._removed = {}
+        self._back_offsets = None
+
+    def _build_backlinks(self):
+        """Invert the forward links with a counting sort."""
+        self.compact()
+        counts = array('I', [0]) * (len(self.keys) + 1)
+        for target in self._targets:
+            counts[target + 1] += 1
+        for node in range(len(self.keys)):
+            counts[node + 1] += counts[node]
+
+        sources = array('I', [0]) * len(self._targets)
+        position = array('I', counts)
+        for source in range(len(self.keys)):
+            for index in range(self._offsets[source], self._offsets[source + 1]):
+                target = self._targets[index]
+                sources[position[target]] = source
+                position[target] += 1
+
+        self._back_offsets = counts
+        self._back_sources = sources
+
+    def links(self, key: str) -> List[str]:
+        """Return the notes a note links to, in the order they appear."""
+        node = self.ids.get(key)
+        if node is None:
+            return []
+        return [self.keys[target] for target in self._row(node) if self.keys[target] in self.ids]
+
+    def backlinks(self, key: str) -> List[str]:
+        """Return the notes linking to a note, sorted by key."""
+        if self._back_offsets is None:
+            self._build_backlinks()
+        node = self.ids.get(key)
+        if node is None:
+            return []
+        return [
+            self.keys[source]
+            for source in self._back_sources[self._back_offsets[node]:self._back_offsets[node + 1]]
+        ]
+
+    def to_data(self, urls: Dict[str, str], titles: Dict[str, str]) -> Dict[str, Any]:
+        """Return the graph as the ``data/graph.json`` document.
+
+        Nodes are listed by key and refer to each other by their position in
+        the list, so Hugo templates can follow ``links`` and ``backlinks``
+        with ``index``.
+        """
+        if self._back_offsets is None:
+            self._build_backlinks()
+
+        nodes = []
+        for node, key in enumerate(self.keys):
+            nodes.append({
+                'path': key,
+                'url': urls.get(key),
+                'title': titles.get(key, ''),
+                'links': self._targets[self._offsets[node]:self._offsets[node + 1]].tolist(),
+                'backlinks': self._back_sources[self._back_offsets[node]:self._back_offsets[node + 1]].tolist(),
+            })
+
+        return {'version': GRAPH_VERSION, 'nodes': nodes}
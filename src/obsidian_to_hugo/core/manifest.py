@@ -0,0 +1,109 @@
+"""Persistent build manifest for incremental conversion."""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from ..utils.fs import atomic_write_bytes
+
+MANIFEST_VERSION = 3
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the content hash used to detect changed sources."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the content hash of a file without reading it into memory at once."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Build record for a single converted note."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    config_fingerprint: str
+    output_path: str
+    title: str = ""
+    links: Dict[str, Optional[str]] = field(default_factory=dict)
+    attachments: List[str] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+
+
+class BuildManifest:
+    """Records what each source note was converted into.
+
+    Entries are keyed by the note path relative to the vault (POSIX form),
+    output paths are stored relative to the Hugo content directory.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, ManifestEntry] = {}
+        # Static files written by the attachment sync, relative to the static directory
+        self.attachments: Set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildManifest":
+        """Load a manifest, starting empty if it is missing or unreadable."""
+        manifest = cls(path)
+
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return manifest
+
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return manifest
+
+        for key, raw_entry in data.get('entries', {}).items():
+            try:
+                manifest.entries[key] = ManifestEntry(**raw_entry)
+            except TypeError:
+                # Entry written by an incompatible version, rebuild it
+                continue
+
+        manifest.attachments = set(data.get('attachments', []))
+
+        return manifest
+
+    def save(self):
+        """Write the manifest atomically."""
+        data = {
+            'version': MANIFEST_VERSION,
+            'entries': {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+            'attachments': sorted(self.attachments),
+        }
+
+        atomic_write_bytes(self.path, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def get(self, key: str) -> Optional[ManifestEntry]:
+        """Return the entry recorded for a source, if any."""
+        return self.entries.get(key)
+
+    def set(self, key: str, entry: ManifestEntry):
+        """Record the entry for a source."""
+        self.entries[key] = entry
+
+    def remove(self, key: str) -> Optional[ManifestEntry]:
+        """Forget a source and return its previous entry."""
+        return self.entries.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.entries))
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -1,33 +1,52 @@
 """Core data models for Obsidian to Hugo converter."""
 
+import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Literal, Optional, Set
 
 from pydantic import BaseModel, Field
 
+from ..utils.parse_cache import default_cache_dir
 
-class ObsidianNote(BaseModel):
-    """Represents an Obsidian note with metadata."""
+# Statistics have their own pydantic-free module and are re-exported here
+from .stats import SLOWEST_FILES_KEPT as SLOWEST_FILES_KEPT
+from .stats import ConversionStats as ConversionStats
+from .stats import format_bytes as format_bytes
+
+DEFAULT_ATTACHMENT_EXTENSIONS = frozenset({
+    "png", "jpg", "jpeg", "gif", "svg", "pdf", "mp4", "mp3", "zip", "gltf", "glb"
+})
+
+
+@dataclass(slots=True, kw_only=True)
+class ObsidianNote:
+    """Represents an Obsidian note with metadata.
+    
+    Built by the parser for every note, so it is a plain slotted dataclass
+    rather than a validated model: its fields come from our own code.
+    """
     
     file_path: Path
     title: str
     content: str
-    front_matter: Dict = Field(default_factory=dict)
-    tags: Set[str] = Field(default_factory=set)
-    links: List[str] = Field(default_factory=list)
-    backlinks: List[str] = Field(default_factory=list)
+    front_matter: Dict = field(default_factory=dict)
+    tags: Set[str] = field(default_factory=set)
+    links: List[str] = field(default_factory=list)
+    attachments: List[str] = field(default_factory=list)
+    backlinks: List[str] = field(default_factory=list)
     created_date: Optional[str] = None
     modified_date: Optional[str] = None
 
 
-class HugoPost(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class HugoPost:
     """Represents a Hugo post/page."""
     
     file_path: Path
     title: str
     content: str
-    front_matter: Dict = Field(default_factory=dict)
+    front_matter: Dict = field(default_factory=dict)
     url: str
     weight: int = 0
     draft: bool = False
@@ -41,38 +60,66 @@ class ConversionConfig(BaseModel):
     hugo_static_path: Path
     hugo_archetypes_path: Path
     theme_name: str = "hugo-papermod"
+    front_matter_format: Literal["yaml", "toml", "json"] = "yaml"
     preserve_front_matter: bool = True
     convert_wikilinks: bool = True
     convert_tags: bool = True
     convert_attachments: bool = True
-    attachment_extensions: Set[str] = Field(default_factory=lambda: {
-        "png", "jpg", "jpeg", "gif", "svg", "pdf", "mp4", "mp3", "zip", "gltf", "glb"
-    })
+    attachment_extensions: Set[str] = Field(default_factory=lambda: set(DEFAULT_ATTACHMENT_EXTENSIONS))
+    attachment_mode: Literal["auto", "copy", "hardlink", "reflink"] = "auto"
+    attachment_checksum: bool = False
+    publish_referenced_attachments: bool = False
     exclude_patterns: List[str] = Field(default_factory=list)
     include_patterns: List[str] = Field(default_factory=lambda: ["*.md"])
     create_toc: bool = True
     toc_max_depth: int = 3
-
-
-@dataclass
-class ConversionStats:
-    """Statistics about the conversion process."""
+    incremental: bool = False
+    jobs: int = 1
+    state_dir: Optional[Path] = None
+    parse_cache: bool = True
+    cache_dir: Optional[Path] = None
+    link_graph: bool = True
+    streaming: bool = False
+    pipeline: bool = False
+    pipeline_prefetch: int = 32
+    watch_quiet_period: float = 0.5
+    watch_max_latency: float = 5.0
     
-    total_files: int = 0
-    converted_files: int = 0
-    skipped_files: int = 0
-    error_files: int = 0
-    attachments_copied: int = 0
-    links_converted: int = 0
-    tags_processed: int = 0
-    processing_time: float = 0.0
+    @property
+    def build_state_path(self) -> Path:
+        """Directory holding the build manifest and other conversion state."""
+        return self.state_dir or self.hugo_content_path.parent / ".obsidian-to-hugo"
     
-    def __str__(self) -> str:
-        return (
-            f"Conversion completed in {self.processing_time:.2f}s\n"
-            f"Files: {self.converted_files}/{self.total_files} converted, "
-            f"{self.skipped_files} skipped, {self.error_files} errors\n"
-            f"Attachments: {self.attachments_copied} copied\n"
-            f"Links: {self.links_converted} converted\n"
-            f"Tags: {self.tags_processed} processed"
-        )
\ No newline at end of file
+    @property
+    def manifest_path(self) -> Path:
+        """Location of the persistent build manifest."""
+        return self.build_state_path / "manifest.json"
+    
+    @property
+    def link_graph_path(self) -> Path:
+        """Hugo data file holding the links and backlinks of every note."""
+        return self.hugo_content_path.parent / "data" / "graph.json"
+    
+    @property
+    def parse_cache_path(self) -> Path:
+        """Directory of the parse cache shared by every command."""
+        return (self.cache_dir or default_cache_dir()) / "parse"
+    
+    def fingerprint(self) -> str:
+        """Hash of the settings that affect the generated Hugo files."""
+        settings = self.model_dump_json(include=OUTPUT_SETTINGS)
+        return hashlib.blake2b(settings.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Settings that change the content of generated files; a change to any of
+# them invalidates every entry of the build manifest.
+OUTPUT_SETTINGS = {
+    "hugo_content_path",
+    "theme_name",
+    "front_matter_format",
+    "preserve_front_matter",
+    "convert_wikilinks",
+    "convert_tags",
+    "create_toc",
+    "toc_max_depth",
+}
@@ -0,0 +1,115 @@
+"""Conversion statistics.
+
+Kept apart from the pydantic models so the command line can show results
+sent by the daemon without importing pydantic.
+"""
+
+import heapq
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterator, List, Tuple
+
+from ..utils.profiling import trace_span
+
+# Number of slowest files ConversionStats keeps track of
+SLOWEST_FILES_KEPT = 10
+
+
+@dataclass
+class ConversionStats:
+    """Statistics about the conversion process."""
+    
+    total_files: int = 0
+    converted_files: int = 0
+    skipped_files: int = 0
+    error_files: int = 0
+    removed_files: int = 0
+    unchanged_outputs: int = 0
+    attachments_copied: int = 0
+    attachments_skipped: int = 0
+    attachments_removed: int = 0
+    bytes_copied: int = 0
+    bytes_skipped: int = 0
+    links_converted: int = 0
+    tags_processed: int = 0
+    processing_time: float = 0.0
+    # Seconds spent per pipeline stage, summed over files and worker processes
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    # Min-heap of (seconds, path) holding the slowest converted files
+    slowest_files: List[Tuple[float, str]] = field(default_factory=list)
+    # (note, link target) pairs of wikilinks matching no note
+    unresolved_links: List[Tuple[str, str]] = field(default_factory=list)
+    # (note, link target) pairs of wikilinks matching several notes equally well
+    ambiguous_links: List[Tuple[str, str]] = field(default_factory=list)
+    
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Add the time spent in the enclosed block to a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_times[stage] = self.stage_times.get(stage, 0.0) + elapsed
+            trace_span(stage, start, elapsed)
+    
+    def record_file_time(self, file_path: str, seconds: float):
+        """Remember a file's conversion time if it is among the slowest."""
+        item = (seconds, file_path)
+        if len(self.slowest_files) < SLOWEST_FILES_KEPT:
+            heapq.heappush(self.slowest_files, item)
+        elif item > self.slowest_files[0]:
+            heapq.heapreplace(self.slowest_files, item)
+    
+    def slowest(self, count: int = SLOWEST_FILES_KEPT) -> List[Tuple[float, str]]:
+        """Return the slowest files, slowest first."""
+        return heapq.nlargest(count, self.slowest_files)
+    
+    def merge(self, other: "ConversionStats"):
+        """Add the counters of a partial run, e.g. from a worker process."""
+        for stat_field in fields(self):
+            if stat_field.name == "processing_time":
+                continue
+            if stat_field.name == "stage_times":
+                for stage, seconds in other.stage_times.items():
+                    self.stage_times[stage] = self.stage_times.get(stage, 0.0) + seconds
+            elif stat_field.name == "slowest_files":
+                for seconds, file_path in other.slowest_files:
+                    self.record_file_time(file_path, seconds)
+            else:
+                setattr(self, stat_field.name, getattr(self, stat_field.name) + getattr(other, stat_field.name))
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ConversionStats":
+        """Rebuild statistics from ``dataclasses.asdict`` data that went through JSON."""
+        stats = cls(**data)
+        for name in ("slowest_files", "unresolved_links", "ambiguous_links"):
+            setattr(stats, name, [tuple(item) for item in getattr(stats, name)])
+        return stats
+    
+    def __str__(self) -> str:
+        text = (
+            f"Conversion completed in {self.processing_time:.2f}s\n"
+            f"Files: {self.converted_files}/{self.total_files} converted, "
+            f"{self.skipped_files} skipped, {self.error_files} errors, "
+            f"{self.removed_files} removed, {self.unchanged_outputs} outputs unchanged\n"
+            f"Attachments: {self.attachments_copied} copied, "
+            f"{self.attachments_skipped} unchanged, {self.attachments_removed} removed "
+            f"({format_bytes(self.bytes_copied)} copied, {format_bytes(self.bytes_skipped)} skipped)\n"
+            f"Links: {self.links_converted} converted, {len(self.unresolved_links)} unresolved, "
+            f"{len(self.ambiguous_links)} ambiguous\n"
+            f"Tags: {self.tags_processed} processed"
+        )
+        if self.stage_times:
+            stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in self.stage_times.items())
+            text += f"\nStages: {stages}"
+        return text
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
@@ -0,0 +1 @@
+"""Long-running conversion daemon and its client."""
@@ -0,0 +1,99 @@
+"""Client side of the conversion daemon's control socket.
+
+Only the standard library is imported here, so handing a command to a
+running daemon does not pay for the converter's imports.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Environment variable overriding the socket location
+SOCKET_ENV = 'OBSIDIAN_TO_HUGO_SOCKET'
+
+# Seconds to wait for the daemon to accept a connection
+CONNECT_TIMEOUT = 5.0
+
+
+class DaemonError(Exception):
+    """Raised when the daemon reports that a command failed."""
+
+
+def default_socket_path() -> Path:
+    """Return the control socket location shared by the daemon and its clients."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return Path(path)
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'obsidian-to-hugo.sock'
+
+    from ..utils.parse_cache import default_cache_dir
+    return default_cache_dir() / 'daemon.sock'
+
+
+def request(
+    command: str,
+    args: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """Run a command in the daemon and return its result.
+
+    The request carries the client's working directory, so relative paths
+    mean the same to the daemon. Raises :class:`FileNotFoundError` or
+    :class:`ConnectionRefusedError` when no daemon is listening, and
+    :class:`DaemonError` when the command failed, or when the daemon did
+    not accept the connection or answer within ``timeout`` seconds. By
+    default the call waits for the command however long it takes, since
+    a conversion of a large vault can take minutes.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise ConnectionRefusedError('Unix domain sockets are not supported on this platform')
+
+    path = socket_path or default_socket_path()
+    message = {'command': command, 'args': args or {}, 'cwd': os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except (TimeoutError, BlockingIOError):
+            raise DaemonError(f'The daemon on {path} is not accepting connections') from None
+
+        sock.settimeout(timeout)
+        try:
+            sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reader:
+                line = reader.readline()
+        except TimeoutError:
+            raise DaemonError(f'The daemon on {path} did not answer within {timeout:g}s') from None
+
+    if not line:
+        raise ConnectionResetError('The daemon closed the connection without answering')
+
+    response = json.loads(line)
+    if not response.get('ok'):
+        raise DaemonError(response.get('error') or 'Unknown daemon error')
+    return response.get('result')
+
+
+def try_request(
+    command: str,
+    args: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Run a command in the daemon, or return None when no daemon is running.
+
+    Only a failed connection means there is no daemon. Once connected, a
+    slow or stuck daemon raises :class:`DaemonError` instead, so the caller
+    never converts a vault the daemon may still be writing. Every command's
+    result is a dict, so None is never a result.
+    """
+    try:
+        return request(command, args, socket_path, timeout)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
@@ -0,0 +1,201 @@
+"""Conversion daemon serving commands over a Unix domain socket."""
+
+import io
+import json
+import os
+import socketserver
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from rich.console import Console
+
+from ..converters.hugo_converter import HugoConverter
+from ..core.models import ConversionConfig
+from ..utils.obsidian_parser import ObsidianParser
+from ..utils.parse_cache import ParseCache, default_cache_dir
+from ..utils.vault_analysis import analyze_vault
+from .client import CONNECT_TIMEOUT, DaemonError, default_socket_path, request
+
+# Width of the console output sent back to clients
+LOG_WIDTH = 100
+
+# Configuration paths given relative to the client's working directory
+CONFIG_PATH_FIELDS = (
+    'obsidian_vault_path',
+    'hugo_content_path',
+    'hugo_static_path',
+    'hugo_archetypes_path',
+    'state_dir',
+    'cache_dir',
+)
+
+
+def _resolve(cwd: Path, path: str) -> Path:
+    """Return a path sent by a client as an absolute path."""
+    return cwd / Path(path).expanduser()
+
+
+def _manifest_stamp(config: ConversionConfig) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of a build manifest, None if it is missing."""
+    try:
+        stat = config.manifest_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConversionDaemon:
+    """Keeps converters warm between the commands of short-lived clients.
+
+    A converter is created per working directory and configuration and
+    kept with its manifest, link index and reverse link index in memory,
+    so ``convert-file`` updates a note without scanning the vault. Commands
+    are handled one at a time; the console output of a command is returned
+    to the client with its result.
+
+    Relative paths in a request are resolved against the client's working
+    directory; the daemon never changes its own. A warm converter is
+    dropped when its build manifest was rewritten by another process.
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.converters: Dict[str, HugoConverter] = {}
+        # Manifest stamp of each converter after its last command
+        self.manifest_stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.parsers: Dict[Optional[Path], ObsidianParser] = {}
+        self.started = time.time()
+        self.requests = 0
+        self.server: Optional[socketserver.UnixStreamServer] = None
+        self.commands: Dict[str, Callable[[Dict[str, Any], Path], Dict[str, Any]]] = {
+            'convert': self._convert,
+            'convert-file': self._convert_file,
+            'analyze': self._analyze,
+            'stats': self._stats,
+        }
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request and return the response sent to the client."""
+        self.requests += 1
+        command = self.commands.get(message.get('command'))
+        if command is None:
+            return {'ok': False, 'error': f"Unknown command: {message.get('command')}"}
+
+        try:
+            cwd = Path(message.get('cwd') or os.getcwd())
+            return {'ok': True, 'result': command(message.get('args') or {}, cwd)}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+    def _run_converter(
+        self, args: Dict[str, Any], cwd: Path, run: Callable[[HugoConverter], Any]
+    ) -> Dict[str, Any]:
+        """Run a conversion with the warm converter for a request's configuration."""
+        config = ConversionConfig(**args['config'])
+        config = config.model_copy(update={
+            name: _resolve(cwd, getattr(config, name))
+            for name in CONFIG_PATH_FIELDS
+            if getattr(config, name) is not None
+        })
+
+        key = config.model_dump_json()
+        converter = self.converters.get(key)
+        if converter is not None and self.manifest_stamps.get(key) != _manifest_stamp(config):
+            # Another process converted since, the in-memory manifest is stale
+            converter = None
+        if converter is None:
+            converter = self.converters[key] = HugoConverter(config)
+        converter.console = Console(file=io.StringIO(), width=LOG_WIDTH)
+
+        try:
+            stats = run(converter)
+        finally:
+            self.manifest_stamps[key] = _manifest_stamp(config)
+        return {'stats': asdict(stats), 'log': converter.console.file.getvalue()}
+
+    def _convert(self, args: Dict[str, Any], cwd: Path) -> Dict[str, Any]:
+        return self._run_converter(args, cwd, lambda converter: converter.convert())
+
+    def _convert_file(self, args: Dict[str, Any], cwd: Path) -> Dict[str, Any]:
+        changed = [_resolve(cwd, path) for path in args['files']]
+        return self._run_converter(args, cwd, lambda converter: converter.update_files(changed=changed))
+
+    def _analyze(self, args: Dict[str, Any], cwd: Path) -> Dict[str, Any]:
+        cache_path = None
+        if not args.get('no_cache'):
+            cache_path = _resolve(cwd, args['cache_dir']) if args.get('cache_dir') else default_cache_dir()
+        parser = self.parsers.get(cache_path)
+        if parser is None:
+            cache = ParseCache(cache_path / 'parse') if cache_path is not None else None
+            parser = self.parsers[cache_path] = ObsidianParser(cache=cache)
+
+        analysis = analyze_vault(_resolve(cwd, args['vault']), parser, metadata_only=args.get('metadata_only', False))
+        return {'analysis': analysis.to_dict()}
+
+    def _stats(self, args: Dict[str, Any], cwd: Path) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'socket': str(self.socket_path),
+            'uptime': time.time() - self.started,
+            'requests': self.requests,
+            'vaults': [
+                {
+                    'vault': str(converter.config.obsidian_vault_path),
+                    'notes': len(converter.link_mapping),
+                    'manifest_entries': len(converter.manifest),
+                }
+                for converter in self.converters.values()
+            ],
+        }
+
+    def serve_forever(self):
+        """Listen on the socket until interrupted or shut down, then remove it."""
+        if self.server is None:
+            self.server = self.bind()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.close()
+
+    def bind(self) -> socketserver.UnixStreamServer:
+        """Create the listening socket, replacing a stale one."""
+        if self.socket_path.exists():
+            try:
+                request('stats', socket_path=self.socket_path, timeout=CONNECT_TIMEOUT)
+            except (ConnectionRefusedError, FileNotFoundError, ValueError):
+                self.socket_path.unlink(missing_ok=True)
+            except DaemonError as e:
+                # Something is listening, even if it is not answering
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}: {e}") from None
+            else:
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    response = daemon.handle(json.loads(line))
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"Malformed request: {e}"}
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+        # Only the owner may hand commands to the daemon, from the moment the
+        # socket exists
+        umask = os.umask(0o077)
+        try:
+            return socketserver.UnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(umask)
+
+    def close(self):
+        """Stop listening and remove the socket file."""
+        if self.server is not None:
+            self.server.server_close()
+            self.server = None
+        self.socket_path.unlink(missing_ok=True)
+
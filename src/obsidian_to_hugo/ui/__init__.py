@@ -1,5 +1,11 @@
 """UI module for Obsidian to Hugo converter."""
 
-from .main_window import MainWindow, main
+__all__ = ["MainWindow", "main"]
 
-__all__ = ["MainWindow", "main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Importing the package must not load PyQt6
+    if name in __all__:
+        from . import main_window
+        return getattr(main_window, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
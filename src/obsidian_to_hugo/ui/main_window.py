@@ -6,7 +6,7 @@ import subprocess
 import webbrowser
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtWidgets import (
@@ -23,6 +23,11 @@ from ..core.models import ConversionConfig, ConversionStats
 from ..converters.hugo_converter import HugoConverter
 from ..watchers.file_watcher import FileWatcher
 from ..utils.obsidian_parser import ObsidianParser
+from ..utils.parse_cache import ParseCache, default_cache_dir
+from ..utils.vault_analysis import AnalysisBatch, VaultAnalysis, iter_vault_analysis
+
+# Note names listed per directory in the analysis
+DIRECTORY_SAMPLE_SIZE = 5
 
 
 class HugoServerWorker(QThread):
@@ -114,6 +119,42 @@ class ConversionWorker(QThread):
             self.error.emit(str(e))
 
 
+class AnalysisWorker(QThread):
+    """Worker thread for vault analysis.
+    
+    Results are streamed a batch of notes at a time, with the notes of the
+    batch grouped by directory relative to the vault.
+    """
+    
+    batch_ready = pyqtSignal(AnalysisBatch, dict)
+    finished = pyqtSignal(bool)  # False when cancelled
+    error = pyqtSignal(str)
+    
+    def __init__(self, vault_path: Path):
+        super().__init__()
+        self.vault_path = vault_path
+        
+    def run(self):
+        """Run the analysis until done or interrupted."""
+        try:
+            # Unchanged notes come from the parse cache the converter fills
+            parser = ObsidianParser(cache=ParseCache(default_cache_dir() / "parse"))
+            for batch in iter_vault_analysis(self.vault_path, parser):
+                directories: Dict[str, List[str]] = {}
+                for file_path in batch.notes:
+                    rel_path = file_path.relative_to(self.vault_path)
+                    dir_name = rel_path.parent.as_posix() if rel_path.parent != Path('.') else 'Root'
+                    directories.setdefault(dir_name, []).append(rel_path.name)
+                self.batch_ready.emit(batch, directories)
+                
+                if self.isInterruptionRequested():
+                    self.finished.emit(False)
+                    return
+            self.finished.emit(True)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
 class WatchWorker(QThread):
     """Worker thread for file watching."""
     
@@ -154,6 +195,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.conversion_worker = None
         self.watch_worker = None
+        self.analysis_worker = None
         self.hugo_server_worker = None
         self.init_ui()
         
@@ -346,7 +388,7 @@ class MainWindow(QMainWindow):
         actions_layout.addWidget(self.server_btn)
         
         self.analyze_btn = QPushButton("Analyze Vault")
-        self.analyze_btn.clicked.connect(self.analyze_vault)
+        self.analyze_btn.clicked.connect(self.toggle_analysis)
         self.analyze_btn.setStyleSheet("""
             QPushButton {
                 background-color: #FF9800;
@@ -457,6 +499,23 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(analysis_group)
         
+        # Tags and links, appended as batches arrive
+        names_layout = QHBoxLayout()
+        
+        tags_group = QGroupBox("Tags")
+        tags_layout = QVBoxLayout(tags_group)
+        self.analysis_tags = QListWidget()
+        tags_layout.addWidget(self.analysis_tags)
+        names_layout.addWidget(tags_group)
+        
+        links_group = QGroupBox("Links")
+        links_layout = QVBoxLayout(links_group)
+        self.analysis_links = QListWidget()
+        links_layout.addWidget(self.analysis_links)
+        names_layout.addWidget(links_group)
+        
+        layout.addLayout(names_layout)
+        
         return tab
         
     def create_server_tab(self) -> QWidget:
@@ -644,8 +703,14 @@ Total Files: {stats.total_files}
 Converted Files: {stats.converted_files}
 Skipped Files: {stats.skipped_files}
 Error Files: {stats.error_files}
+Removed Files: {stats.removed_files}
+Unchanged Outputs: {stats.unchanged_outputs}
 Attachments Copied: {stats.attachments_copied}
+Attachments Unchanged: {stats.attachments_skipped}
+Attachments Removed: {stats.attachments_removed}
 Links Converted: {stats.links_converted}
+Unresolved Links: {len(stats.unresolved_links)}
+Ambiguous Links: {len(stats.ambiguous_links)}
 Tags Processed: {stats.tags_processed}
 """
         self.results_text.setText(results)
@@ -703,48 +768,97 @@ Tags Processed: {stats.tags_processed}
         QMessageBox.critical(self, "Watch Error", f"File watching error: {error}")
         self.logs_text.append(f"[ERROR] Watch error: {error}")
         
+    def toggle_analysis(self):
+        """Start a vault analysis, or cancel the running one."""
+        if self.analysis_worker and self.analysis_worker.isRunning():
+            self.cancel_analysis()
+        else:
+            self.analyze_vault()
+            
     def analyze_vault(self):
-        """Analyze the Obsidian vault."""
+        """Analyze the Obsidian vault in a worker thread."""
         vault_path = Path(self.vault_path.text())
         if not vault_path.exists():
             QMessageBox.warning(self, "Error", "Please select a valid Obsidian vault first")
             return
-            
-        try:
-            parser = ObsidianParser()
-            markdown_files = list(vault_path.rglob("*.md"))
-            
-            analysis = f"""
-Vault Analysis:
-===============
-Vault Path: {vault_path}
-Total Markdown Files: {len(markdown_files)}
-
-Files by Directory:
-"""
-            
-            # Group files by directory
-            dir_files = {}
-            for file in markdown_files:
-                rel_path = file.relative_to(vault_path)
-                dir_name = str(rel_path.parent) if rel_path.parent != Path('.') else 'Root'
-                if dir_name not in dir_files:
-                    dir_files[dir_name] = []
-                dir_files[dir_name].append(rel_path.name)
-                
-            for dir_name, files in dir_files.items():
-                analysis += f"\n{dir_name}/ ({len(files)} files):\n"
-                for file in files[:5]:  # Show first 5 files
-                    analysis += f"  - {file}\n"
-                if len(files) > 5:
-                    analysis += f"  ... and {len(files) - 5} more\n"
-                    
-            self.analysis_text.setText(analysis)
-            self.logs_text.append(f"[INFO] Vault analysis completed: {len(markdown_files)} files found")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Analysis failed: {e}")
-            self.logs_text.append(f"[ERROR] Analysis error: {e}")
+        
+        self.analysis_vault = vault_path
+        self.analysis = VaultAnalysis()
+        self.analysis_dir_counts: Dict[str, int] = {}
+        self.analysis_dir_samples: Dict[str, List[str]] = {}
+        self.analysis_tags.clear()
+        self.analysis_links.clear()
+        self.analysis_text.setText(f"Analyzing {vault_path}...")
+        
+        self.analysis_worker = AnalysisWorker(vault_path)
+        self.analysis_worker.batch_ready.connect(self.analysis_batch_ready)
+        self.analysis_worker.finished.connect(self.analysis_finished)
+        self.analysis_worker.error.connect(self.analysis_error)
+        self.analysis_worker.start()
+        
+        self.analyze_btn.setText("Cancel Analysis")
+        self.logs_text.append(f"[INFO] Vault analysis started: {vault_path}")
+        
+    def cancel_analysis(self):
+        """Ask the analysis to stop after the current batch."""
+        self.analysis_worker.requestInterruption()
+        self.analyze_btn.setEnabled(False)
+        self.analyze_btn.setText("Cancelling...")
+        
+    def analysis_batch_ready(self, batch: AnalysisBatch, directories: Dict[str, List[str]]):
+        """Add a batch of analysis results to the view."""
+        self.analysis.add_batch(batch)
+        for dir_name, names in directories.items():
+            self.analysis_dir_counts[dir_name] = self.analysis_dir_counts.get(dir_name, 0) + len(names)
+            samples = self.analysis_dir_samples.setdefault(dir_name, [])
+            samples.extend(names[:DIRECTORY_SAMPLE_SIZE - len(samples)])
+        
+        self.analysis_tags.addItems(sorted(batch.tags))
+        self.analysis_links.addItems(sorted(batch.links))
+        for file_path, error in batch.errors:
+            self.logs_text.append(f"[ERROR] Error analyzing {file_path}: {error}")
+        
+        self.analysis_text.setText(self._format_analysis())
+        
+    def _format_analysis(self, status: str = "in progress") -> str:
+        """Format the analysis collected so far."""
+        analyzed = sum(self.analysis_dir_counts.values())
+        lines = [
+            f"Vault Analysis ({status}):",
+            "===============",
+            f"Vault Path: {self.analysis_vault}",
+            f"Total Markdown Files: {self.analysis.total_files}",
+            f"Analyzed Files: {analyzed}",
+            f"Total Attachments: {self.analysis.attachments}",
+            f"Unique Tags: {len(self.analysis.tags)}",
+            f"Unique Links: {len(self.analysis.links)}",
+            f"Aliases: {self.analysis.aliases}",
+            "",
+            "Files by Directory:",
+        ]
+        for dir_name, count in self.analysis_dir_counts.items():
+            lines.append(f"\n{dir_name}/ ({count} files):")
+            lines.extend(f"  - {name}" for name in self.analysis_dir_samples[dir_name])
+            if count > DIRECTORY_SAMPLE_SIZE:
+                lines.append(f"  ... and {count - DIRECTORY_SAMPLE_SIZE} more")
+        return "\n".join(lines)
+        
+    def analysis_finished(self, completed: bool):
+        """Handle the end of the analysis, finished or cancelled."""
+        self.analyze_btn.setEnabled(True)
+        self.analyze_btn.setText("Analyze Vault")
+        
+        status = "complete" if completed else "cancelled"
+        self.analysis_text.setText(self._format_analysis(status))
+        analyzed = sum(self.analysis_dir_counts.values())
+        self.logs_text.append(f"[INFO] Vault analysis {status}: {analyzed} of {self.analysis.total_files} files")
+        
+    def analysis_error(self, error: str):
+        """Handle analysis error."""
+        self.analyze_btn.setEnabled(True)
+        self.analyze_btn.setText("Analyze Vault")
+        QMessageBox.critical(self, "Error", f"Analysis failed: {error}")
+        self.logs_text.append(f"[ERROR] Analysis error: {error}")
             
     def clear_logs(self):
         """Clear the logs."""
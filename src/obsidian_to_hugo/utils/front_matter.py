@@ -0,0 +1,201 @@
+"""Reading note front matter and writing Hugo front matter in YAML, TOML or JSON."""
+
+import codecs
+import datetime
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import frontmatter
+import toml
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+# A line of three or more dashes, as python-frontmatter delimits YAML
+_YAML_FENCE = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+# TOML and JSON headers, left to python-frontmatter
+_OTHER_OPENINGS = ('+++', '{', '}')
+
+# Line width at which PyYAML starts folding plain scalars
+YAML_WIDTH = 80
+
+_PLAIN_KEY = re.compile(r'[A-Za-z][A-Za-z0-9_]*')
+# Words, numbers, dates and times that need no escaping in any YAML style
+_SIMPLE_STRING = re.compile(r'[A-Za-z0-9][A-Za-z0-9_./+-]*(?::[A-Za-z0-9_./+-]+)*(?: [A-Za-z0-9_./+-]+)*')
+
+# Decides, like the dumper does, whether a plain string would be read back as
+# another type (a number, a date, a boolean) and so has to be quoted
+_resolver = yaml.resolver.Resolver()
+
+
+def _load_yaml(header: str) -> Dict[str, Any]:
+    data = yaml.load(header, Loader=SafeLoader)
+    return dict(data) if isinstance(data, dict) else {}
+
+
+def parse_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split a note into its front matter and body, like ``frontmatter.parse``.
+
+    YAML headers are located with two anchored searches and parsed with
+    libyaml's SafeLoader when available. The rarer TOML and JSON headers
+    are handed to python-frontmatter.
+    """
+    normalized = text.replace('\r\n', '\n').strip()
+    if not normalized.startswith('---'):
+        if normalized.startswith(_OTHER_OPENINGS):
+            metadata, content = frontmatter.parse(text)
+            return dict(metadata), content
+        return {}, normalized
+    text = normalized
+
+    opening = _YAML_FENCE.match(text)
+    closing = opening and _YAML_FENCE.search(text, opening.end())
+    if closing is None:
+        return {}, text
+
+    return _load_yaml(text[opening.end():closing.start()]), text[closing.end():].strip()
+
+
+def read_front_matter(file_path: Path, chunk_size: int = 8192) -> Dict[str, Any]:
+    """Return the front matter of a note without reading its body.
+
+    The file is read in chunks until the closing ``---`` line shows up, so
+    the cost does not depend on the size of the note. Undecodable bytes
+    only raise an error when they are part of the header.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('surrogateescape')
+    text = ''
+
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                # No complete header before the end of the file
+                return parse_front_matter(file_path.read_text(encoding='utf-8'))[0]
+
+            text += decoder.decode(chunk)
+            # Universal newlines, like Path.read_text
+            header = text.replace('\r\n', '\n').replace('\r', '\n').lstrip()
+            if len(header) < 3 or '\n' not in header:
+                continue
+            if header.startswith(_OTHER_OPENINGS):
+                return parse_front_matter(file_path.read_text(encoding='utf-8'))[0]
+
+            opening = _YAML_FENCE.match(header)
+            if opening is None:
+                return {}
+
+            # A match at the very end may still grow into a longer line
+            closing = _YAML_FENCE.search(header, opening.end())
+            if closing is not None and closing.end() < len(header):
+                block = header[opening.end():closing.start()]
+                # Raises for undecodable bytes, as reading the whole file would
+                block.encode('utf-8')
+                return _load_yaml(block)
+
+
+def _plain_scalar(value: Any) -> Optional[str]:
+    """Return how SafeDumper writes a scalar that needs no escaping, else None."""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        if not _SIMPLE_STRING.fullmatch(value):
+            return None
+        if _resolver.resolve(yaml.ScalarNode, value, (True, False)) == 'tag:yaml.org,2002:str':
+            return value
+        return f"'{value}'"
+    if type(value) is datetime.date:
+        return value.isoformat()
+    return None
+
+
+def _emit_simple_yaml(metadata: Dict[str, Any]) -> Optional[str]:
+    """Write flat metadata without going through PyYAML.
+
+    Only handles keys and values whose YAML form is known up front: simple
+    words, numbers, booleans, dates and lists of those, which covers the
+    keys the converter adds to every note. Returns None for anything else.
+    """
+    lines: List[str] = []
+
+    for key in sorted(metadata):
+        if _plain_scalar(key) != key or not _PLAIN_KEY.fullmatch(key):
+            return None
+
+        value = metadata[key]
+        if isinstance(value, list):
+            if not value:
+                lines.append(f'{key}: []')
+                continue
+            lines.append(f'{key}:')
+            for item in value:
+                text = _plain_scalar(item)
+                if text is None or len(text) + 2 > YAML_WIDTH:
+                    return None
+                lines.append(f'- {text}')
+            continue
+
+        text = _plain_scalar(value)
+        if text is None or len(key) + len(text) + 2 > YAML_WIDTH:
+            return None
+        lines.append(f'{key}: {text}')
+
+    return '\n'.join(lines)
+
+
+def dump_yaml(metadata: Dict[str, Any]) -> str:
+    """Return the YAML block of a front matter, without delimiters.
+
+    Produces the same text as ``frontmatter.dumps``: flat metadata is
+    written directly, the rest goes through libyaml's SafeDumper when it
+    is available.
+    """
+    text = _emit_simple_yaml(metadata)
+    if text is None:
+        text = yaml.dump(metadata, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True).strip()
+    return text
+
+
+def dump_toml(metadata: Dict[str, Any]) -> str:
+    """Return the TOML block of a front matter, without delimiters."""
+    return toml.dumps(metadata).strip()
+
+
+def dump_json(metadata: Dict[str, Any]) -> str:
+    """Return the front matter as a JSON object."""
+    return json.dumps(metadata, indent=2, ensure_ascii=False, default=str)
+
+
+# Front matter format: (emitter, opening delimiter, closing delimiter)
+EMITTERS: Dict[str, tuple] = {
+    'yaml': (dump_yaml, '---\n', '\n---'),
+    'toml': (dump_toml, '+++\n', '\n+++'),
+    'json': (dump_json, '', ''),
+}
+
+
+def register_emitter(name: str, emitter: Callable[[Dict[str, Any]], str], opening: str = '', closing: str = ''):
+    """Add or replace a front matter format."""
+    EMITTERS[name] = (emitter, opening, closing)
+
+
+def render_post(metadata: Dict[str, Any], content: str, front_matter_format: str = 'yaml') -> str:
+    """Return a Hugo page: front matter, a blank line and the content."""
+    try:
+        emitter, opening, closing = EMITTERS[front_matter_format]
+    except KeyError:
+        raise ValueError(f"Unknown front matter format: {front_matter_format}") from None
+
+    return f'{opening}{emitter(metadata)}{closing}\n\n{content}'.strip()
@@ -0,0 +1,70 @@
+"""File writing helpers for generated output."""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def _current_umask() -> int:
+    """Read the process umask, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write a file through a temporary sibling and a rename.
+
+    Readers such as a running ``hugo server`` never see a half-written
+    file. The temporary name is unique, so concurrent writers of the same
+    file never share it, and starts with a dot so watchers ignore it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.', delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            tmp.write(data)
+        except BaseException:
+            tmp.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    try:
+        # Temporary files are private, generated output should not be
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write a file atomically unless it already holds exactly ``data``.
+
+    Leaving identical files alone keeps their mtime, so tools watching the
+    output only see the files that really changed. Returns whether the
+    file was written.
+    """
+    try:
+        # The size check avoids reading files that obviously differ
+        if path.stat().st_size == len(data) and _has_contents(path, data):
+            return False
+    except OSError:
+        pass
+
+    atomic_write_bytes(path, data)
+    return True
+
+
+def _has_contents(path: Path, data: bytes, chunk_size: int = 1024 * 1024) -> bool:
+    """Compare a file with ``data`` chunk by chunk, without loading it whole."""
+    view = memoryview(data)
+    with open(path, 'rb') as f:
+        for offset in range(0, len(data), chunk_size):
+            if f.read(chunk_size) != view[offset:offset + chunk_size]:
+                return False
+    return True
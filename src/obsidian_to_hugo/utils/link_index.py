@@ -0,0 +1,312 @@
+"""Resolution of wikilink targets to Hugo URLs."""
+
+import posixpath
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_ANCHOR_DROPPED = re.compile(r'[^\w\- ]')
+
+
+def normalize_target(target: str) -> str:
+    """Return the lookup form of a link target or note path.
+
+    Obsidian matches links case-insensitively, and file names written on
+    macOS arrive in decomposed Unicode form.
+    """
+    return unicodedata.normalize('NFC', target).casefold()
+
+
+def heading_anchor(heading: str) -> str:
+    """Return the anchor Hugo generates for a heading, or '' for a block reference.
+
+    Nested headings (``note#Part#Section``) link to the last one, like in
+    Obsidian. Hugo's default ``github`` heading IDs are lower case with
+    punctuation dropped and spaces turned into dashes.
+    """
+    heading = heading.rsplit('#', 1)[-1].strip()
+    if heading.startswith('^'):
+        # Block references have no counterpart in Hugo
+        return ''
+    return _ANCHOR_DROPPED.sub('', heading.lower()).replace(' ', '-')
+
+
+def note_aliases(front_matter: Dict[str, Any]) -> List[str]:
+    """Return the aliases declared in a note's front matter."""
+    aliases = front_matter.get('aliases', front_matter.get('alias'))
+    if not aliases:
+        return []
+    if isinstance(aliases, (list, tuple)):
+        return [str(alias) for alias in aliases if alias]
+    return [str(aliases)]
+
+
+class LinkIndex:
+    """Maps wikilink targets to the URLs of the notes they point at.
+
+    Notes are registered under their vault-relative path (the manifest key,
+    e.g. ``folder/note.md``). Every path suffix of a note is indexed, so a
+    bare name, a partial path and a full path all resolve with dict
+    lookups, as do front matter aliases. Lookups are case-insensitive.
+    Resolution follows Obsidian: a path relative to the linking note's
+    folder, then a path from the vault root, then the note with the
+    shortest path ending with the target. Aliases are tried last.
+
+    ``get`` and ``in`` resolve from the vault root; use :meth:`for_note`
+    for links inside a note.
+    """
+
+    def __init__(self):
+        self._urls: Dict[str, str] = {}
+        self._keys_by_url: Dict[str, str] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        # Normalized path suffix without .md -> keys of the notes ending with it
+        self._suffixes: Dict[str, List[str]] = {}
+        self._by_alias: Dict[str, List[str]] = {}
+
+    def add(self, key: str, url: str, aliases: Iterable[str] = ()) -> bool:
+        """Register or update a note, returning whether the index changed."""
+        normalized = list(dict.fromkeys(normalize_target(alias.strip()) for alias in aliases if alias.strip()))
+        if key in self._urls:
+            if self._urls[key] == url and self._aliases[key] == normalized:
+                return False
+            self.remove(key)
+
+        self._urls[key] = url
+        self._keys_by_url[url] = key
+        for suffix in self._path_suffixes(key):
+            self._suffixes.setdefault(suffix, []).append(key)
+
+        self._aliases[key] = normalized
+        for alias in normalized:
+            self._by_alias.setdefault(alias, []).append(key)
+
+        return True
+
+    def remove(self, key: str) -> Optional[str]:
+        """Forget a note and return its URL."""
+        url = self._urls.pop(key, None)
+        if url is None:
+            return None
+        if self._keys_by_url.get(url) == key:
+            del self._keys_by_url[url]
+
+        for suffix in self._path_suffixes(key):
+            self._discard(self._suffixes, suffix, key)
+        for alias in self._aliases.pop(key, []):
+            self._discard(self._by_alias, alias, key)
+
+        return url
+
+    def lookup_names(self, key: str) -> List[str]:
+        """Return the normalized names links can reach a note by: its path suffixes and aliases."""
+        return self._path_suffixes(key) + self._aliases.get(key, [])
+
+    def url(self, key: str) -> Optional[str]:
+        """Return the URL of a registered note."""
+        return self._urls.get(key)
+
+    def key_for_url(self, url: str) -> Optional[str]:
+        """Return the note a resolved URL belongs to."""
+        return self._keys_by_url.get(url)
+
+    def notes(self) -> Dict[str, str]:
+        """Return the URLs of the registered notes by key."""
+        return dict(self._urls)
+
+    @staticmethod
+    def _discard(index: Dict[str, List[str]], name: str, key: str):
+        keys = index.get(name)
+        if keys is None:
+            return
+        keys.remove(key)
+        if not keys:
+            del index[name]
+
+    @staticmethod
+    def _path_suffixes(key: str) -> List[str]:
+        parts = normalize_target(_strip_md(key)).split('/')
+        return ['/'.join(parts[index:]) for index in range(len(parts))]
+
+    def resolve(self, target: str, source: Optional[str] = None) -> Tuple[Optional[str], List[str]]:
+        """Resolve the note part of a link target.
+
+        Returns the URL, or None, and the candidate keys when several notes
+        matched equally well.
+        """
+        target = target.split('#', 1)[0].strip()
+        if not target:
+            return None, []
+
+        name = normalize_target(_strip_md(target)).strip('/')
+        if not name:
+            return None, []
+
+        # Exact path relative to the linking note's folder
+        if source is not None and ('/' in target or '/' in source):
+            relative = posixpath.normpath(posixpath.join(posixpath.dirname(normalize_target(source)), name))
+            keys = self._exact(relative)
+            if keys:
+                return self._urls[keys[0]], []
+
+        candidates = self._suffixes.get(name)
+        if candidates:
+            if len(candidates) == 1:
+                return self._urls[candidates[0]], []
+
+            # Exact path from the vault root
+            exact = self._exact(name)
+            if exact:
+                return self._urls[exact[0]], []
+
+            best = min(candidates, key=lambda key: (key.count('/'), len(key), key))
+            return self._urls[best], sorted(candidates)
+
+        aliased = self._by_alias.get(normalize_target(target))
+        if aliased:
+            best = min(aliased, key=lambda key: (key.count('/'), len(key), key))
+            return self._urls[best], sorted(aliased) if len(aliased) > 1 else []
+
+        return None, []
+
+    def _exact(self, name: str) -> List[str]:
+        """Return the keys of the notes at exactly this normalized path."""
+        depth = name.count('/')
+        return [key for key in self._suffixes.get(name, ()) if key.count('/') == depth]
+
+    def for_note(self, source: Optional[str]) -> "NoteLinks":
+        """Return a resolver for the links of one note."""
+        return NoteLinks(self, source)
+
+    def get(self, target: str, default: Optional[str] = None) -> Optional[str]:
+        url, _ = self.resolve(target)
+        return default if url is None else url
+
+    def __getitem__(self, target: str) -> str:
+        url = self.get(target)
+        if url is None:
+            raise KeyError(target)
+        return url
+
+    def __contains__(self, target: str) -> bool:
+        return self.get(target) is not None
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+
+class NoteLinks:
+    """Resolves the links of one note and remembers the ones that failed.
+
+    Behaves like the plain ``{target: url}`` dict the parser accepts.
+    Targets naming an attachment (``[[file.pdf]]``) are not notes and are
+    never reported.
+    """
+
+    def __init__(self, index: LinkIndex, source: Optional[str]):
+        self.index = index
+        self.source = source
+        self.unresolved: Set[str] = set()
+        self.ambiguous: Dict[str, List[str]] = {}
+
+    def get(self, target: str, default: Optional[str] = None) -> Optional[str]:
+        url, candidates = self.index.resolve(target, self.source)
+        if url is None:
+            if _is_note_target(target):
+                self.unresolved.add(target)
+            return default
+        if candidates:
+            self.ambiguous[target] = candidates
+        return url
+
+    def __getitem__(self, target: str) -> str:
+        url = self.get(target)
+        if url is None:
+            raise KeyError(target)
+        return url
+
+    def __contains__(self, target: str) -> bool:
+        return self.get(target) is not None
+
+
+class LinkReferrers:
+    """Reverse index from link targets to the notes whose links use them.
+
+    A note is filed under every name its links are looked up by (see
+    :meth:`LinkIndex.resolve`) and under the URLs they resolved to. When a
+    note appears, disappears or changes its aliases, only the notes filed
+    under one of its :meth:`LinkIndex.lookup_names` or its old URL can have
+    a link that now resolves differently, so a rename touches the notes
+    linking to it instead of the whole vault.
+    """
+
+    def __init__(self):
+        self._by_name: Dict[str, Set[str]] = {}
+        self._by_url: Dict[str, Set[str]] = {}
+        # Names and URLs each note is filed under, for removal
+        self._filed: Dict[str, Tuple[List[str], List[str]]] = {}
+
+    def set_links(self, key: str, links: Dict[str, Optional[str]]):
+        """Replace the recorded links of a note, ``{target: resolved URL or None}``."""
+        self.remove(key)
+        names = list(dict.fromkeys(name for target in links for name in target_names(target, key)))
+        urls = list(dict.fromkeys(url for url in links.values() if url is not None))
+        for name in names:
+            self._by_name.setdefault(name, set()).add(key)
+        for url in urls:
+            self._by_url.setdefault(url, set()).add(key)
+        self._filed[key] = (names, urls)
+
+    def remove(self, key: str):
+        """Forget the links of a note."""
+        names, urls = self._filed.pop(key, ((), ()))
+        for name in names:
+            self._discard(self._by_name, name, key)
+        for url in urls:
+            self._discard(self._by_url, url, key)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], name: str, key: str):
+        keys = index.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[name]
+
+    def find(self, names: Iterable[str] = (), urls: Iterable[str] = ()) -> Set[str]:
+        """Return the notes with a link looked up by one of the names or resolved to one of the URLs."""
+        referrers: Set[str] = set()
+        for name in names:
+            referrers.update(self._by_name.get(name, ()))
+        for url in urls:
+            referrers.update(self._by_url.get(url, ()))
+        return referrers
+
+    def __len__(self) -> int:
+        return len(self._filed)
+
+
+def target_names(target: str, source: Optional[str] = None) -> List[str]:
+    """Return the normalized names :meth:`LinkIndex.resolve` looks a link target up by."""
+    target = target.split('#', 1)[0].strip()
+    if not target:
+        return []
+
+    names = [normalize_target(target)]
+    name = normalize_target(_strip_md(target)).strip('/')
+    if name:
+        names.append(name)
+        if source is not None and ('/' in target or '/' in source):
+            names.append(posixpath.normpath(posixpath.join(posixpath.dirname(normalize_target(source)), name)))
+    return names
+
+
+def _strip_md(path: str) -> str:
+    return path[:-3] if path.lower().endswith('.md') else path
+
+
+def _is_note_target(target: str) -> bool:
+    """Check whether a link target names a note rather than an attachment."""
+    name = target.split('#', 1)[0].strip()
+    extension = posixpath.splitext(posixpath.basename(name))[1].lower()
+    return bool(name) and extension in ('', '.md')
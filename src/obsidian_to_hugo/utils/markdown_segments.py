@@ -0,0 +1,145 @@
+"""Splitting of markdown into prose and protected regions.
+
+Fenced code, including fences indented inside list items, is protected.
+Indented code blocks (lines indented by four spaces without a fence) are
+not: Obsidian notes indent nested list items the same way, and their
+links and tags must still be converted.
+"""
+
+import re
+from typing import Callable, Iterator, List, NamedTuple, Tuple
+
+# Inline constructs whose text must never be rewritten: code spans, display
+# and inline math (pandoc rules for ``$``) and HTML comments. Every
+# alternative starts with a literal and ends with an empty group naming the
+# construct, so the pattern can be merged into other single-scan patterns.
+INLINE_PROTECTED = (
+    r'`(?P<code_ticks>`*)(?!`)[^\n]*?(?<!`)`(?P=code_ticks)(?!`)(?P<inline_code>)'
+    r'|\$\$[^$]*(?:\$(?!\$)[^$]*)*\$\$(?P<math_block>)'
+    r'|\$(?=[^\s$])[^$\n]*?(?<=[^\s\\])\$(?!\d)(?P<math>)'
+    r'|<!--(?s:.*?)-->(?P<comment>)'
+)
+
+PROTECTED_KINDS = frozenset({'fence', 'inline_code', 'math_block', 'math', 'comment'})
+
+_inline_protected_pattern = re.compile(INLINE_PROTECTED)
+
+
+class Segment(NamedTuple):
+    """A run of note text and the kind of region it belongs to."""
+
+    kind: str
+    text: str
+
+    @property
+    def protected(self) -> bool:
+        return self.kind in PROTECTED_KINDS
+
+
+def _is_blank(text: str) -> bool:
+    return not text.strip(' \t')
+
+
+def _line_end(content: str, position: int) -> int:
+    end = content.find('\n', position)
+    return len(content) if end == -1 else end
+
+
+def _find_fence_close(content: str, position: int, marker: str) -> int:
+    """Return the end of the line closing a fence opened with ``marker``."""
+    while True:
+        index = content.find(marker, position)
+        if index == -1:
+            # An unclosed fence runs to the end of the note
+            return len(content)
+
+        line_start = content.rfind('\n', 0, index) + 1
+        run_end = index + len(marker)
+        while run_end < len(content) and content[run_end] == marker[0]:
+            run_end += 1
+        line_end = _line_end(content, run_end)
+
+        if _is_blank(content[line_start:index]) and _is_blank(content[run_end:line_end]):
+            return line_end
+        position = run_end
+
+
+def iter_fences(content: str) -> Iterator[Tuple[int, int]]:
+    """Yield the ``(start, end)`` span of every fenced code block.
+
+    A fence opens with three or more backticks or tildes at the start of a
+    line (indentation allowed) and closes with a line holding at least as
+    many of the same character.
+    """
+    # str.find is far faster than a regex search for the two markers, the
+    # next occurrence of each is remembered until the scan passes it
+    next_marker = {marker: content.find(marker) for marker in ('```', '~~~')}
+    position = 0
+
+    while True:
+        for marker, index in next_marker.items():
+            if 0 <= index < position:
+                next_marker[marker] = content.find(marker, position)
+        found = [index for index in next_marker.values() if index != -1]
+        if not found:
+            return
+
+        start = min(found)
+        run_end = start + 3
+        while run_end < len(content) and content[run_end] == content[start]:
+            run_end += 1
+
+        line_start = content.rfind('\n', 0, start) + 1
+        info_end = _line_end(content, run_end)
+        if not _is_blank(content[line_start:start]) or (
+            content[start] == '`' and '`' in content[run_end:info_end]
+        ):
+            # Backticks inside a line are a code span, not a fence
+            position = run_end
+            continue
+
+        end = _find_fence_close(content, info_end + 1, content[start:run_end])
+        yield line_start, end
+        position = end
+
+
+def _split_inline(content: str, start: int, end: int, segments: List[Segment]):
+    position = start
+
+    for match in _inline_protected_pattern.finditer(content, start, end):
+        if match.start() > position:
+            segments.append(Segment('prose', content[position:match.start()]))
+        segments.append(Segment(match.lastgroup, match.group()))
+        position = match.end()
+
+    if end > position:
+        segments.append(Segment('prose', content[position:end]))
+
+
+def split_segments(content: str) -> List[Segment]:
+    """Split a note into prose and protected segments, in order."""
+    segments = []
+    position = 0
+
+    for start, end in iter_fences(content):
+        _split_inline(content, position, start, segments)
+        segments.append(Segment('fence', content[start:end]))
+        position = end
+
+    _split_inline(content, position, len(content), segments)
+    return segments
+
+
+def map_segments(content: str, func: Callable[[str], str], kind: str = 'prose') -> str:
+    """Apply ``func`` to every segment of ``kind`` and leave the rest as is."""
+    return ''.join(
+        func(segment.text) if segment.kind == kind else segment.text
+        for segment in split_segments(content)
+    )
+
+
+def prose_segments(content: str) -> Iterator[str]:
+    """Yield the text of every prose segment of a note."""
+    for segment in split_segments(content):
+        if segment.kind == 'prose':
+            yield segment.text
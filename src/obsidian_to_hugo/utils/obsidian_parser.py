@@ -1,22 +1,61 @@
 """Parser for Obsidian markdown files."""
 
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-import frontmatter
 from pydantic import BaseModel
 
 from ..core.models import ObsidianNote
+from .front_matter import parse_front_matter, read_front_matter
+from .link_index import heading_anchor
+from .markdown_segments import (
+    INLINE_PROTECTED,
+    PROTECTED_KINDS,
+    iter_fences,
+    map_segments,
+    prose_segments,
+)
+from .parse_cache import ParseCache
+
+# Pieces of rewritten text joined at a time; in notes dense with links and
+# tags, a list holding one small string per match outgrows the text itself
+JOIN_BATCH = 4096
+
+# Map Obsidian callout types to Hugo admonition types
+CALLOUT_MAPPING = {
+    'note': 'note',
+    'warning': 'warning',
+    'error': 'danger',
+    'info': 'info',
+    'tip': 'tip',
+    'success': 'success',
+    'question': 'question',
+    'example': 'example',
+    'quote': 'quote',
+    'abstract': 'abstract',
+    'bug': 'bug',
+    'danger': 'danger',
+    'failure': 'failure',
+    'important': 'important',
+    'missing': 'missing',
+    'caution': 'caution',
+    'faq': 'faq',
+}
 
 
 class ObsidianParser:
     """Parser for Obsidian markdown files."""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ParseCache] = None):
+        self.cache = cache
+        
         # Regex patterns for Obsidian-specific syntax
         self.wikilink_pattern = re.compile(r'\[\[([^|\]]+)(?:\|([^\]]+))?\]\]')
-        self.tag_pattern = re.compile(r'#([a-zA-Z0-9_-]+)')
+        # A '#' right after a word, a bracket, '/' or '&' is a link anchor or
+        # an entity, as in [#section](page#section), not a tag
+        self.tag_pattern = re.compile(r'#(?<![\w(\[/&]#)([a-zA-Z0-9_-]+)')
         self.callout_pattern = re.compile(r'^>\s*\[!(\w+)\](.*)', re.MULTILINE)
         self.code_block_pattern = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
         
@@ -25,27 +64,88 @@ class ObsidianParser:
         self.pdf_link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+\.pdf)\)')
         self.gltf_link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+\.(?:gltf|glb))\)')
         
-    def parse_file(self, file_path: Path) -> ObsidianNote:
-        """Parse an Obsidian markdown file."""
+        # Every construct rewritten by the conversion passes, so the prose of a
+        # note can be transformed in a single scan. Each alternative starts
+        # with a literal, which lets the regex engine skip plain text quickly,
+        # and ends with an empty group naming the construct. Protected inline
+        # regions come first so their text is matched and left untouched.
+        callout = r'>(?<=^>)\s*\[!(?P<callout_type>\w+)\](?P<callout_body>.*)(?P<callout>)'
+        inline = (
+            INLINE_PROTECTED
+            + r'|(?P<embed>!?)\[\[(?P<link_target>[^|\]]+)(?:\|(?P<link_text>[^\]]+))?\]\](?P<wikilink>)'
+            r'|!\[[^\]]*\]\([^)]+\)(?P<image>)'
+            r'|\[[^\]]*\]\([^)]+\)(?P<link>)'
+            r'|#(?<![\w(\[/&]#)[a-zA-Z0-9_-]+(?P<tag>)'
+        )
+        self.transform_pattern = re.compile(f'{callout}|{inline}', re.MULTILINE)
+        self._inline_pattern = re.compile(inline)
+        
+    def parse_file(self, file_path: Path, metadata_only: bool = False) -> ObsidianNote:
+        """Parse an Obsidian markdown file.
+        
+        With ``metadata_only`` only the front matter is read: the note has
+        no content, links or attachments, and only front matter tags.
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-            
+        
+        if metadata_only:
+            return self._note_from_front_matter(file_path, read_front_matter(file_path), '')
+        
         content = file_path.read_text(encoding='utf-8')
         
+        return self.parse_content(content, file_path)
+    
+    def parse_content(self, content: str, file_path: Path) -> ObsidianNote:
+        """Parse the already loaded text of an Obsidian markdown file."""
+        if self.cache is None:
+            return self._parse_content(content, file_path)
+        
+        key = self.cache.key(file_path, content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return ObsidianNote(
+                file_path=file_path,
+                content=content[cached['body_start']:cached['body_end']],
+                **cached['fields'],
+            )
+        
+        note = self._parse_content(content, file_path)
+        
+        # The body is a slice of the text, only its bounds are stored
+        body_end = len(content.rstrip())
+        body_start = body_end - len(note.content)
+        if content[body_start:body_end] == note.content:
+            self.cache.put(key, {
+                'body_start': body_start,
+                'body_end': body_end,
+                'fields': {
+                    'title': note.title,
+                    'front_matter': note.front_matter,
+                    'tags': note.tags,
+                    'links': note.links,
+                    'attachments': note.attachments,
+                    'created_date': note.created_date,
+                    'modified_date': note.modified_date,
+                },
+            })
+        
+        return note
+    
+    def _parse_content(self, content: str, file_path: Path) -> ObsidianNote:
+        """Parse a note's text without consulting the cache."""
         # Parse front matter
-        try:
-            post = frontmatter.loads(content)
-            front_matter = dict(post.metadata) if post.metadata else {}
-            post_content = post.content
-        except AttributeError:
-            # Fallback for different frontmatter versions
-            fm = frontmatter.Frontmatter()
-            post = fm.read(content)
-            front_matter = dict(post.get('attributes', {}))
-            post_content = post.get('body', content)
+        front_matter, post_content = parse_front_matter(content)
         
+        return self._note_from_front_matter(file_path, front_matter, post_content)
+    
+    def _note_from_front_matter(self, file_path: Path, front_matter: Dict, post_content: str) -> ObsidianNote:
+        """Build a note from its front matter and body."""
         # Extract title from front matter or filename
         title = front_matter.get('title', file_path.stem)
+        if not isinstance(title, str):
+            # e.g. `title: 2024` or an empty `title:` line
+            title = file_path.stem if title is None else str(title)
         
         # Extract tags
         tags = self._extract_tags(post_content, front_matter)
@@ -53,6 +153,9 @@ class ObsidianParser:
         # Extract links
         links = self._extract_links(post_content)
         
+        # Extract embedded and linked files
+        attachments = self._extract_attachments(post_content)
+        
         # Extract dates
         created_date = str(front_matter.get('created', '')) if front_matter.get('created') else None
         modified_date = str(front_matter.get('modified', '')) if front_matter.get('modified') else None
@@ -64,6 +167,7 @@ class ObsidianParser:
             front_matter=front_matter,
             tags=tags,
             links=links,
+            attachments=attachments,
             created_date=created_date,
             modified_date=modified_date
         )
@@ -79,45 +183,216 @@ class ObsidianParser:
             elif isinstance(front_matter['tags'], str):
                 tags.add(front_matter['tags'])
         
-        # Extract tags from content (#tag syntax)
-        content_tags = self.tag_pattern.findall(content)
-        tags.update(content_tags)
+        # Extract tags from content (#tag syntax), code and math are skipped
+        for prose in prose_segments(content):
+            tags.update(match.group(1) for match in self.tag_pattern.finditer(prose))
         
         return tags
     
     def _extract_links(self, content: str) -> List[str]:
         """Extract wikilinks from content."""
         links = []
-        matches = self.wikilink_pattern.findall(content)
         
-        for match in matches:
-            link_target = match[0].strip()
-            if link_target and not link_target.startswith('#'):
-                links.append(link_target)
+        for prose in prose_segments(content):
+            for match in self.wikilink_pattern.finditer(prose):
+                link_target = match.group(1).strip()
+                if link_target and not link_target.startswith('#'):
+                    # The same targets recur in a note and across notes
+                    links.append(sys.intern(link_target))
         
         return links
     
+    def _extract_attachments(self, content: str) -> List[str]:
+        """Extract the files a note embeds or links to, as written in the note."""
+        references = []
+        
+        for prose in prose_segments(content):
+            for pattern in (self.media_link_pattern, self.pdf_link_pattern, self.gltf_link_pattern):
+                references.extend(match.group(2).strip() for match in pattern.finditer(prose))
+            
+            # ![[embed.png]] and [[file.pdf]], wikilinks to notes have no suffix
+            for match in self.wikilink_pattern.finditer(prose):
+                target = match.group(1).split('#', 1)[0].strip()
+                if Path(target).suffix.lower() not in ('', '.md'):
+                    references.append(target)
+        
+        return list(dict.fromkeys(references))
+    
     def convert_wikilinks(self, content: str, link_mapping: Dict[str, str]) -> str:
         """Convert Obsidian wikilinks to Hugo markdown links."""
         def replace_wikilink(match):
-            link_target = match.group(1).strip()
-            display_text = match.group(2) if match.group(2) else link_target
+            return self._wikilink_to_markdown(match.group(1), match.group(2), link_mapping)
+        
+        return map_segments(
+            content, lambda prose: self.wikilink_pattern.sub(replace_wikilink, prose)
+        )
+    
+    def _wikilink_to_markdown(
+        self, target: str, display_text: Optional[str], link_mapping: Dict[str, str]
+    ) -> str:
+        """Return the markdown link for the parts of a wikilink."""
+        link_target = target.strip()
+        display_text = display_text if display_text else link_target
+        
+        # Handle different types of links
+        if link_target.startswith('http'):
+            return f'[{display_text}]({link_target})'
+        elif link_target.startswith('#'):
+            # Heading in the same note
+            anchor = heading_anchor(link_target[1:])
+            return f'[{display_text}](#{anchor})' if anchor else f'[{display_text}]({link_target})'
+        
+        note, _, heading = link_target.partition('#')
+        url = link_mapping.get(note.strip())
+        if url is None:
+            # Fallback to original format
+            return f'[{display_text}]({link_target})'
+        
+        anchor = heading_anchor(heading) if heading else ''
+        return f'[{display_text}]({url}#{anchor})' if anchor else f'[{display_text}]({url})'
+    
+    def strip_tags(self, content: str) -> str:
+        """Remove #tag syntax from content, tags live in the front matter."""
+        return map_segments(content, lambda prose: self.tag_pattern.sub('', prose))
+    
+    def transform(
+        self,
+        content: str,
+        link_mapping: Dict[str, str],
+        convert_wikilinks: bool = True,
+        convert_tags: bool = True,
+    ) -> str:
+        """Apply every content conversion in a single scan of the note.
+        
+        Produces the same result as running convert_wikilinks,
+        convert_callouts, convert_code_blocks, convert_media_links and
+        strip_tags one after another, without building an intermediate copy
+        of the whole note per pass. Fenced code is only normalized, inline
+        code, math and HTML comments are copied unchanged.
+        """
+        parts = []
+        position = 0
+        
+        for start, end in iter_fences(content):
+            parts.append(self._scan(
+                self.transform_pattern, content, link_mapping, convert_wikilinks, convert_tags,
+                position, start,
+            ))
+            parts.append(self._normalize_fence(content[start:end]))
+            position = end
+        
+        if not parts:
+            return self._scan(
+                self.transform_pattern, content, link_mapping, convert_wikilinks, convert_tags
+            )
+        
+        parts.append(self._scan(
+            self.transform_pattern, content, link_mapping, convert_wikilinks, convert_tags,
+            position, len(content),
+        ))
+        return ''.join(parts)
+    
+    def _scan(
+        self,
+        pattern: re.Pattern,
+        content: str,
+        link_mapping: Dict[str, str],
+        convert_wikilinks: bool,
+        convert_tags: bool,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> str:
+        """Rewrite every construct matched by ``pattern`` in one pass."""
+        end = len(content) if end is None else end
+        blocks = []
+        parts = []
+        position = start
+        
+        for match in pattern.finditer(content, start, end):
+            kind = match.lastgroup
             
-            # Handle different types of links
-            if link_target.startswith('http'):
-                return f'[{display_text}]({link_target})'
-            elif link_target.startswith('#'):
-                return f'[{display_text}]({link_target})'
-            elif link_target in link_mapping:
-                return f'[{display_text}]({link_mapping[link_target]})'
+            if kind in PROTECTED_KINDS:
+                continue
+            elif kind == 'tag':
+                replacement = '' if convert_tags else match.group()
+            elif kind == 'link' or kind == 'image':
+                replacement = self._convert_media_token(match.group(), convert_tags)
+            elif kind == 'wikilink':
+                if convert_wikilinks:
+                    # An embed keeps its '!' and becomes an image, as with the passes
+                    link = match.group('embed') + self._wikilink_to_markdown(
+                        match.group('link_target'), match.group('link_text'), link_mapping
+                    )
+                    replacement = self._convert_media_token(link, convert_tags)
+                else:
+                    replacement = self._transform_in_passes(
+                        match.group(), link_mapping, convert_wikilinks, convert_tags
+                    )
             else:
-                # Fallback to original format
-                return f'[{display_text}]({link_target})'
+                callout_content = self._scan(
+                    self._inline_pattern,
+                    match.group('callout_body').strip(),
+                    link_mapping,
+                    convert_wikilinks,
+                    convert_tags,
+                )
+                replacement = self._callout_to_admonition(
+                    match.group('callout_type'), callout_content
+                )
+            
+            parts.append(content[position:match.start()])
+            parts.append(replacement)
+            position = match.end()
+            
+            if len(parts) >= JOIN_BATCH:
+                blocks.append(''.join(parts))
+                parts = []
+        
+        if not parts and not blocks:
+            return content[start:end]
+        
+        parts.append(content[position:end])
+        if blocks:
+            blocks.append(''.join(parts))
+            return ''.join(blocks)
+        return ''.join(parts)
+    
+    def _convert_media_token(self, text: str, convert_tags: bool) -> str:
+        """Run the media and tag passes over a single markdown link."""
+        if '![' in text or text.endswith(('.pdf)', '.gltf)', '.glb)')):
+            text = self._convert_prose_media(text)
+        
+        if convert_tags and '#' in text:
+            text = self.tag_pattern.sub('', text)
+        
+        return text
+    
+    def _transform_in_passes(
+        self,
+        content: str,
+        link_mapping: Dict[str, str],
+        convert_wikilinks: bool,
+        convert_tags: bool,
+    ) -> str:
+        """Run the conversion passes one after another over ``content``."""
+        if convert_wikilinks:
+            content = self.convert_wikilinks(content, link_mapping)
         
-        return self.wikilink_pattern.sub(replace_wikilink, content)
+        content = self.convert_callouts(content)
+        content = self.convert_code_blocks(content)
+        content = self.convert_media_links(content)
+        
+        if convert_tags:
+            content = self.strip_tags(content)
+        
+        return content
     
     def convert_media_links(self, content: str) -> str:
         """Convert media links to Hugo shortcodes."""
+        return map_segments(content, self._convert_prose_media)
+    
+    def _convert_prose_media(self, content: str) -> str:
+        """Convert media links in text known to contain no code or math."""
         # Convert PDF links to PDF viewer shortcode
         def replace_pdf_link(match):
             display_text = match.group(1)
@@ -146,37 +421,24 @@ class ObsidianParser:
     def convert_callouts(self, content: str) -> str:
         """Convert Obsidian callouts to Hugo-compatible format."""
         def replace_callout(match):
-            callout_type = match.group(1).lower()
-            callout_content = match.group(2).strip()
-            
-            # Map Obsidian callout types to Hugo admonition types
-            callout_mapping = {
-                'note': 'note',
-                'warning': 'warning',
-                'error': 'danger',
-                'info': 'info',
-                'tip': 'tip',
-                'success': 'success',
-                'question': 'question',
-                'example': 'example',
-                'quote': 'quote',
-                'abstract': 'abstract',
-                'bug': 'bug',
-                'danger': 'danger',
-                'failure': 'failure',
-                'important': 'important',
-                'missing': 'missing',
-                'caution': 'caution',
-                'faq': 'faq',
-            }
-            
-            hugo_type = callout_mapping.get(callout_type, 'note')
-            return f'{{{{< admonition type="{hugo_type}" title="{callout_type.title()}" >}}}}\n{callout_content}\n{{{{< /admonition >}}}}'
+            return self._callout_to_admonition(match.group(1), match.group(2).strip())
         
-        return self.callout_pattern.sub(replace_callout, content)
+        return map_segments(
+            content, lambda prose: self.callout_pattern.sub(replace_callout, prose)
+        )
+    
+    def _callout_to_admonition(self, callout_type: str, callout_content: str) -> str:
+        """Return the admonition shortcode for a callout."""
+        callout_type = callout_type.lower()
+        hugo_type = CALLOUT_MAPPING.get(callout_type, 'note')
+        return f'{{{{< admonition type="{hugo_type}" title="{callout_type.title()}" >}}}}\n{callout_content}\n{{{{< /admonition >}}}}'
     
     def convert_code_blocks(self, content: str) -> str:
         """Convert Obsidian code blocks to Hugo format."""
+        return map_segments(content, self._normalize_fence, kind='fence')
+    
+    def _normalize_fence(self, fence: str) -> str:
+        """Rewrite a single fenced code block, its body is left as is."""
         def replace_code_block(match):
             language = match.group(1) if match.group(1) else ''
             code_content = match.group(2)
@@ -186,4 +448,4 @@ class ObsidianParser:
             else:
                 return f'```\n{code_content}\n```'
         
-        return self.code_block_pattern.sub(replace_code_block, content)
\ No newline at end of file
+        return self.code_block_pattern.sub(replace_code_block, fence)
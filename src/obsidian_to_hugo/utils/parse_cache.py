@@ -0,0 +1,141 @@
+"""On-disk cache of parsed notes."""
+
+import hashlib
+import os
+import pickle
+import stat
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bump when the parser extracts something different, old entries are then
+# never looked up again and age out of the cache
+PARSE_CACHE_VERSION = 2
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory of obsidian-to-hugo."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base and os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA')
+    return (Path(base) if base else Path.home() / '.cache') / 'obsidian-to-hugo'
+
+
+class ParseCache:
+    """Stores parse results, one pickle file per note version.
+
+    Entries are keyed by the note path plus a hash of its text, so an entry
+    never has to be validated: an edited note simply has a different key.
+    Reading an entry refreshes its mtime, and :meth:`prune` deletes the
+    least recently used entries once the cache exceeds ``max_bytes``. Any
+    I/O or unpickling error is treated as a miss.
+
+    Unpickling runs arbitrary code, so the cache directory is created
+    private to the current user, and a directory that another user owns
+    or can write to disables the cache instead of being read.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._written_bytes = 0
+        self._trusted: Optional[bool] = None
+
+    @staticmethod
+    def key(file_path: Path, content: str) -> str:
+        """Return the cache key of a note's text."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f'{PARSE_CACHE_VERSION}\0{os.path.abspath(file_path)}\0'.encode())
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _is_trusted(self) -> bool:
+        """Create the cache directory and check that only this user can write to it."""
+        if self._trusted is None:
+            try:
+                self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+                info = self.path.stat()
+            except OSError:
+                self._trusted = False
+            else:
+                self._trusted = stat.S_ISDIR(info.st_mode) and not info.st_mode & 0o022 and (
+                    not hasattr(os, 'getuid') or info.st_uid == os.getuid()
+                )
+        return self._trusted
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f'{key}.pickle'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse result for a key, if any."""
+        if not self._is_trusted():
+            self.misses += 1
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                value = pickle.load(f)  # noqa: S301 - only this user can write entries
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Truncated or from an incompatible Python, rebuild it
+            self.misses += 1
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a parse result, evicting old entries when the cache grows too big."""
+        if not self._is_trusted():
+            return
+
+        entry_path = self._entry_path(key)
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_path.parent.mkdir(mode=0o700, exist_ok=True)
+            tmp_path = entry_path.with_name(f'.{entry_path.name}.{os.getpid()}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError):
+            return
+
+        self._written_bytes += len(data)
+        if self._written_bytes > self.max_bytes // 10:
+            self.prune()
+
+    def prune(self):
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        self._written_bytes = 0
+        entries = []
+        total = 0
+
+        try:
+            for shard in os.scandir(self.path):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, entry_path in sorted(entries):
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
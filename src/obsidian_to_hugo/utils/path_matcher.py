@@ -0,0 +1,104 @@
+"""Compiled include/exclude matching of vault paths."""
+
+import re
+from typing import Iterable, List
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regex for relative POSIX paths.
+
+    ``*`` and ``?`` stay within a path segment, ``**`` spans segments. A
+    pattern starting with ``/`` is anchored at the vault root, any other
+    pattern may match at any depth, like ``Path.match`` did.
+    """
+    anchored = pattern.startswith('/')
+    pattern = pattern.strip('/')
+    parts = []
+    index = 0
+
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith('**/', index):
+            parts.append('(?:.*/)?')
+            index += 3
+            continue
+        if pattern.startswith('**', index):
+            parts.append('.*')
+            index += 2
+            continue
+
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    regex = ''.join(parts)
+    return regex if anchored else f'(?:.*/)?{regex}'
+
+
+class PathMatcher:
+    """Include and exclude patterns compiled into one regex each.
+
+    Paths are relative to the vault, in POSIX form. A file is selected when
+    it matches an include pattern and neither it nor one of its parent
+    directories matches an exclude pattern, so an excluded directory can be
+    pruned from a walk without looking inside. Patterns ending in ``/``
+    only exclude directories.
+    """
+
+    def __init__(self, include_patterns: Iterable[str] = ('*.md',), exclude_patterns: Iterable[str] = ()):
+        self.include_patterns: List[str] = list(include_patterns)
+        self.exclude_patterns: List[str] = list(exclude_patterns)
+
+        self._include = self._compile(self._alternatives(self.include_patterns, directories=False), '')
+        self._exclude = self._compile(self._alternatives(self.exclude_patterns, directories=True), '(?:/.*)?')
+
+    @staticmethod
+    def _alternatives(patterns: List[str], directories: bool) -> List[str]:
+        alternatives = []
+        for pattern in patterns:
+            if not pattern.strip('/'):
+                continue
+            regex = glob_to_regex(pattern)
+            if pattern.endswith('/'):
+                if not directories:
+                    continue
+                # Only a parent directory can match, never the file itself
+                regex += '(?=/)'
+            alternatives.append(regex)
+        return alternatives
+
+    @staticmethod
+    def _compile(alternatives: List[str], suffix: str):
+        if not alternatives:
+            return None
+        return re.compile(f"(?:{'|'.join(alternatives)}){suffix}", re.DOTALL)
+
+    def is_included(self, relative_path: str) -> bool:
+        """Check whether a file matches an include pattern."""
+        return self._include is not None and self._include.fullmatch(relative_path) is not None
+
+    def is_excluded(self, relative_path: str) -> bool:
+        """Check whether a file or one of its parent directories is excluded."""
+        return self._exclude is not None and self._exclude.fullmatch(relative_path) is not None
+
+    def prunes(self, relative_dir: str) -> bool:
+        """Check whether a directory, and so everything below it, is excluded."""
+        return self._exclude is not None and self._exclude.fullmatch(f'{relative_dir}/') is not None
+
+    def matches(self, relative_path: str) -> bool:
+        """Check whether a file is selected by the patterns."""
+        return self.is_included(relative_path) and not self.is_excluded(relative_path)
@@ -0,0 +1,80 @@
+"""cProfile and Chrome trace instrumentation of a conversion run."""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class TraceRecorder:
+    """Collects timed spans as Chrome trace events.
+
+    The saved file opens in ``chrome://tracing`` or https://ui.perfetto.dev.
+    Spans recorded by the same thread nest by time, so a file's stages show
+    up inside the span of the file.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, duration: float, category: str = "stage", **args):
+        """Record a span that started at ``perf_counter()`` value ``start``."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def save(self, path: Path):
+        """Write the events in the Chrome trace event format."""
+        path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+
+# Recorder of the profiled run in progress, if any
+_recorder: Optional[TraceRecorder] = None
+
+
+def trace_span(name: str, start: float, duration: float, category: str = "stage", **args):
+    """Add a span to the active trace; does nothing outside :func:`profile_run`."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.add(name, start, duration, category, **args)
+
+
+@contextmanager
+def profile_run(output_prefix: Path) -> Iterator[Tuple[Path, Path]]:
+    """Profile the enclosed block and save ``<prefix>.pstats`` and ``<prefix>.trace.json``.
+
+    Yields the two output paths. Only the current process is profiled, so
+    the work of ``--jobs`` worker processes is missing from both files.
+    """
+    global _recorder
+    pstats_path = output_prefix.with_name(f"{output_prefix.name}.pstats")
+    trace_path = output_prefix.with_name(f"{output_prefix.name}.trace.json")
+
+    recorder = TraceRecorder()
+    profiler = cProfile.Profile()
+    _recorder = recorder
+    profiler.enable()
+    try:
+        yield pstats_path, trace_path
+    finally:
+        profiler.disable()
+        _recorder = None
+        output_prefix.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(pstats_path))
+        recorder.save(trace_path)
@@ -0,0 +1,128 @@
+"""Vault statistics shared by the ``analyze`` command and the daemon."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from ..core.models import DEFAULT_ATTACHMENT_EXTENSIONS, ObsidianNote
+from .link_index import note_aliases
+from .obsidian_parser import ObsidianParser
+from .vault_scanner import VaultScanner
+
+# Notes parsed between two partial results
+ANALYSIS_BATCH_SIZE = 100
+
+
+@dataclass
+class VaultAnalysis:
+    """Counts and names collected from the notes of a vault."""
+
+    total_files: int = 0
+    attachments: int = 0
+    aliases: int = 0
+    tags: Set[str] = field(default_factory=set)
+    links: Set[str] = field(default_factory=set)
+    # (note path, error message) of the notes that could not be parsed
+    errors: List[Tuple[Path, str]] = field(default_factory=list)
+
+    def add_note(self, note: ObsidianNote):
+        """Count the tags, links and aliases of a parsed note."""
+        self.tags.update(note.tags)
+        self.links.update(note.links)
+        self.aliases += len(note_aliases(note.front_matter))
+
+    def add_batch(self, batch: "AnalysisBatch"):
+        """Fold a partial result of :func:`iter_vault_analysis` into the totals."""
+        self.total_files = batch.total_files
+        self.attachments = batch.attachments
+        self.aliases += batch.aliases
+        self.tags.update(batch.tags)
+        self.links.update(batch.links)
+        self.errors.extend(batch.errors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the analysis as JSON-compatible data."""
+        return {
+            'total_files': self.total_files,
+            'attachments': self.attachments,
+            'aliases': self.aliases,
+            'tags': sorted(self.tags),
+            'links': sorted(self.links),
+            'errors': [[str(path), error] for path, error in self.errors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VaultAnalysis":
+        """Rebuild an analysis from :meth:`to_dict` data."""
+        return cls(
+            total_files=data['total_files'],
+            attachments=data['attachments'],
+            aliases=data['aliases'],
+            tags=set(data['tags']),
+            links=set(data['links']),
+            errors=[(Path(path), error) for path, error in data['errors']],
+        )
+
+
+@dataclass
+class AnalysisBatch:
+    """What a batch of notes added to the analysis of a vault."""
+
+    # Counts of the whole vault, known from the scan
+    total_files: int
+    attachments: int
+    notes: List[Path] = field(default_factory=list)
+    aliases: int = 0
+    # Tags and links not seen in an earlier batch
+    tags: Set[str] = field(default_factory=set)
+    links: Set[str] = field(default_factory=set)
+    errors: List[Tuple[Path, str]] = field(default_factory=list)
+
+
+def iter_vault_analysis(
+    vault_path: Path,
+    parser: ObsidianParser,
+    metadata_only: bool = False,
+    batch_size: int = ANALYSIS_BATCH_SIZE,
+) -> Iterator[AnalysisBatch]:
+    """Scan a vault in one walk and parse its notes, yielding a batch at a time.
+
+    At least one batch is yielded, so an empty vault still reports its
+    counts. Stopping the iteration stops the analysis.
+    """
+    inventory = VaultScanner(vault_path, attachment_extensions=DEFAULT_ATTACHMENT_EXTENSIONS).scan()
+    note_paths = inventory.note_paths
+    seen = VaultAnalysis()
+
+    for start in range(0, max(len(note_paths), 1), batch_size):
+        batch = AnalysisBatch(
+            total_files=len(inventory.notes),
+            attachments=len(inventory.attachments),
+            notes=note_paths[start:start + batch_size],
+        )
+        for file_path in batch.notes:
+            try:
+                note = parser.parse_file(file_path, metadata_only=metadata_only)
+            except Exception as e:
+                batch.errors.append((file_path, str(e)))
+                continue
+
+            batch.tags.update(tag for tag in note.tags if tag not in seen.tags)
+            batch.links.update(link for link in note.links if link not in seen.links)
+            aliases = seen.aliases
+            seen.add_note(note)
+            batch.aliases += seen.aliases - aliases
+
+        yield batch
+
+
+def analyze_vault(
+    vault_path: Path,
+    parser: ObsidianParser,
+    metadata_only: bool = False,
+) -> VaultAnalysis:
+    """Scan a vault in one walk and parse every note into a :class:`VaultAnalysis`."""
+    analysis = VaultAnalysis()
+    for batch in iter_vault_analysis(vault_path, parser, metadata_only=metadata_only):
+        analysis.add_batch(batch)
+    return analysis
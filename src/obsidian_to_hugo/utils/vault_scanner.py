@@ -0,0 +1,152 @@
+"""Single-pass discovery of the notes and attachments of a vault."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .path_matcher import PathMatcher
+
+# Directories that never hold publishable content
+IGNORED_DIRECTORIES = frozenset({'.obsidian', '.trash', '.git'})
+
+
+@dataclass(frozen=True)
+class VaultFile:
+    """A file found in the vault, with the stat data taken during the walk."""
+
+    path: Path
+    relative_path: str
+    size: int
+    mtime_ns: int
+    inode: int = 0
+    device: int = 0
+
+    @classmethod
+    def from_path(cls, path: Path, vault_path: Path) -> "VaultFile":
+        """Stat a single file outside of a scan."""
+        stat = path.stat()
+        return cls(
+            path=path,
+            relative_path=path.relative_to(vault_path).as_posix(),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            device=stat.st_dev,
+        )
+
+
+@dataclass
+class VaultInventory:
+    """Everything a single walk of the vault found."""
+
+    notes: List[VaultFile] = field(default_factory=list)
+    attachments: List[VaultFile] = field(default_factory=list)
+    directories: int = 0
+
+    @property
+    def note_paths(self) -> List[Path]:
+        return [note.path for note in self.notes]
+
+
+class VaultScanner:
+    """Walks a vault once with ``os.scandir`` and sorts files into notes and attachments.
+
+    Ignored and excluded directories are skipped before they are entered,
+    symlinked directories are not followed, and only notes and attachments
+    are stat-ed. Entries are visited in name order so scans are
+    reproducible.
+    """
+
+    def __init__(
+        self,
+        vault_path: Path,
+        include_patterns: Iterable[str] = ('*.md',),
+        exclude_patterns: Iterable[str] = (),
+        attachment_extensions: Iterable[str] = (),
+        ignored_directories: Iterable[str] = IGNORED_DIRECTORIES,
+        matcher: Optional[PathMatcher] = None,
+    ):
+        self.vault_path = vault_path
+        self.matcher = matcher or PathMatcher(include_patterns, exclude_patterns)
+        self.attachment_extensions = {extension.lower().lstrip('.') for extension in attachment_extensions}
+        self.ignored_directories = frozenset(ignored_directories)
+        self.directories_walked = 0
+
+    def scan(self) -> VaultInventory:
+        """Walk the vault and return its inventory."""
+        inventory = VaultInventory()
+
+        for kind, vault_file in self.walk():
+            if kind == 'note':
+                inventory.notes.append(vault_file)
+            else:
+                inventory.attachments.append(vault_file)
+
+        inventory.directories = self.directories_walked
+        return inventory
+
+    def walk(self) -> Iterator[Tuple[str, VaultFile]]:
+        """Yield ``('note', file)`` and ``('attachment', file)`` pairs as the walk finds them.
+
+        Nothing is collected, so a caller that handles each file in turn
+        needs no memory per file.
+        """
+        self.directories_walked = 0
+        pending = ['']
+
+        while pending:
+            relative_dir = pending.pop()
+            try:
+                with os.scandir(os.path.join(self.vault_path, relative_dir)) as listing:
+                    entries = sorted(listing, key=lambda entry: entry.name)
+            except OSError:
+                # Vanished or unreadable directory, skip it like rglob does
+                continue
+
+            self.directories_walked += 1
+            subdirectories = []
+
+            for entry in entries:
+                relative_path = f'{relative_dir}/{entry.name}' if relative_dir else entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.ignored_directories and not self.matcher.prunes(relative_path):
+                        subdirectories.append(relative_path)
+                    continue
+
+                kind = self._classify(entry.name, relative_path)
+                if kind is None or not entry.is_file():
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                yield kind, VaultFile(
+                    path=Path(entry.path),
+                    relative_path=relative_path,
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    inode=stat.st_ino,
+                    device=stat.st_dev,
+                )
+
+            # Depth first, in name order
+            pending.extend(reversed(subdirectories))
+
+    def _classify(self, name: str, relative_path: str) -> Optional[str]:
+        """Return 'note', 'attachment' or None for a file."""
+        # Exclude patterns apply to attachments as well as notes
+        if self.matcher.is_excluded(relative_path):
+            return None
+
+        if self.matcher.is_included(relative_path):
+            return 'note'
+
+        extension = os.path.splitext(name)[1].lower().lstrip('.')
+        if extension and extension in self.attachment_extensions:
+            return 'attachment'
+
+        return None
@@ -0,0 +1,114 @@
+"""Coalescing queue of vault changes for the file watcher."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+@dataclass
+class ChangeSet:
+    """The changes collected since the previous batch, one entry per path."""
+
+    changed: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    # Number of file system events folded into this batch
+    events: int = 0
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.removed)
+
+
+class ChangeQueue:
+    """Collects file system events and hands them out as batches.
+
+    Events for the same path are coalesced, the last one wins, so a note
+    saved ten times is converted once. A batch is released on the trailing
+    edge: once no event arrived for ``quiet_period`` seconds, or at the
+    latest ``max_latency`` seconds after its first event, so a long stream
+    of events such as a ``git pull`` cannot postpone conversion forever.
+
+    ``put`` never blocks, so the observer thread keeps receiving events
+    while a batch is being converted.
+    """
+
+    def __init__(
+        self,
+        quiet_period: float = 0.5,
+        max_latency: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.quiet_period = quiet_period
+        self.max_latency = max_latency
+        self.clock = clock
+        self.max_depth = 0
+        self._changes: Dict[Path, str] = {}
+        self._events = 0
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def depth(self) -> int:
+        """Number of paths waiting for the next batch."""
+        with self._condition:
+            return len(self._changes)
+
+    def put(self, kind: str, path: Path):
+        """Record that a path was changed or removed."""
+        with self._condition:
+            now = self.clock()
+            if not self._changes:
+                self._first_event = now
+            self._last_event = now
+            self._events += 1
+
+            self._changes.pop(path, None)
+            self._changes[path] = kind
+            self.max_depth = max(self.max_depth, len(self._changes))
+            self._condition.notify()
+
+    def get_batch(self, timeout: Optional[float] = None) -> Optional[ChangeSet]:
+        """Wait for the next batch of changes.
+
+        Returns None once the queue is closed and empty, or when
+        ``timeout`` seconds pass without a batch becoming due.
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._condition:
+            while True:
+                if self._changes:
+                    due = min(self._last_event + self.quiet_period, self._first_event + self.max_latency)
+                    if self._closed or self.clock() >= due:
+                        return self._take()
+                    wait = due - self.clock()
+                elif self._closed:
+                    return None
+                else:
+                    wait = None
+
+                if deadline is not None:
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._condition.wait(wait)
+
+    def close(self):
+        """Release the pending changes at once and stop handing out batches after them."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _take(self) -> ChangeSet:
+        batch = ChangeSet(events=self._events)
+        for path, kind in self._changes.items():
+            (batch.changed if kind == CHANGED else batch.removed).append(path)
+        self._changes = {}
+        self._events = 0
+        return batch
@@ -1,8 +1,9 @@
 """File watcher for automatic Obsidian to Hugo conversion."""
 
+import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Optional
 
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 from watchdog.observers import Observer
@@ -13,17 +14,28 @@ from rich.table import Table
 
 from ..core.models import ConversionConfig, ConversionStats
 from ..converters.hugo_converter import HugoConverter
+from ..utils.path_matcher import PathMatcher
+from ..utils.vault_scanner import IGNORED_DIRECTORIES
+from .change_queue import CHANGED, REMOVED, ChangeQueue, ChangeSet
 
 
 class ObsidianFileHandler(FileSystemEventHandler):
-    """Handles file system events for Obsidian files."""
+    """Handles file system events for Obsidian files.
+    
+    Events are only queued on the observer thread; a worker thread started
+    by :meth:`start` converts the coalesced batches.
+    """
     
     def __init__(self, config: ConversionConfig, converter: HugoConverter):
         self.config = config
         self.converter = converter
         self.console = Console()
-        self.last_modified: dict[str, float] = {}
-        self.debounce_time = 2.0  # seconds
+        self.queue = ChangeQueue(config.watch_quiet_period, config.watch_max_latency)
+        self.matcher = PathMatcher(config.include_patterns, config.exclude_patterns)
+        self.attachment_extensions = {
+            extension.lower().lstrip('.') for extension in config.attachment_extensions
+        } if config.convert_attachments else set()
+        self._worker: Optional[threading.Thread] = None
         
     def on_created(self, event: FileSystemEvent):
         """Handle file creation events."""
@@ -42,47 +54,81 @@ class ObsidianFileHandler(FileSystemEventHandler):
     
     def on_moved(self, event: FileSystemEvent):
         """Handle file move/rename events."""
-        if not event.is_directory and self._is_obsidian_file(event.src_path):
-            self._schedule_conversion("moved", event.src_path)
+        if event.is_directory:
+            return
+        
+        if self._is_obsidian_file(event.src_path) or self._is_obsidian_file(event.dest_path):
+            self._schedule_conversion("moved", event.src_path, event.dest_path)
     
     def _is_obsidian_file(self, file_path: str) -> bool:
-        """Check if file is an Obsidian file that should be watched."""
+        """Check if file is a note or an attachment that should be watched.
+        
+        Both are queued; the converter syncs attachments to the static
+        directory instead of converting them.
+        """
         path = Path(file_path)
         
         # Check if file is in Obsidian vault
         try:
-            path.relative_to(self.config.obsidian_vault_path)
+            relative_path = path.relative_to(self.config.obsidian_vault_path)
         except ValueError:
             return False
         
-        # Check if file matches include patterns
-        for pattern in self.config.include_patterns:
-            if path.match(pattern):
-                return True
+        # Skip Obsidian's own state, the trash and version control
+        if IGNORED_DIRECTORIES.intersection(relative_path.parts[:-1]):
+            return False
         
-        # Check if file matches exclude patterns
-        for pattern in self.config.exclude_patterns:
-            if path.match(pattern):
-                return False
+        # Check include and exclude patterns
+        relative_posix = relative_path.as_posix()
+        if self.matcher.is_excluded(relative_posix):
+            return False
+        if self.matcher.is_included(relative_posix):
+            return True
         
-        return False
+        return path.suffix.lower().lstrip('.') in self.attachment_extensions
     
-    def _schedule_conversion(self, event_type: str, file_path: str):
-        """Schedule conversion with debouncing."""
-        current_time = time.time()
-        
-        # Debounce rapid changes
-        if file_path in self.last_modified:
-            if current_time - self.last_modified[file_path] < self.debounce_time:
+    def _schedule_conversion(self, event_type: str, file_path: str, dest_path: Optional[str] = None):
+        """Queue the paths touched by an event for the next batch."""
+        if event_type == "deleted":
+            self.queue.put(REMOVED, Path(file_path))
+        elif event_type == "moved":
+            # A rename is the removal of the old note and a new one
+            if self._is_obsidian_file(file_path):
+                self.queue.put(REMOVED, Path(file_path))
+            if self._is_obsidian_file(dest_path):
+                self.queue.put(CHANGED, Path(dest_path))
+        else:
+            self.queue.put(CHANGED, Path(file_path))
+    
+    def start(self):
+        """Start the worker thread converting queued changes."""
+        self._worker = threading.Thread(target=self._run, name="watch-converter", daemon=True)
+        self._worker.start()
+    
+    def stop(self):
+        """Convert the changes still queued and stop the worker thread."""
+        self.queue.close()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+    
+    def _run(self):
+        """Worker loop: convert each batch as soon as it is due."""
+        while True:
+            batch = self.queue.get_batch()
+            if batch is None:
                 return
+            self.process_batch(batch)
+    
+    def process_batch(self, batch: ChangeSet):
+        """Convert only the notes affected by a batch of changes."""
+        self.console.print(
+            f"[blue]{len(batch)} file(s) changed ({batch.events} events, "
+            f"{self.queue.depth} queued since, peak queue depth {self.queue.max_depth})[/blue]"
+        )
         
-        self.last_modified[file_path] = current_time
-        
-        self.console.print(f"[blue]File {event_type}: {file_path}[/blue]")
-        
-        # Perform conversion
         try:
-            stats = self.converter.convert()
+            stats = self.converter.update_files(changed=batch.changed, removed=batch.removed)
             self.console.print(f"[green]Conversion completed: {stats}[/green]")
         except Exception as e:
             self.console.print(f"[red]Conversion error: {e}[/red]")
@@ -106,6 +152,9 @@ class FileWatcher:
         
         self.console.print(f"[green]Starting file watcher for: {self.config.obsidian_vault_path}[/green]")
         
+        # Index the vault once, events then only convert the affected notes
+        self.converter.prepare()
+        
         # Create handler and observer
         self.handler = ObsidianFileHandler(self.config, self.converter)
         self.observer = Observer()
@@ -115,7 +164,8 @@ class FileWatcher:
             recursive=True
         )
         
-        # Start observer
+        # Start the conversion worker, then the observer feeding it
+        self.handler.start()
         self.observer.start()
         
         # Display status
@@ -132,6 +182,8 @@ class FileWatcher:
         if self.observer:
             self.observer.stop()
             self.observer.join()
+            if self.handler:
+                self.handler.stop()
             self.console.print("[yellow]File watcher stopped[/yellow]")
     
     def _display_status(self):
@@ -146,6 +198,10 @@ class FileWatcher:
         status_table.add_row("Theme", self.config.theme_name)
         status_table.add_row("Watch Patterns", ", ".join(self.config.include_patterns))
         status_table.add_row("Exclude Patterns", ", ".join(self.config.exclude_patterns) or "None")
+        status_table.add_row(
+            "Batching",
+            f"{self.config.watch_quiet_period:g}s quiet, {self.config.watch_max_latency:g}s max latency",
+        )
         
         self.console.print(status_table)
         self.console.print("\n[green]Watching for changes... Press Ctrl+C to stop[/green]")
\ No newline at end of file
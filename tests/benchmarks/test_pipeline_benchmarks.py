@@ -0,0 +1,111 @@
+"""Pipeline benchmarks for pytest-benchmark.
+
+They are skipped by a plain ``pytest``; run them with
+``pytest tests/benchmarks -m benchmarks --benchmark-only``, add
+``--benchmark-autosave`` and ``--benchmark-compare`` to track regressions.
+Set ``BENCH_CORPUS`` to a vault, such as the repository's ``content/``
+tree, to benchmark it as well.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from obsidian_to_hugo.benchmarks.synthetic_vault import generate_vault
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.core.models import ConversionConfig
+from obsidian_to_hugo.utils.obsidian_parser import ObsidianParser
+from obsidian_to_hugo.utils.vault_scanner import VaultScanner
+
+pytestmark = pytest.mark.benchmarks
+
+PASSES = ["convert_wikilinks", "convert_callouts", "convert_code_blocks", "convert_media_links", "strip_tags", "transform"]
+
+
+@pytest.fixture(scope="module", params=["synthetic", "corpus"])
+def vault(request, tmp_path_factory):
+    """A synthetic vault of 500 notes, and the real-world vault named by BENCH_CORPUS."""
+    if request.param == "corpus":
+        corpus = os.environ.get("BENCH_CORPUS")
+        if not corpus or not Path(corpus).is_dir():
+            pytest.skip("BENCH_CORPUS is not set to a vault")
+        return Path(corpus)
+
+    root = tmp_path_factory.mktemp("vault")
+    generate_vault(root, notes=500, paragraphs=10, attachments=50, attachment_size=16 * 1024)
+    return root
+
+
+@pytest.fixture
+def converter(vault, tmp_path):
+    config = ConversionConfig(
+        obsidian_vault_path=vault,
+        hugo_content_path=tmp_path / "content",
+        hugo_static_path=tmp_path / "static",
+        hugo_archetypes_path=tmp_path / "archetypes",
+        parse_cache=False,
+    )
+    converter = HugoConverter(config)
+    converter.console.quiet = True
+    return converter
+
+
+@pytest.fixture
+def note_paths(vault):
+    return VaultScanner(vault).scan().note_paths
+
+
+def test_parse_file(benchmark, note_paths):
+    parser = ObsidianParser()
+    benchmark(lambda: [parser.parse_file(path) for path in note_paths])
+
+
+@pytest.mark.parametrize("pass_name", PASSES)
+def test_transform_pass(benchmark, converter, note_paths, pass_name):
+    parser = ObsidianParser()
+    bodies = [parser.parse_file(path).content for path in note_paths]
+    converter._build_link_mapping(note_paths)
+    link_mapping = converter.link_mapping
+
+    func = getattr(parser, pass_name)
+    if pass_name in ("convert_wikilinks", "transform"):
+        benchmark(lambda: [func(body, link_mapping) for body in bodies])
+    else:
+        benchmark(lambda: [func(body) for body in bodies])
+
+
+def test_build_link_mapping(benchmark, converter, note_paths):
+    benchmark(converter._build_link_mapping, note_paths)
+
+
+def test_copy_attachments_cold(benchmark, converter):
+    static = Path(converter.config.hugo_static_path)
+
+    def reset():
+        shutil.rmtree(static, ignore_errors=True)
+        converter.manifest.attachments = set()
+
+    benchmark.pedantic(converter._copy_attachments, setup=reset, rounds=5)
+
+
+def test_copy_attachments_warm(benchmark, converter):
+    converter._copy_attachments()
+    benchmark(converter._copy_attachments)
+
+
+def test_convert_full(benchmark, converter, tmp_path):
+    def reset():
+        shutil.rmtree(tmp_path / "content", ignore_errors=True)
+        shutil.rmtree(tmp_path / ".obsidian-to-hugo", ignore_errors=True)
+
+    benchmark.pedantic(lambda: HugoConverter(converter.config).convert(), setup=reset, rounds=3)
+
+
+def test_convert_incremental(benchmark, converter):
+    config = converter.config.model_copy(update={"incremental": True})
+    HugoConverter(config).convert()
+    benchmark(lambda: HugoConverter(config).convert())
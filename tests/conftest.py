@@ -0,0 +1,16 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Point the per-user cache at a temporary directory.
+
+    Conversions cache parsed notes and the daemon places its socket there,
+    so tests must never touch the real ``~/.cache/obsidian-to-hugo``.
+    """
+    cache_home = tmp_path_factory.mktemp("cache-home")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("LOCALAPPDATA", raising=False)
+    return cache_home
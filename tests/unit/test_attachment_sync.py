@@ -0,0 +1,200 @@
+"""Unit tests for attachment synchronisation."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from obsidian_to_hugo.converters.attachment_sync import AttachmentSync
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.core.models import ConversionConfig
+
+
+class TestAttachmentSync:
+    """Test cases for AttachmentSync."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = self.temp_dir / "vault"
+        self.target = self.temp_dir / "static"
+        (self.source / "images").mkdir(parents=True)
+        (self.source / "images" / "a.png").write_bytes(b"a" * 100)
+        (self.source / "doc.pdf").write_bytes(b"pdf")
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def _sources(self):
+        return sorted(p for p in self.source.rglob("*") if p.is_file())
+    
+    def test_unchanged_files_are_skipped(self):
+        """Test that a second sync copies nothing."""
+        sync = AttachmentSync(self.source, self.target)
+        
+        first, synced = sync.sync(self._sources())
+        second, _ = sync.sync(self._sources(), synced)
+        
+        assert (first.copied, first.bytes_copied) == (2, 103)
+        assert (second.copied, second.skipped, second.bytes_skipped) == (0, 2, 103)
+        assert (self.target / "images" / "a.png").read_bytes() == b"a" * 100
+    
+    def test_modified_file_is_copied_again(self):
+        """Test that a changed source replaces its target."""
+        sync = AttachmentSync(self.source, self.target, mode="copy")
+        _, synced = sync.sync(self._sources())
+        
+        source_path = self.source / "doc.pdf"
+        source_path.write_bytes(b"new pdf")
+        result, _ = sync.sync(self._sources(), synced)
+        
+        assert result.copied == 1
+        assert (self.target / "doc.pdf").read_bytes() == b"new pdf"
+    
+    def test_stale_targets_are_removed(self):
+        """Test that only targets written by the sync are deleted."""
+        sync = AttachmentSync(self.source, self.target)
+        _, synced = sync.sync(self._sources())
+        (self.target / "favicon.ico").write_bytes(b"theme file")
+        
+        shutil.rmtree(self.source / "images")
+        result, synced = sync.sync(self._sources(), synced)
+        
+        assert result.removed == 1
+        assert synced == {"doc.pdf"}
+        assert not (self.target / "images").exists()
+        assert (self.target / "favicon.ico").exists()
+    
+    def test_hardlink_mode(self):
+        """Test that hardlink mode links instead of copying."""
+        sync = AttachmentSync(self.source, self.target, mode="hardlink")
+        sync.sync(self._sources())
+        
+        assert os.path.samefile(self.source / "doc.pdf", self.target / "doc.pdf")
+    
+    def test_checksum_skips_touched_files(self):
+        """Test that checksum mode does not copy a file whose mtime alone changed."""
+        sync = AttachmentSync(self.source, self.target, checksum=True)
+        _, synced = sync.sync(self._sources())
+        
+        source_path = self.source / "doc.pdf"
+        os.utime(source_path, ns=(0, source_path.stat().st_mtime_ns + 10**9))
+        result, _ = sync.sync(self._sources(), synced)
+        
+        assert result.copied == 0
+        assert (self.target / "doc.pdf").stat().st_mtime_ns == source_path.stat().st_mtime_ns
+    
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            AttachmentSync(self.source, self.target, mode="symlink")
+    
+    def test_converter_reports_attachment_stats(self):
+        """Test that conversion records copied and skipped bytes."""
+        (self.source / "note.md").write_text("# Note")
+        config = ConversionConfig(
+            obsidian_vault_path=self.source,
+            hugo_content_path=self.temp_dir / "site" / "content",
+            hugo_static_path=self.target,
+            hugo_archetypes_path=self.temp_dir / "site" / "archetypes",
+        )
+        
+        first = HugoConverter(config).convert()
+        second = HugoConverter(config).convert()
+        
+        assert (first.attachments_copied, first.bytes_copied) == (2, 103)
+        assert (second.attachments_copied, second.attachments_skipped) == (0, 2)
+        assert second.bytes_skipped == 103
+        assert not (self.target / "note.md").exists()
+    
+    def test_referenced_attachments_only(self):
+        """Test that unreferenced attachments are not published."""
+        (self.source / "private.png").write_bytes(b"private")
+        (self.source / "sub").mkdir()
+        (self.source / "sub" / "note.md").write_text("![[a.png]] and [PDF](../doc.pdf)")
+        config = ConversionConfig(
+            obsidian_vault_path=self.source,
+            hugo_content_path=self.temp_dir / "site" / "content",
+            hugo_static_path=self.target,
+            hugo_archetypes_path=self.temp_dir / "site" / "archetypes",
+            publish_referenced_attachments=True,
+        )
+        
+        stats = HugoConverter(config).convert()
+        
+        assert stats.attachments_copied == 2
+        assert (self.target / "images" / "a.png").exists()
+        assert (self.target / "doc.pdf").exists()
+        assert not (self.target / "private.png").exists()
+        
+        # Dropping the embed unpublishes the file in watch mode as well
+        converter = HugoConverter(config)
+        (self.source / "sub" / "note.md").write_text("[PDF](../doc.pdf)")
+        stats = converter.convert_file(self.source / "sub" / "note.md")
+        
+        assert stats.attachments_removed == 1
+        assert not (self.target / "images" / "a.png").exists()
+    
+    def test_excluded_attachments_are_not_published(self):
+        """Test that exclude patterns keep attachments out of static, referenced or not."""
+        (self.source / "drafts").mkdir()
+        (self.source / "drafts" / "wip.png").write_bytes(b"wip")
+        (self.source / "secret.pdf").write_bytes(b"secret")
+        (self.source / "note.md").write_text("![[wip.png]] [Secret](secret.pdf) ![[a.png]]")
+        
+        for referenced_only in (False, True):
+            shutil.rmtree(self.target, ignore_errors=True)
+            config = ConversionConfig(
+                obsidian_vault_path=self.source,
+                hugo_content_path=self.temp_dir / "site" / "content",
+                hugo_static_path=self.target,
+                hugo_archetypes_path=self.temp_dir / "site" / "archetypes",
+                exclude_patterns=["drafts/", "secret.pdf"],
+                publish_referenced_attachments=referenced_only,
+                incremental=False,
+            )
+            
+            HugoConverter(config).convert()
+            
+            assert (self.target / "images" / "a.png").exists()
+            assert not (self.target / "drafts" / "wip.png").exists()
+            assert not (self.target / "secret.pdf").exists()
+    
+    def test_updates_sync_attachments_with_the_default_config(self):
+        """Test that watch-mode updates publish, refresh and remove attachments."""
+        note = self.source / "note.md"
+        note.write_text("# Note")
+        config = ConversionConfig(
+            obsidian_vault_path=self.source,
+            hugo_content_path=self.temp_dir / "site" / "content",
+            hugo_static_path=self.target,
+            hugo_archetypes_path=self.temp_dir / "site" / "archetypes",
+        )
+        converter = HugoConverter(config)
+        converter.convert()
+        converter.prepare()
+        
+        # A new file embedded by an edited note
+        (self.source / "pic.png").write_bytes(b"pic")
+        note.write_text("# Note\n\n![[pic.png]]")
+        stats = converter.update_files(changed=[note])
+        
+        assert stats.attachments_copied == 1
+        assert (self.target / "pic.png").read_bytes() == b"pic"
+        
+        # The file replaced on its own
+        (self.source / "pic.png").write_bytes(b"new picture")
+        stats = converter.update_files(changed=[self.source / "pic.png"])
+        
+        assert (stats.converted_files, stats.attachments_copied) == (0, 1)
+        assert (self.target / "pic.png").read_bytes() == b"new picture"
+        
+        # The file deleted
+        (self.source / "pic.png").unlink()
+        stats = converter.update_files(removed=[self.source / "pic.png"])
+        
+        assert stats.attachments_removed == 1
+        assert not (self.target / "pic.png").exists()
@@ -0,0 +1,102 @@
+"""Unit tests for the benchmark suite."""
+
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.benchmarks.memory import run_benchmark
+from obsidian_to_hugo.benchmarks.suite import find_regressions, run_suite
+from obsidian_to_hugo.benchmarks.synthetic_vault import generate_vault
+
+
+class TestSyntheticVault:
+    """Test cases for the synthetic vault generator."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def _snapshot(self, root: Path):
+        return {path.relative_to(root): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+    
+    def test_generation_is_deterministic(self):
+        """Test that the same arguments produce identical vaults."""
+        generate_vault(self.temp_dir / "a", notes=10, paragraphs=3, attachments=3, attachment_size=128)
+        generate_vault(self.temp_dir / "b", notes=10, paragraphs=3, attachments=3, attachment_size=128)
+        
+        assert self._snapshot(self.temp_dir / "a") == self._snapshot(self.temp_dir / "b")
+    
+    def test_densities_shape_the_notes(self):
+        """Test that link, tag and code densities control the note content."""
+        paths = generate_vault(
+            self.temp_dir / "vault",
+            notes=5,
+            paragraphs=10,
+            link_density=3.0,
+            tag_density=0.0,
+            code_ratio=1.0,
+        )
+        
+        content = paths[0].read_text(encoding="utf-8")
+        assert content.count("See [[") == 30
+        assert content.count("```python") == 10
+        # Only the tag inside each code block remains
+        assert re.findall(r"(?:^|\s)#([\w-]+)", content) == ["not-a-tag"] * 10
+    
+    def test_attachments_are_written_and_embedded(self):
+        """Test that attachments are created with the requested size."""
+        root = self.temp_dir / "vault"
+        generate_vault(root, notes=20, paragraphs=10, code_ratio=0.0, attachments=6, attachment_size=256)
+        
+        attachments = sorted((root / "attachments").rglob("*.*"))
+        assert len(attachments) == 6
+        assert {path.suffix for path in attachments} == {".png", ".pdf", ".glb"}
+        assert all(path.stat().st_size == 256 for path in attachments)
+        assert any("![[file-" in path.read_text(encoding="utf-8") for path in root.rglob("*.md"))
+
+
+class TestBenchmarkSuite:
+    """Test cases for the benchmark harness."""
+    
+    def test_run_suite_times_every_stage(self):
+        """Test that a tiny suite run reports every pipeline stage."""
+        results = run_suite(notes=5, paragraphs=2, attachments=3, attachment_size=64, corpus=None, repeat=1)
+        
+        benchmarks = results["benchmarks"]
+        for name in (
+            "synthetic.parse_file",
+            "synthetic.note_model",
+            "synthetic.pass.convert_wikilinks",
+            "synthetic.pass.transform",
+            "synthetic.build_link_mapping",
+            "synthetic.copy_attachments.cold",
+            "synthetic.convert.full",
+            "synthetic.convert.incremental",
+        ):
+            assert benchmarks[name]["runs"] == 1
+            assert benchmarks[name]["best"] >= 0
+        assert benchmarks["synthetic.parse_file"]["items"] == 5
+    
+    def test_find_regressions(self):
+        """Test that only slowdowns beyond the threshold are reported."""
+        baseline = {"benchmarks": {"a": {"best": 1.0}, "b": {"best": 1.0}, "c": {"best": 1.0}}}
+        results = {"benchmarks": {"a": {"best": 1.05}, "b": {"best": 1.5}, "new": {"best": 9.0}}}
+        
+        regressions = find_regressions(results, baseline, threshold=0.1)
+        
+        assert len(regressions) == 1
+        assert regressions[0].startswith("b:")
+    
+    def test_memory_benchmark_compares_both_modes(self):
+        """Test that the memory benchmark converts the vault in both modes to the same output."""
+        default, streaming = run_benchmark(notes=10, large_notes=1, large_note_mb=0.05)
+        
+        assert (default["streaming"], streaming["streaming"]) == (False, True)
+        assert default["converted"] == streaming["converted"] == 11
+        assert default["output_digest"] == streaming["output_digest"]
+        assert default["peak"] > 0 and streaming["peak"] > 0
@@ -0,0 +1,145 @@
+"""Unit tests for the conversion daemon."""
+
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from obsidian_to_hugo.benchmarks.synthetic_vault import generate_vault
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.core.models import ConversionConfig, ConversionStats
+from obsidian_to_hugo.daemon.client import DaemonError, request, try_request
+from obsidian_to_hugo.daemon.server import ConversionDaemon
+
+
+class TestConversionDaemon:
+    """Test cases for the daemon and its client."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.obsidian_vault = self.temp_dir / "obsidian"
+        generate_vault(self.obsidian_vault, notes=10, paragraphs=2)
+        self.socket_path = self.temp_dir / "daemon.sock"
+
+        self.config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=self.temp_dir / "site" / "content",
+            hugo_static_path=self.temp_dir / "site" / "static",
+            hugo_archetypes_path=self.temp_dir / "site" / "archetypes",
+            parse_cache=False,
+        )
+
+        self.daemon = ConversionDaemon(self.socket_path)
+        self.daemon.server = self.daemon.bind()
+        self.thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.thread.start()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.daemon.server.shutdown()
+        self.thread.join()
+        shutil.rmtree(self.temp_dir)
+
+    def _request(self, command, args=None):
+        return request(command, args, socket_path=self.socket_path)
+
+    def test_convert_and_convert_file(self):
+        """Test that the daemon converts the vault and then single notes with its warm converter."""
+        args = {"config": self.config.model_dump(mode="json")}
+
+        stats = ConversionStats.from_dict(self._request("convert", args)["stats"])
+        assert stats.converted_files == 10
+        assert len(list(self.config.hugo_content_path.rglob("*.md"))) == 10
+
+        note = sorted(self.obsidian_vault.rglob("*.md"))[0]
+        note.write_text("# Edited\n\nNew body.")
+        result = self._request("convert-file", {**args, "files": [str(note)]})
+
+        assert ConversionStats.from_dict(result["stats"]).converted_files >= 1
+        assert len(self.daemon.converters) == 1
+
+    def test_analyze_and_stats(self):
+        """Test the analyze and stats commands."""
+        analysis = self._request("analyze", {"vault": str(self.obsidian_vault), "no_cache": True})["analysis"]
+        assert analysis["total_files"] == 10
+        assert analysis["tags"]
+
+        stats = self._request("stats")
+        assert stats["requests"] == 2
+        assert stats["socket"] == str(self.socket_path)
+
+    def test_errors_are_reported_to_the_client(self):
+        """Test that failing and unknown commands raise DaemonError."""
+        with pytest.raises(DaemonError, match="Unknown command"):
+            self._request("explode")
+        with pytest.raises(DaemonError):
+            self._request("convert", {"config": {}})
+
+    def test_second_daemon_refuses_a_live_socket(self):
+        """Test that a running daemon is not replaced, while a missing one is detected."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            ConversionDaemon(self.socket_path).bind()
+
+        assert try_request("stats", socket_path=self.temp_dir / "missing.sock") is None
+
+    def test_relative_paths_are_resolved_against_the_client(self):
+        """Test that a request's relative paths use the client's directory without a chdir."""
+        relative = {
+            name: os.path.relpath(value, self.temp_dir)
+            for name, value in self.config.model_dump(mode="json").items()
+            if name.endswith("_path")
+        }
+        message = {
+            "command": "convert",
+            "args": {"config": {**self.config.model_dump(mode="json"), **relative}},
+            "cwd": str(self.temp_dir),
+        }
+        daemon_cwd = os.getcwd()
+
+        response = self.daemon.handle(message)
+
+        assert response["ok"], response
+        assert os.getcwd() == daemon_cwd
+        assert len(list(self.config.hugo_content_path.rglob("*.md"))) == 10
+        (converter,) = self.daemon.converters.values()
+        assert converter.config.obsidian_vault_path == self.obsidian_vault
+
+    def test_manifest_written_by_another_process_drops_the_warm_converter(self):
+        """Test that a converter is rebuilt when its manifest changed on disk."""
+        args = {"config": self.config.model_dump(mode="json")}
+        self._request("convert", args)
+        (warm,) = self.daemon.converters.values()
+
+        # A one-shot run outside the daemon rewrites the manifest
+        note = sorted(self.obsidian_vault.rglob("*.md"))[0]
+        note.write_text("# Edited elsewhere\n")
+        HugoConverter(self.config).convert()
+
+        self._request("convert-file", {**args, "files": [str(note)]})
+        (converter,) = self.daemon.converters.values()
+        assert converter is not warm
+
+        self._request("convert-file", {**args, "files": [str(note)]})
+        assert self.daemon.converters[next(iter(self.daemon.converters))] is converter
+
+    def test_socket_is_private_to_the_owner(self):
+        """Test that the control socket is only accessible to its owner."""
+        mode = stat.S_IMODE(self.socket_path.stat().st_mode)
+
+        assert mode & 0o077 == 0
+
+    def test_slow_daemon_raises_instead_of_falling_back(self):
+        """Test that a connected daemon that does not answer is an error, not a missing daemon."""
+        wedged_path = self.temp_dir / "wedged.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+            wedged.bind(str(wedged_path))
+            wedged.listen(1)
+
+            with pytest.raises(DaemonError, match="did not answer"):
+                try_request("convert", socket_path=wedged_path, timeout=0.2)
@@ -0,0 +1,191 @@
+"""Unit tests for the file watcher."""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+
+from obsidian_to_hugo.core.models import ConversionConfig, ConversionStats
+from obsidian_to_hugo.watchers.change_queue import CHANGED, REMOVED, ChangeQueue
+from obsidian_to_hugo.watchers.file_watcher import ObsidianFileHandler
+
+
+class TestObsidianFileHandler:
+    """Test cases for ObsidianFileHandler."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.obsidian_vault = Path(self.temp_dir) / "obsidian"
+        self.obsidian_vault.mkdir()
+
+        self.config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=Path(self.temp_dir) / "content",
+            hugo_static_path=Path(self.temp_dir) / "static",
+            hugo_archetypes_path=Path(self.temp_dir) / "archetypes",
+            watch_quiet_period=0.0,
+        )
+
+        self.converter = Mock()
+        for method in ("convert", "update_files"):
+            getattr(self.converter, method).return_value = ConversionStats()
+
+        self.handler = ObsidianFileHandler(self.config, self.converter)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _process_queued(self):
+        """Convert the queued changes as the worker thread would."""
+        self.handler.process_batch(self.handler.queue.get_batch(timeout=1))
+
+    def test_created_note_converts_single_file(self):
+        """Test that a new note is converted on its own."""
+        note = self.obsidian_vault / "note.md"
+
+        self.handler.on_created(FileCreatedEvent(str(note)))
+        self._process_queued()
+
+        self.converter.update_files.assert_called_once_with(changed=[note], removed=[])
+        self.converter.convert.assert_not_called()
+
+    def test_deleted_note_removes_output(self):
+        """Test that a deleted note removes its output."""
+        note = self.obsidian_vault / "note.md"
+
+        self.handler.on_deleted(FileDeletedEvent(str(note)))
+        self._process_queued()
+
+        self.converter.update_files.assert_called_once_with(changed=[], removed=[note])
+
+    def test_moved_note_uses_destination(self):
+        """Test that a move removes the source and converts the destination."""
+        src = self.obsidian_vault / "old.md"
+        dest = self.obsidian_vault / "new.md"
+
+        self.handler.on_moved(FileMovedEvent(str(src), str(dest)))
+        self._process_queued()
+
+        self.converter.update_files.assert_called_once_with(changed=[dest], removed=[src])
+
+    def test_events_are_coalesced_into_one_batch(self):
+        """Test that a burst of events becomes a single conversion, last event winning."""
+        notes = [self.obsidian_vault / f"note{i}.md" for i in range(500)]
+        for note in notes:
+            self.handler.on_created(FileCreatedEvent(str(note)))
+            self.handler.on_modified(FileModifiedEvent(str(note)))
+        self.handler.on_deleted(FileDeletedEvent(str(notes[0])))
+
+        assert self.handler.queue.depth == 500
+        self._process_queued()
+
+        self.converter.update_files.assert_called_once_with(changed=notes[1:], removed=[notes[0]])
+        assert self.handler.queue.depth == 0
+
+    def test_worker_thread_converts_pending_changes_on_stop(self):
+        """Test that the worker converts in the background and drains the queue when stopped."""
+        self.config.watch_quiet_period = 60.0
+        handler = ObsidianFileHandler(self.config, self.converter)
+        note = self.obsidian_vault / "note.md"
+
+        handler.start()
+        handler.on_modified(FileModifiedEvent(str(note)))
+        handler.stop()
+
+        self.converter.update_files.assert_called_once_with(changed=[note], removed=[])
+
+    def test_non_note_files_are_ignored(self):
+        """Test that files that are neither notes nor attachments are ignored."""
+        self.handler.on_created(FileCreatedEvent(str(self.obsidian_vault / "notes.txt")))
+
+        assert self.handler.queue.depth == 0
+
+    def test_attachment_events_are_queued(self):
+        """Test that edited and deleted attachments reach the converter's attachment sync."""
+        image = self.obsidian_vault / "image.png"
+        pdf = self.obsidian_vault / "doc.pdf"
+
+        self.handler.on_modified(FileModifiedEvent(str(image)))
+        self.handler.on_deleted(FileDeletedEvent(str(pdf)))
+        self._process_queued()
+
+        self.converter.update_files.assert_called_once_with(changed=[image], removed=[pdf])
+
+    def test_attachments_are_not_watched_when_not_converted(self):
+        """Test that attachments are ignored when attachment conversion is off."""
+        self.config.convert_attachments = False
+        handler = ObsidianFileHandler(self.config, self.converter)
+
+        assert not handler._is_obsidian_file(str(self.obsidian_vault / "image.png"))
+
+    def test_excluded_and_ignored_paths_are_not_watched(self):
+        """Test that exclude patterns and Obsidian's own folders are honoured."""
+        self.config.exclude_patterns = ["draft/"]
+        handler = ObsidianFileHandler(self.config, self.converter)
+
+        assert handler._is_obsidian_file(str(self.obsidian_vault / "note.md"))
+        assert not handler._is_obsidian_file(str(self.obsidian_vault / "draft" / "note.md"))
+        assert not handler._is_obsidian_file(str(self.obsidian_vault / "draft" / "image.png"))
+        assert not handler._is_obsidian_file(str(self.obsidian_vault / ".obsidian" / "note.md"))
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestChangeQueue:
+    """Test cases for ChangeQueue."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.queue = ChangeQueue(quiet_period=1.0, max_latency=5.0, clock=self.clock)
+
+    def test_batch_waits_for_quiet_period(self):
+        """Test that a batch is only released once events stop."""
+        self.queue.put(CHANGED, Path("a.md"))
+        self.clock.now = 0.5
+        assert self.queue.get_batch(timeout=0) is None
+
+        self.clock.now = 1.0
+        batch = self.queue.get_batch(timeout=0)
+        assert batch.changed == [Path("a.md")]
+        assert batch.events == 1
+
+    def test_max_latency_bounds_a_stream_of_events(self):
+        """Test that a steady stream of events cannot postpone a batch forever."""
+        for tick in range(6):
+            self.clock.now = tick * 0.9
+            self.queue.put(CHANGED, Path(f"{tick}.md"))
+            if self.clock.now < 5.0:
+                assert self.queue.get_batch(timeout=0) is None
+
+        self.clock.now = 5.0
+        batch = self.queue.get_batch(timeout=0)
+        assert len(batch) == 6
+
+    def test_last_event_per_path_wins(self):
+        """Test that events for one path are coalesced."""
+        self.queue.put(CHANGED, Path("a.md"))
+        self.queue.put(REMOVED, Path("b.md"))
+        self.queue.put(REMOVED, Path("a.md"))
+        self.queue.put(CHANGED, Path("b.md"))
+
+        assert self.queue.depth == 2
+        assert self.queue.max_depth == 2
+        self.queue.close()
+        batch = self.queue.get_batch()
+        assert batch.changed == [Path("b.md")]
+        assert batch.removed == [Path("a.md")]
+        assert batch.events == 4
+        assert self.queue.get_batch() is None
@@ -0,0 +1,130 @@
+"""Unit tests for front matter serialization."""
+
+import datetime
+import json
+import shutil
+import tempfile
+import tomllib
+from pathlib import Path
+
+import frontmatter
+import pytest
+import yaml
+
+from obsidian_to_hugo.utils.front_matter import (
+    dump_yaml,
+    parse_front_matter,
+    read_front_matter,
+    render_post,
+)
+
+
+class TestFrontMatter:
+    """Test cases for the front matter emitters."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metadata = {
+            'title': 'My Note',
+            'date': '2024-01-02',
+            'lastmod': '2024-01-02',
+            'tags': ['hugo', 'note', '2024'],
+            'showToc': True,
+            'TocOpen': False,
+            'weight': 3,
+        }
+    
+    def _reference(self, metadata, content='Body text'):
+        return frontmatter.dumps(frontmatter.Post(content, **metadata))
+    
+    def test_yaml_matches_frontmatter_dumps(self):
+        """Test that the fast YAML path produces the same bytes as python-frontmatter."""
+        assert render_post(self.metadata, 'Body text') == self._reference(self.metadata)
+        assert "date: '2024-01-02'" in render_post(self.metadata, '')
+    
+    def test_yaml_quotes_ambiguous_strings(self):
+        """Test that strings YAML would read as other types stay strings."""
+        metadata = {'a': 'yes', 'b': 'null', 'c': '1.5', 'd': '12:30', 'e': 'on the way'}
+        
+        assert dump_yaml(metadata) == self._reference(metadata, '').strip('-\n')
+        assert yaml.safe_load(dump_yaml(metadata)) == metadata
+    
+    def test_yaml_falls_back_for_complex_values(self):
+        """Test that nested and special values go through the YAML dumper."""
+        metadata = {
+            'title': 'Colon: and "quotes"',
+            'cover': {'image': 'cover.png', 'hidden': True},
+            'aliases': ['/old/path', '#anchor'],
+            'published': datetime.date(2024, 1, 2),
+            'summary': 'word ' * 30,
+        }
+        
+        assert yaml.safe_load(dump_yaml(metadata)) == metadata
+    
+    def test_toml_front_matter(self):
+        """Test that TOML front matter uses +++ delimiters and round-trips."""
+        text = render_post(self.metadata, 'Body text', 'toml')
+        
+        assert text.startswith('+++\n')
+        _, block, content = text.split('+++\n', 2)
+        assert tomllib.loads(block) == self.metadata
+        assert content == '\nBody text'
+    
+    def test_json_front_matter(self):
+        """Test that JSON front matter is a JSON object before the content."""
+        text = render_post(self.metadata, 'Body text', 'json')
+        
+        block, content = text.split('\n\n', 1)
+        assert json.loads(block) == self.metadata
+        assert content == 'Body text'
+    
+    def test_unknown_format(self):
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError):
+            render_post(self.metadata, '', 'xml')
+
+
+class TestFrontMatterLoader:
+    """Test cases for reading note front matter."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_parse_matches_python_frontmatter(self):
+        """Test that notes split the same way as with frontmatter.parse."""
+        texts = [
+            '---\ntitle: Test\ntags: [a, b]\n---\n\n# Body\n',
+            '\n\n---\r\ntitle: CRLF\r\n---\r\nBody\r\n',
+            '---\n---\nEmpty header',
+            '---\ntitle: Unclosed\n\nBody',
+            '----\n- a list\n----\nBody with --- inside\n---\n',
+            '+++\ntitle = "TOML"\n+++\nBody',
+            'No front matter\n---\nat all',
+        ]
+        
+        for text in texts:
+            metadata, content = frontmatter.parse(text)
+            assert parse_front_matter(text) == (dict(metadata), content)
+    
+    def test_read_front_matter_stops_after_header(self):
+        """Test that the body of a note is never read in metadata-only mode."""
+        note = self.temp_dir / "big.md"
+        # The body is not valid UTF-8, so reading it would fail
+        note.write_bytes(b'---\ntitle: Big\naliases: [Large]\n---\n' + b'\xff' * 100_000)
+        
+        assert read_front_matter(note, chunk_size=16) == {'title': 'Big', 'aliases': ['Large']}
+    
+    def test_read_front_matter_without_header(self):
+        """Test notes without or with an unclosed header."""
+        plain = self.temp_dir / "plain.md"
+        plain.write_text("# Just a note\n\n---\ntitle: no\n---\n")
+        unclosed = self.temp_dir / "unclosed.md"
+        unclosed.write_text("---\ntitle: Unclosed\n")
+        
+        assert read_front_matter(plain) == {}
+        assert read_front_matter(unclosed) == {}
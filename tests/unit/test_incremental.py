@@ -0,0 +1,355 @@
+"""Unit tests for incremental conversion with the build manifest."""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.core.manifest import BuildManifest
+from obsidian_to_hugo.core.models import ConversionConfig
+
+
+class TestIncrementalConversion:
+    """Test cases for incremental conversion."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.obsidian_vault = Path(self.temp_dir) / "obsidian"
+        self.hugo_content = Path(self.temp_dir) / "hugo" / "content"
+        self.hugo_static = Path(self.temp_dir) / "hugo" / "static"
+        self.hugo_archetypes = Path(self.temp_dir) / "hugo" / "archetypes"
+
+        self.obsidian_vault.mkdir(parents=True, exist_ok=True)
+
+        self.config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=self.hugo_content,
+            hugo_static_path=self.hugo_static,
+            hugo_archetypes_path=self.hugo_archetypes,
+            convert_attachments=False,
+            incremental=True,
+        )
+
+        (self.obsidian_vault / "note1.md").write_text("# Note 1\n\nSee [[note2]].")
+        (self.obsidian_vault / "note2.md").write_text("# Note 2")
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _convert(self):
+        return HugoConverter(self.config).convert()
+
+    def test_manifest_written_next_to_content(self):
+        """Test that a full run records every note in the manifest."""
+        self._convert()
+
+        manifest = BuildManifest.load(self.config.manifest_path)
+
+        assert self.config.manifest_path.parent == self.hugo_content.parent / ".obsidian-to-hugo"
+        assert set(manifest.entries) == {"note1.md", "note2.md"}
+        assert manifest.get("note1.md").output_path == "note1.md"
+        assert manifest.get("note1.md").links == {"note2": "note2"}
+
+    def test_unchanged_notes_are_skipped(self):
+        """Test that a second run skips notes that did not change."""
+        self._convert()
+
+        stats = self._convert()
+
+        assert stats.total_files == 2
+        assert stats.skipped_files == 2
+        assert stats.converted_files == 0
+
+    def test_modified_note_is_reconverted(self):
+        """Test that only the modified note is rewritten."""
+        self._convert()
+        (self.obsidian_vault / "note2.md").write_text("# Note 2\n\nUpdated.")
+
+        stats = self._convert()
+
+        assert stats.converted_files == 1
+        assert stats.skipped_files == 1
+        assert "Updated." in (self.hugo_content / "note2.md").read_text()
+
+    def test_touched_note_with_same_content_is_skipped(self):
+        """Test that an mtime change alone does not trigger a rewrite."""
+        self._convert()
+        note = self.obsidian_vault / "note1.md"
+        stat = note.stat()
+        os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+        stats = self._convert()
+
+        assert stats.skipped_files == 2
+
+    def test_identical_output_is_not_rewritten(self):
+        """Test that a full rebuild leaves byte-identical outputs untouched."""
+        self._convert()
+        output = self.hugo_content / "note1.md"
+        os.utime(output, ns=(0, 0))
+        self.config.incremental = False
+
+        stats = self._convert()
+
+        assert stats.converted_files == 2
+        assert stats.unchanged_outputs == 2
+        assert output.stat().st_mtime_ns == 0
+
+    def test_changed_output_is_replaced_atomically(self):
+        """Test that a changed output is rewritten without leaving temporary files."""
+        self._convert()
+        (self.obsidian_vault / "note2.md").write_text("# Note 2\n\nUpdated.")
+
+        stats = self._convert()
+
+        assert stats.unchanged_outputs == 0
+        assert "Updated." in (self.hugo_content / "note2.md").read_text()
+        assert sorted(p.name for p in self.hugo_content.iterdir()) == ["note1.md", "note2.md"]
+
+    def test_config_change_invalidates_manifest(self):
+        """Test that changing an output setting reconverts everything."""
+        self._convert()
+        self.config.create_toc = False
+
+        stats = self._convert()
+
+        assert stats.converted_files == 2
+        assert "{{< toc" not in (self.hugo_content / "note1.md").read_text()
+
+    def test_front_matter_format_change_invalidates_manifest(self):
+        """Test that switching the front matter format rewrites every output."""
+        self._convert()
+        self.config.front_matter_format = "toml"
+
+        stats = self._convert()
+
+        assert stats.converted_files == 2
+        assert (self.hugo_content / "note1.md").read_text().startswith("+++\ntitle = ")
+
+    def test_new_link_target_reconverts_referrer(self):
+        """Test that a note is rebuilt when one of its links starts resolving."""
+        (self.obsidian_vault / "note2.md").write_text("# Note 2\n\nSee [[note3]].")
+        self._convert()
+        (self.obsidian_vault / "sub").mkdir()
+        (self.obsidian_vault / "sub" / "note3.md").write_text("# Note 3")
+
+        stats = self._convert()
+
+        assert stats.converted_files == 2
+        assert stats.skipped_files == 1
+        assert "(sub/note3)" in (self.hugo_content / "note2.md").read_text()
+
+    def test_deleted_note_output_is_removed(self):
+        """Test that outputs of deleted notes are removed."""
+        self._convert()
+        (self.obsidian_vault / "note2.md").unlink()
+
+        stats = self._convert()
+
+        assert stats.removed_files == 1
+        assert not (self.hugo_content / "note2.md").exists()
+        assert "note2.md" not in BuildManifest.load(self.config.manifest_path)
+
+    def test_missing_output_is_regenerated(self):
+        """Test that a deleted output file is regenerated."""
+        self._convert()
+        (self.hugo_content / "note1.md").unlink()
+
+        stats = self._convert()
+
+        assert stats.converted_files == 1
+        assert (self.hugo_content / "note1.md").exists()
+
+    def test_corrupt_manifest_is_ignored(self):
+        """Test that an unreadable manifest falls back to a full build."""
+        self.config.manifest_path.parent.mkdir(parents=True)
+        self.config.manifest_path.write_text("{not json")
+
+        stats = self._convert()
+
+        assert stats.converted_files == 2
+
+
+    def test_streaming_mode_matches_default_output(self):
+        """Test that a streaming run writes the same pages and removes orphans."""
+        (self.obsidian_vault / "folder").mkdir()
+        (self.obsidian_vault / "folder" / "note3.md").write_text("# Note 3\n\nBack to [[note1]].")
+        self._convert()
+        expected = {
+            path.relative_to(self.hugo_content): path.read_text()
+            for path in self.hugo_content.rglob("*.md")
+        }
+
+        shutil.rmtree(self.hugo_content.parent)
+        self.config.streaming = True
+        stats = self._convert()
+
+        assert stats.total_files == 3
+        assert stats.converted_files == 3
+        assert {
+            path.relative_to(self.hugo_content): path.read_text()
+            for path in self.hugo_content.rglob("*.md")
+        } == expected
+
+        (self.obsidian_vault / "note2.md").unlink()
+        stats = self._convert()
+
+        assert stats.total_files == 2
+        assert not (self.hugo_content / "note2.md").exists()
+
+
+class TestSingleFileConversion:
+    """Test cases for the single-file update API."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.obsidian_vault = Path(self.temp_dir) / "obsidian"
+        self.hugo_content = Path(self.temp_dir) / "hugo" / "content"
+
+        self.obsidian_vault.mkdir(parents=True, exist_ok=True)
+
+        self.config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=self.hugo_content,
+            hugo_static_path=Path(self.temp_dir) / "hugo" / "static",
+            hugo_archetypes_path=Path(self.temp_dir) / "hugo" / "archetypes",
+            convert_attachments=False,
+        )
+
+        (self.obsidian_vault / "index.md").write_text("# Index\n\nSee [[target]].")
+        (self.obsidian_vault / "target.md").write_text("# Target")
+        (self.obsidian_vault / "other.md").write_text("# Other")
+
+        self.converter = HugoConverter(self.config)
+        self.converter.convert()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_convert_file_only_touches_changed_note(self):
+        """Test that editing a note converts just that note."""
+        (self.obsidian_vault / "other.md").write_text("# Other\n\nEdited.")
+
+        stats = self.converter.convert_file(self.obsidian_vault / "other.md")
+
+        assert stats.converted_files == 1
+        assert "Edited." in (self.hugo_content / "other.md").read_text()
+
+    def test_new_note_reconverts_referrers(self):
+        """Test that a note linking to a newly created note is updated."""
+        (self.obsidian_vault / "index.md").write_text("# Index\n\nSee [[fresh]].")
+        self.converter.convert_file(self.obsidian_vault / "index.md")
+        (self.obsidian_vault / "sub").mkdir()
+        (self.obsidian_vault / "sub" / "fresh.md").write_text("# Fresh")
+
+        stats = self.converter.convert_file(self.obsidian_vault / "sub" / "fresh.md")
+
+        assert stats.converted_files == 2
+        assert "(sub/fresh)" in (self.hugo_content / "_index.md").read_text()
+
+    def test_retitled_note_reconverts_referrers(self):
+        """Test that changing a note's title updates the notes linking to it."""
+        (self.obsidian_vault / "target.md").write_text("---\ntitle: Renamed\n---\n# Target")
+
+        stats = self.converter.convert_file(self.obsidian_vault / "target.md")
+
+        assert stats.converted_files == 2
+
+    def test_remove_file_deletes_output(self):
+        """Test that deleting a note removes its output."""
+        (self.obsidian_vault / "other.md").unlink()
+
+        stats = self.converter.remove_file(self.obsidian_vault / "other.md")
+
+        assert stats.removed_files == 1
+        assert not (self.hugo_content / "other.md").exists()
+
+    def test_move_file_renames_output(self):
+        """Test that moving a note moves its output and fixes referrers."""
+        (self.obsidian_vault / "archive").mkdir()
+        (self.obsidian_vault / "target.md").rename(self.obsidian_vault / "archive" / "target.md")
+
+        stats = self.converter.move_file(
+            self.obsidian_vault / "target.md", self.obsidian_vault / "archive" / "target.md"
+        )
+
+        assert stats.removed_files == 1
+        assert stats.converted_files == 2
+        assert not (self.hugo_content / "target.md").exists()
+        assert (self.hugo_content / "archive" / "target.md").exists()
+        assert "(archive/target)" in (self.hugo_content / "_index.md").read_text()
+
+    def test_move_only_checks_notes_linking_to_the_moved_names(self):
+        """Test that a rename looks at the referrers of the note, not the whole vault."""
+        for i in range(20):
+            (self.obsidian_vault / f"bystander{i}.md").write_text("# Bystander\n\n[[other]]")
+        self.converter.convert()
+        (self.obsidian_vault / "archive").mkdir()
+        (self.obsidian_vault / "target.md").rename(self.obsidian_vault / "archive" / "target.md")
+
+        checked = []
+        for_note = self.converter.link_mapping.for_note
+
+        def spy(key):
+            checked.append(key)
+            return for_note(key)
+
+        self.converter.link_mapping.for_note = spy
+        stats = self.converter.update_files(
+            changed=[self.obsidian_vault / "archive" / "target.md"], removed=[self.obsidian_vault / "target.md"]
+        )
+
+        assert stats.converted_files == 2
+        assert not any(key.startswith("bystander") for key in checked)
+        assert "(archive/target)" in (self.hugo_content / "_index.md").read_text()
+
+    def test_alias_change_reconverts_referrers(self):
+        """Test that a note linking to a newly declared alias is updated."""
+        (self.obsidian_vault / "index.md").write_text("# Index\n\nSee [[Goal]].")
+        self.converter.convert_file(self.obsidian_vault / "index.md")
+        (self.obsidian_vault / "target.md").write_text("---\naliases: [Goal]\n---\n# Target")
+
+        stats = self.converter.convert_file(self.obsidian_vault / "target.md")
+
+        assert stats.converted_files == 2
+        assert "[Goal](target)" in (self.hugo_content / "_index.md").read_text()
+
+    def test_removed_duplicate_name_falls_back_to_other_note(self):
+        """Test that links to a shared name switch to the remaining note."""
+        (self.obsidian_vault / "archive").mkdir()
+        (self.obsidian_vault / "archive" / "target.md").write_text("# Archived")
+        self.converter.convert_file(self.obsidian_vault / "archive" / "target.md")
+        (self.obsidian_vault / "target.md").unlink()
+
+        stats = self.converter.remove_file(self.obsidian_vault / "target.md")
+
+        assert stats.converted_files == 1
+        assert "(archive/target)" in (self.hugo_content / "_index.md").read_text()
+
+    def test_link_graph_follows_updates(self):
+        """Test that data/graph.json is updated when a single note changes."""
+        graph_path = self.config.link_graph_path
+
+        def backlinks(path):
+            nodes = json.loads(graph_path.read_text())["nodes"]
+            node = next(node for node in nodes if node["path"] == path)
+            return [nodes[source]["path"] for source in node["backlinks"]]
+
+        assert backlinks("target.md") == ["index.md"]
+
+        (self.obsidian_vault / "other.md").write_text("# Other\n\n[[target]] and [[index]]")
+        self.converter.convert_file(self.obsidian_vault / "other.md")
+
+        assert backlinks("target.md") == ["index.md", "other.md"]
+        assert backlinks("index.md") == ["other.md"]
+
+        (self.obsidian_vault / "index.md").unlink()
+        self.converter.remove_file(self.obsidian_vault / "index.md")
+
+        assert backlinks("target.md") == ["other.md"]
@@ -0,0 +1,59 @@
+"""Unit tests for the link graph."""
+
+from obsidian_to_hugo.core.link_graph import LinkGraph
+
+
+class TestLinkGraph:
+    """Test cases for LinkGraph."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.graph = LinkGraph()
+        self.graph.set_links("c.md", ["a.md", "b.md", "a.md", "c.md"])
+        self.graph.set_links("a.md", ["b.md"])
+        self.graph.set_links("b.md", [])
+
+    def test_links_and_backlinks(self):
+        """Test that links keep their order and backlinks are sorted."""
+        assert self.graph.links("c.md") == ["a.md", "b.md"]
+        assert self.graph.backlinks("b.md") == ["a.md", "c.md"]
+        assert self.graph.backlinks("c.md") == []
+        assert len(self.graph) == 3
+
+    def test_compact_numbers_nodes_by_key(self):
+        """Test that compaction renumbers the nodes in key order."""
+        self.graph.compact()
+
+        assert self.graph.keys == ["a.md", "b.md", "c.md"]
+        assert self.graph.links("c.md") == ["a.md", "b.md"]
+
+    def test_updates_after_compaction(self):
+        """Test that replaced links and removed notes update the backlinks."""
+        self.graph.compact()
+        self.graph.set_links("a.md", ["d.md"])
+        self.graph.remove_node("c.md")
+
+        assert self.graph.backlinks("b.md") == []
+        assert self.graph.backlinks("d.md") == ["a.md"]
+        assert self.graph.links("c.md") == []
+        assert "c.md" not in self.graph
+
+    def test_readded_note_keeps_its_backlinks(self):
+        """Test that removing and re-adding a note keeps the links to it."""
+        self.graph.compact()
+        self.graph.remove_node("b.md")
+        self.graph.add_node("b.md")
+
+        assert self.graph.links("a.md") == ["b.md"]
+        assert self.graph.backlinks("b.md") == ["a.md", "c.md"]
+        assert self.graph.keys == ["a.md", "b.md", "c.md"]
+
+    def test_to_data(self):
+        """Test the graph.json document."""
+        data = self.graph.to_data({"a.md": "a", "b.md": "b", "c.md": "c"}, {"a.md": "A"})
+
+        assert data["nodes"][0] == {
+            "path": "a.md", "url": "a", "title": "A", "links": [1], "backlinks": [2]
+        }
+        assert data["nodes"][1]["backlinks"] == [0, 2]
+        assert data["nodes"][2]["links"] == [0, 1]
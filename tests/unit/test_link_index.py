@@ -0,0 +1,145 @@
+"""Unit tests for wikilink resolution."""
+
+from obsidian_to_hugo.utils.link_index import LinkIndex, LinkReferrers, heading_anchor, note_aliases
+from obsidian_to_hugo.utils.obsidian_parser import ObsidianParser
+
+
+class TestLinkIndex:
+    """Test cases for LinkIndex."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = LinkIndex()
+        self.index.add("note.md", "note")
+        self.index.add("folder/note.md", "folder/note")
+        self.index.add("folder/deep/other.md", "folder/deep/other", aliases=["Alias", "Other Name"])
+        self.index.add("Über.md", "Über")
+
+    def test_unique_name_resolves(self):
+        """Test that a name shared by no other note resolves anywhere."""
+        assert self.index.get("other") == "folder/deep/other"
+        assert self.index.for_note("note.md").get("other") == "folder/deep/other"
+
+    def test_paths_resolve(self):
+        """Test full and partial paths, with and without the extension."""
+        assert self.index.get("folder/note") == "folder/note"
+        assert self.index.get("folder/note.md") == "folder/note"
+        assert self.index.get("deep/other") == "folder/deep/other"
+        assert self.index.get("note") == "note"
+
+    def test_relative_path_resolves(self):
+        """Test that paths relative to the linking note win."""
+        links = self.index.for_note("folder/page.md")
+
+        assert links.get("deep/other") == "folder/deep/other"
+        assert links.get("../note") == "note"
+        assert links.get("note") == "folder/note"
+
+    def test_lookup_is_case_and_unicode_insensitive(self):
+        """Test that case and Unicode normalization do not matter."""
+        assert self.index.get("FOLDER/Note") == "folder/note"
+        assert self.index.get("über") == "Über"
+
+    def test_aliases_resolve(self):
+        """Test that front matter aliases resolve case-insensitively."""
+        assert self.index.get("other name") == "folder/deep/other"
+        assert "alias" in self.index
+
+    def test_ambiguous_link_is_reported(self):
+        """Test that a name matching several notes picks the shortest path and is reported."""
+        self.index.remove("note.md")
+        self.index.add("elsewhere/note.md", "elsewhere/note")
+        self.index.add("a/b/note.md", "a/b/note")
+        links = self.index.for_note("page.md")
+
+        assert links.get("note#Heading") == "folder/note"
+        assert links.ambiguous == {
+            "note#Heading": ["a/b/note.md", "elsewhere/note.md", "folder/note.md"]
+        }
+
+    def test_unresolved_link_is_reported(self):
+        """Test that unknown notes are reported and attachments are not."""
+        links = self.index.for_note("note.md")
+
+        assert links.get("missing") is None
+        assert links.get("photo.png") is None
+        assert links.unresolved == {"missing"}
+
+    def test_remove_and_update(self):
+        """Test that removed and updated notes leave no stale entries."""
+        assert self.index.add("folder/deep/other.md", "folder/deep/other", aliases=["Alias", "Other Name"]) is False
+        assert self.index.add("folder/deep/other.md", "folder/deep/other", aliases=["New"]) is True
+        assert self.index.get("alias") is None
+        assert self.index.get("new") == "folder/deep/other"
+
+        assert self.index.remove("note.md") == "note"
+        assert self.index.get("note") == "folder/note"
+        assert self.index.remove("note.md") is None
+        assert len(self.index) == 3
+
+
+class TestLinkReferrers:
+    """Test cases for the reverse link index."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = LinkIndex()
+        self.index.add("folder/target.md", "folder/target", aliases=["Goal"])
+        self.referrers = LinkReferrers()
+        self.referrers.set_links("a.md", {"Target#Intro": "folder/target"})
+        self.referrers.set_links("b.md", {"goal": "folder/target"})
+        self.referrers.set_links("folder/c.md", {"../missing": None})
+        self.referrers.set_links("d.md", {"unrelated": None})
+
+    def test_notes_are_found_by_the_names_of_a_changed_note(self):
+        """Test that path suffixes and aliases find the notes linking by them."""
+        assert self.referrers.find(self.index.lookup_names("folder/target.md")) == {"a.md", "b.md"}
+        assert self.referrers.find(self.index.lookup_names("missing.md")) == {"folder/c.md"}
+        assert self.referrers.find(urls=["folder/target"]) == {"a.md", "b.md"}
+
+    def test_relinked_and_removed_notes_are_refiled(self):
+        """Test that replacing and removing links leaves no stale entries."""
+        self.referrers.set_links("a.md", {"unrelated": None})
+        self.referrers.remove("b.md")
+
+        assert self.referrers.find(self.index.lookup_names("folder/target.md")) == set()
+        assert self.referrers.find(["unrelated"]) == {"a.md", "d.md"}
+        assert len(self.referrers) == 3
+
+
+class TestLinkHelpers:
+    """Test cases for the heading and alias helpers."""
+
+    def test_heading_anchor(self):
+        """Test that anchors match Hugo's generated heading IDs."""
+        assert heading_anchor("Getting Started!") == "getting-started"
+        assert heading_anchor("Part#Sub Section") == "sub-section"
+        assert heading_anchor("^block-id") == ""
+
+    def test_note_aliases(self):
+        """Test that aliases are read as a list or a single string."""
+        assert note_aliases({"aliases": ["One", "Two"]}) == ["One", "Two"]
+        assert note_aliases({"alias": "One"}) == ["One"]
+        assert note_aliases({}) == []
+
+    def test_parser_links_headings(self):
+        """Test that wikilinks to headings keep the anchor."""
+        index = LinkIndex()
+        index.add("guide.md", "docs/guide")
+
+        result = ObsidianParser().convert_wikilinks(
+            "[[Guide#Getting Started|start]], [[#Local Heading]] and [[missing]]", index
+        )
+
+        assert result == "[start](docs/guide#getting-started), [#Local Heading](#local-heading) and [missing](missing)"
+
+    def test_anchors_are_not_stripped_as_tags(self):
+        """Test that tag removal leaves link anchors alone."""
+        index = LinkIndex()
+        index.add("guide.md", "guide")
+        parser = ObsidianParser()
+
+        result = parser.transform("[[guide#Setup]] and [[#Intro]] #tag", index)
+
+        assert result == "[guide#Setup](guide#setup) and [#Intro](#intro) "
+        assert parser._extract_tags("[[guide#Setup]] #tag", {}) == {"tag"}
@@ -0,0 +1,60 @@
+"""Unit tests for markdown segmentation."""
+
+from obsidian_to_hugo.utils.markdown_segments import iter_fences, map_segments, split_segments
+
+
+class TestMarkdownSegments:
+    """Test cases for splitting notes into prose and protected regions."""
+    
+    def test_segments_cover_the_whole_note(self):
+        """Test that joining the segments gives back the note."""
+        content = "a `b` c\n```\ncode\n```\n$x$ <!-- d --> e"
+        segments = split_segments(content)
+        
+        assert "".join(segment.text for segment in segments) == content
+        assert [segment.kind for segment in segments] == [
+            "prose", "inline_code", "prose", "fence", "prose", "math", "prose", "comment", "prose",
+        ]
+    
+    def test_fence_needs_matching_close(self):
+        """Test that a fence only closes with the same marker, at least as long."""
+        content = "````md\n```\ninner\n```\n````\nafter"
+        
+        assert list(iter_fences(content)) == [(0, content.index("\nafter"))]
+    
+    def test_indented_fence(self):
+        """Test that indented fences, as in list items, are detected."""
+        content = "- item\n\n    ```sh\n    #!/bin/sh\n    ```\n"
+        
+        assert list(iter_fences(content)) == [(8, len(content) - 1)]
+    
+    def test_indented_text_without_fence_is_prose(self):
+        """Test that four-space indented lines, as in nested lists, stay prose."""
+        content = "- item\n    - nested [[note]] #tag\n\n    indented #text\n"
+        
+        assert [segment.kind for segment in split_segments(content)] == ["prose"]
+    
+    def test_unclosed_fence_runs_to_end(self):
+        """Test that an unclosed fence protects the rest of the note."""
+        content = "text\n~~~\n#tag"
+        
+        assert list(iter_fences(content)) == [(5, len(content))]
+    
+    def test_inline_backticks_are_not_a_fence(self):
+        """Test that triple backticks inside a line form a code span."""
+        content = "run ```ls``` here"
+        
+        assert list(iter_fences(content)) == []
+        assert split_segments(content)[1].kind == "inline_code"
+    
+    def test_currency_is_not_math(self):
+        """Test pandoc's rules for single dollar signs."""
+        assert [s.kind for s in split_segments("costs $5 and $10")] == ["prose"]
+        assert [s.kind for s in split_segments("$ x $")] == ["prose"]
+    
+    def test_map_segments(self):
+        """Test that only segments of the requested kind are rewritten."""
+        content = "a `a` a"
+        
+        assert map_segments(content, str.upper) == "A `a` A"
+        assert map_segments(content, str.upper, kind="inline_code") == "a `A` a"
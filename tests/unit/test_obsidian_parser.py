@@ -4,7 +4,7 @@ import pytest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
-from obsidian_to_hugo.utils.obsidian_parser import ObsidianParser
+from obsidian_to_hugo.utils.obsidian_parser import JOIN_BATCH, ObsidianParser
 from obsidian_to_hugo.core.models import ObsidianNote
 
 
@@ -75,6 +75,16 @@ This is a test note without front matter.
         finally:
             file_path.unlink()
     
+    def test_non_string_title_is_converted(self):
+        """Test that numeric and empty front matter titles still give a string title."""
+        file_path = Path("notes/2024.md")
+        
+        numeric = self.parser.parse_content("---\ntitle: 2024\n---\nBody", file_path)
+        empty = self.parser.parse_content("---\ntitle:\n---\nBody", file_path)
+        
+        assert numeric.title == "2024"
+        assert empty.title == "2024"
+    
     def test_extract_tags_from_content(self):
         """Test extracting tags from content."""
         content = """# Test Note
@@ -209,4 +219,144 @@ echo "Hello"
         non_existent_path = Path("/non/existent/file.md")
         
         with pytest.raises(FileNotFoundError):
-            self.parser.parse_file(non_existent_path)
\ No newline at end of file
+            self.parser.parse_file(non_existent_path)
+    
+    def test_transform_matches_sequential_passes(self):
+        """Test that the single-pass transform equals the pass chain."""
+        content = """# Test Note
+
+See [[note1]], [[note2|Second]] and [[missing]] about #topic.
+
+> [!warning] Check [[note1]] and #urgent
+> Body line.
+
+![diagram](images/flow.png) and [![badge](badge.svg)](https://example.com)
+[Manual](docs/manual.pdf), [[model.glb]] and [section](page#anchor)
+Embeds ![[img.png]], ![[note1]], ![[a]](x.pdf) and ![[missing#part|Alt]].
+Inline `[[note1]] #code`, math $a#b$ and <!-- [[note2]] #draft --> stay.
+
+```python
+# [[note1]] inside code
+print("#hash")
+```
+
+````
+unterminated ``` fence
+"""
+        link_mapping = {"note1": "folder/note1", "note2": "note2"}
+        
+        for convert_wikilinks in (True, False):
+            for convert_tags in (True, False):
+                expected = self.parser._transform_in_passes(
+                    content, link_mapping, convert_wikilinks, convert_tags
+                )
+                result = self.parser.transform(
+                    content,
+                    link_mapping,
+                    convert_wikilinks=convert_wikilinks,
+                    convert_tags=convert_tags,
+                )
+                
+                assert result == expected
+    
+    def test_transform_batches_many_constructs(self):
+        """Test that notes with more constructs than one join batch transform like the passes."""
+        content = "\n".join(
+            f"Line {index} links [[note{index % 3}]] with #tag{index % 5}." for index in range(JOIN_BATCH)
+        )
+        link_mapping = {"note0": "note0", "note1": "folder/note1"}
+        
+        expected = self.parser._transform_in_passes(content, link_mapping, True, True)
+        
+        assert self.parser.transform(content, link_mapping) == expected
+    
+    def test_transform_without_constructs_returns_input(self):
+        """Test that plain text passes through unchanged."""
+        content = "Just some plain text without any markup."
+        
+        assert self.parser.transform(content, {}) is content
+    
+    def test_protected_regions_are_not_rewritten(self):
+        """Test that code, math and comments keep their text."""
+        content = """Prose #tag with [[note1]].
+
+```c
+#include <stdio.h>
+// [[note1]]
+```
+
+~~~
+#define X 1
+~~~
+
+Use `#pragma once` or ``[[note1]]``, $x_#1$ and
+$$
+#not-a-tag
+$$
+<!-- #hidden [[note1]] -->
+"""
+        result = self.parser.transform(content, {"note1": "folder/note1"})
+        
+        assert result.startswith("Prose  with [note1](folder/note1).")
+        assert "#include <stdio.h>\n// [[note1]]" in result
+        assert "~~~\n#define X 1\n~~~" in result
+        assert "`#pragma once`" in result
+        assert "``[[note1]]``" in result
+        assert "$x_#1$" in result
+        assert "$$\n#not-a-tag\n$$" in result
+        assert "<!-- #hidden [[note1]] -->" in result
+    
+    def test_extraction_skips_protected_regions(self):
+        """Test that tags and links inside code are not collected."""
+        with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write("#real [[linked]]\n\n```cpp\n#include [[not-linked]]\n```\n`#inline`\n")
+            temp_path = Path(f.name)
+        
+        try:
+            note = self.parser.parse_file(temp_path)
+            
+            assert note.tags == {"real"}
+            assert note.links == ["linked"]
+        finally:
+            temp_path.unlink()
+    
+    def test_strip_tags_skips_inline_code(self):
+        """Test that the tag pass leaves code spans alone."""
+        assert self.parser.strip_tags("a #b `#c`") == "a  `#c`"
+    
+    def test_extract_attachments(self):
+        """Test collecting embedded and linked files."""
+        content = """![[photo.png|300]] and [[report.pdf#page=2]] next to [[other note]]
+![chart](img/chart.svg) [Scan](scans/scan%201.pdf) [Model](models/ship.glb)
+`![[not-embedded.png]]`
+"""
+        
+        assert self.parser._extract_attachments(content) == [
+            "img/chart.svg", "scans/scan%201.pdf", "models/ship.glb", "photo.png", "report.pdf",
+        ]
+    
+    def test_parse_file_metadata_only(self):
+        """Test that metadata-only parsing stops at the front matter."""
+        content = """---
+title: Header Only
+tags: [meta]
+created: 2024-01-01
+---
+
+Body with [[link]] and #body-tag.
+"""
+        
+        with NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write(content)
+            file_path = Path(f.name)
+        
+        try:
+            note = self.parser.parse_file(file_path, metadata_only=True)
+            
+            assert note.title == "Header Only"
+            assert note.tags == {"meta"}
+            assert note.created_date == "2024-01-01"
+            assert note.content == ""
+            assert note.links == []
+        finally:
+            file_path.unlink()
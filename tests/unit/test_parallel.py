@@ -0,0 +1,76 @@
+"""Unit tests for parallel conversion."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.benchmarks.synthetic_vault import generate_vault
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.converters.parallel import chunk_size
+from obsidian_to_hugo.core.models import ConversionConfig, ConversionStats
+
+
+class TestParallelConversion:
+    """Test cases for the process pool conversion."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.obsidian_vault = self.temp_dir / "obsidian"
+        generate_vault(self.obsidian_vault, notes=40, paragraphs=3)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _convert(self, name: str, jobs: int):
+        site = self.temp_dir / name
+        config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=site / "content",
+            hugo_static_path=site / "static",
+            hugo_archetypes_path=site / "archetypes",
+            convert_attachments=False,
+            jobs=jobs,
+        )
+        return HugoConverter(config).convert(), site / "content"
+
+    def test_parallel_output_matches_serial(self):
+        """Test that worker processes produce byte-identical output."""
+        serial_stats, serial_content = self._convert("serial", jobs=1)
+        parallel_stats, parallel_content = self._convert("parallel", jobs=2)
+
+        serial_files = sorted(p.relative_to(serial_content) for p in serial_content.rglob("*.md"))
+        parallel_files = sorted(p.relative_to(parallel_content) for p in parallel_content.rglob("*.md"))
+
+        assert serial_files == parallel_files
+        for relative_path in serial_files:
+            assert (serial_content / relative_path).read_bytes() == (parallel_content / relative_path).read_bytes()
+
+        assert parallel_stats.converted_files == serial_stats.converted_files == 40
+        assert parallel_stats.links_converted == serial_stats.links_converted
+        assert parallel_stats.tags_processed == serial_stats.tags_processed
+
+    def test_parallel_run_records_manifest(self):
+        """Test that builds done by workers end up in the parent's manifest."""
+        self._convert("parallel", jobs=2)
+
+        manifest_path = self.temp_dir / "parallel" / ".obsidian-to-hugo" / "manifest.json"
+        assert manifest_path.exists()
+        assert manifest_path.read_text().count("content_hash") == 40
+
+    def test_chunk_size(self):
+        """Test chunk size bounds."""
+        assert chunk_size(1, 8) == 1
+        assert chunk_size(100, 4) == 7
+        assert chunk_size(100_000, 4) == 64
+
+    def test_stats_merge(self):
+        """Test merging partial statistics."""
+        stats = ConversionStats(converted_files=2, links_converted=5, processing_time=1.0)
+        stats.merge(ConversionStats(converted_files=3, error_files=1, processing_time=9.0))
+
+        assert stats.converted_files == 5
+        assert stats.error_files == 1
+        assert stats.links_converted == 5
+        assert stats.processing_time == 1.0
@@ -0,0 +1,95 @@
+"""Unit tests for the parse cache."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from obsidian_to_hugo.utils.obsidian_parser import ObsidianParser
+from obsidian_to_hugo.utils.parse_cache import ParseCache
+
+
+class TestParseCache:
+    """Test cases for ParseCache."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache = ParseCache(self.temp_dir / "cache")
+        self.parser = ObsidianParser(cache=self.cache)
+        self.note_path = self.temp_dir / "note.md"
+        self.content = "---\ntitle: Cached\ntags: [a]\n---\n\n# Body #b with [[link]] ![[img.png]]\n\n"
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_hit_returns_the_same_note(self):
+        """Test that a cached parse equals a fresh one without reparsing."""
+        first = self.parser.parse_content(self.content, self.note_path)
+        
+        with patch("obsidian_to_hugo.utils.obsidian_parser.parse_front_matter") as parse:
+            second = self.parser.parse_content(self.content, self.note_path)
+            parse.assert_not_called()
+        
+        assert second == first
+        assert second.content == "# Body #b with [[link]] ![[img.png]]"
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+    
+    def test_changed_text_misses(self):
+        """Test that an edited note is parsed again."""
+        self.parser.parse_content(self.content, self.note_path)
+        note = self.parser.parse_content(self.content.replace("Cached", "Edited"), self.note_path)
+        
+        assert note.title == "Edited"
+        assert self.cache.misses == 2
+    
+    def test_same_text_at_another_path_misses(self):
+        """Test that entries are keyed by path as well as content."""
+        self.parser.parse_content(self.content, self.note_path)
+        note = self.parser.parse_content("# Other", self.temp_dir / "other.md")
+        
+        assert note.title == "other"
+        assert self.cache.hits == 0
+    
+    def test_corrupt_entry_is_a_miss(self):
+        """Test that unreadable entries are discarded."""
+        key = self.cache.key(self.note_path, self.content)
+        self.parser.parse_content(self.content, self.note_path)
+        entry_path = self.cache._entry_path(key)
+        entry_path.write_bytes(b"not a pickle")
+        
+        assert self.cache.get(key) is None
+        assert not entry_path.exists()
+    
+    def test_prune_evicts_least_recently_used(self):
+        """Test that pruning keeps the most recently used entries."""
+        for index in range(3):
+            self.cache.put(f"{index:02d}" * 20, {"data": "x" * 1000})
+        oldest = self.cache._entry_path("00" * 20)
+        os.utime(oldest, ns=(0, 0))
+        
+        self.cache.max_bytes = 2500
+        self.cache.prune()
+        
+        assert not oldest.exists()
+        assert self.cache.get("01" * 20) is not None
+        assert self.cache.get("02" * 20) is not None
+    
+    def test_cache_directory_is_private(self):
+        """Test that the cache directory is created accessible to its owner only."""
+        self.parser.parse_content(self.content, self.note_path)
+        
+        assert (self.temp_dir / "cache").stat().st_mode & 0o777 == 0o700
+    
+    def test_shared_cache_directory_is_not_loaded(self):
+        """Test that entries in a directory others can write to are never unpickled."""
+        self.parser.parse_content(self.content, self.note_path)
+        (self.temp_dir / "cache").chmod(0o777)
+        
+        shared = ParseCache(self.temp_dir / "cache")
+        with patch("obsidian_to_hugo.utils.parse_cache.pickle.load") as load:
+            assert shared.get(shared.key(self.note_path, self.content)) is None
+            load.assert_not_called()
+        assert shared.misses == 1
@@ -0,0 +1,50 @@
+"""Unit tests for include/exclude path matching."""
+
+from obsidian_to_hugo.utils.path_matcher import PathMatcher
+
+
+class TestPathMatcher:
+    """Test cases for PathMatcher."""
+    
+    def test_include_matches_at_any_depth(self):
+        """Test that unanchored include patterns match in subdirectories."""
+        matcher = PathMatcher(["*.md", "notes/*.markdown"])
+        
+        assert matcher.matches("note.md")
+        assert matcher.matches("a/b/note.md")
+        assert matcher.matches("x/notes/page.markdown")
+        assert not matcher.matches("page.markdown")
+        assert not matcher.matches("image.png")
+    
+    def test_exclude_covers_directory_contents(self):
+        """Test that excluding a directory excludes everything below it."""
+        matcher = PathMatcher(["*.md"], ["**/draft/*", "private"])
+        
+        assert not matcher.matches("draft/note.md")
+        assert not matcher.matches("a/draft/deep/note.md")
+        assert not matcher.matches("private/x/note.md")
+        assert matcher.matches("drafts/note.md")
+        assert matcher.prunes("draft")
+        assert matcher.prunes("a/private")
+        assert not matcher.prunes("public")
+    
+    def test_anchored_and_directory_only_patterns(self):
+        """Test leading and trailing slashes."""
+        matcher = PathMatcher(["*.md"], ["/templates", "tmp/"])
+        
+        assert not matcher.matches("templates/t.md")
+        assert matcher.matches("sub/templates/t.md")
+        assert not matcher.matches("a/tmp/note.md")
+        assert matcher.matches("tmp.md")
+    
+    def test_character_classes(self):
+        """Test ? and bracket expressions."""
+        matcher = PathMatcher(["*.md"], ["draft-?.md", "[!a]*.md"])
+        
+        assert not matcher.matches("draft-1.md")
+        assert not matcher.matches("b.md")
+        assert matcher.matches("a.md")
+    
+    def test_no_include_patterns(self):
+        """Test that nothing matches without include patterns."""
+        assert not PathMatcher([]).matches("note.md")
@@ -0,0 +1,76 @@
+"""Unit tests for pipelined conversion."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.benchmarks.synthetic_vault import generate_vault
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.converters.pipeline import convert_pipelined
+from obsidian_to_hugo.core.models import ConversionConfig
+
+
+class TestPipelinedConversion:
+    """Test cases for the threaded read, transform and write pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.obsidian_vault = self.temp_dir / "obsidian"
+        generate_vault(self.obsidian_vault, notes=40, paragraphs=3)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _config(self, name: str, **kwargs) -> ConversionConfig:
+        site = self.temp_dir / name
+        return ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=site / "content",
+            hugo_static_path=site / "static",
+            hugo_archetypes_path=site / "archetypes",
+            convert_attachments=False,
+            parse_cache=False,
+            **kwargs,
+        )
+
+    def test_pipeline_output_matches_serial(self):
+        """Test that the pipeline writes byte-identical output and the same manifest."""
+        serial_config = self._config("serial")
+        pipeline_config = self._config("pipeline", pipeline=True, jobs=4, pipeline_prefetch=3)
+        serial_stats = HugoConverter(serial_config).convert()
+        pipeline_stats = HugoConverter(pipeline_config).convert()
+
+        serial_content = serial_config.hugo_content_path
+        pipeline_content = pipeline_config.hugo_content_path
+        serial_files = sorted(p.relative_to(serial_content) for p in serial_content.rglob("*.md"))
+        pipeline_files = sorted(p.relative_to(pipeline_content) for p in pipeline_content.rglob("*.md"))
+
+        assert serial_files == pipeline_files
+        for relative_path in serial_files:
+            assert (serial_content / relative_path).read_bytes() == (pipeline_content / relative_path).read_bytes()
+
+        assert pipeline_stats.converted_files == serial_stats.converted_files == 40
+        assert pipeline_stats.links_converted == serial_stats.links_converted
+        assert pipeline_stats.tags_processed == serial_stats.tags_processed
+        assert pipeline_stats.unresolved_links == serial_stats.unresolved_links
+        assert pipeline_config.manifest_path.read_text().count("content_hash") == 40
+
+    def test_pipeline_reports_errors_in_input_order(self):
+        """Test that failing notes are reported in order and do not stop the run."""
+        config = self._config("pipeline", pipeline=True, jobs=4)
+        converter = HugoConverter(config)
+        file_paths = converter.prepare()
+        broken = [file_paths[3], file_paths[17]]
+        broken[0].write_bytes(b"\xff\xfe not utf-8")
+        broken[1].unlink()
+
+        progress = []
+        stats, errors = convert_pipelined(converter, file_paths, 4, progress.append, prefetch=2)
+
+        assert [file_path for file_path, _ in errors] == broken
+        assert stats.error_files == 2
+        assert stats.converted_files == 38
+        assert sum(progress) == 40
+        assert len(converter.manifest.entries) == 38
@@ -0,0 +1,84 @@
+"""Unit tests for conversion timing and profiling."""
+
+import json
+import pstats
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.converters.hugo_converter import HugoConverter
+from obsidian_to_hugo.core.models import SLOWEST_FILES_KEPT, ConversionConfig, ConversionStats
+from obsidian_to_hugo.utils.profiling import profile_run
+
+
+class TestConversionTiming:
+    """Test cases for stage timers and the slowest files."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.obsidian_vault = self.temp_dir / "obsidian"
+        self.obsidian_vault.mkdir()
+        for index in range(3):
+            (self.obsidian_vault / f"note{index}.md").write_text(f"# Note {index}\n\nSee [[note0]] #tag\n")
+        
+        self.config = ConversionConfig(
+            obsidian_vault_path=self.obsidian_vault,
+            hugo_content_path=self.temp_dir / "hugo" / "content",
+            hugo_static_path=self.temp_dir / "hugo" / "static",
+            hugo_archetypes_path=self.temp_dir / "hugo" / "archetypes",
+            parse_cache=False,
+        )
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_convert_records_stages(self):
+        """Test that a conversion times its stages and files."""
+        stats = HugoConverter(self.config).convert()
+        
+        assert stats.processing_time > 0
+        for stage in ("scan", "link_map", "read", "parse", "transform", "front_matter", "write", "manifest"):
+            assert stage in stats.stage_times
+        assert sum(stats.stage_times.values()) <= stats.processing_time
+        assert len(stats.slowest()) == 3
+    
+    def test_slowest_files_are_bounded(self):
+        """Test that only the slowest files are kept, slowest first."""
+        stats = ConversionStats()
+        for index in range(SLOWEST_FILES_KEPT + 5):
+            stats.record_file_time(f"note{index}.md", float(index))
+        
+        slowest = stats.slowest(3)
+        assert [file_path for _, file_path in slowest] == [
+            f"note{SLOWEST_FILES_KEPT + 4}.md",
+            f"note{SLOWEST_FILES_KEPT + 3}.md",
+            f"note{SLOWEST_FILES_KEPT + 2}.md",
+        ]
+        assert len(stats.slowest_files) == SLOWEST_FILES_KEPT
+    
+    def test_merge_adds_stage_times(self):
+        """Test that partial statistics combine their timings."""
+        stats = ConversionStats(stage_times={"parse": 1.0})
+        stats.record_file_time("a.md", 1.0)
+        other = ConversionStats(stage_times={"parse": 0.5, "write": 2.0})
+        other.record_file_time("b.md", 3.0)
+        
+        stats.merge(other)
+        
+        assert stats.stage_times == {"parse": 1.5, "write": 2.0}
+        assert stats.slowest() == [(3.0, "b.md"), (1.0, "a.md")]
+    
+    def test_profile_run_writes_pstats_and_trace(self):
+        """Test that a profiled conversion leaves a pstats dump and a Chrome trace."""
+        with profile_run(self.temp_dir / "profile" / "run") as (pstats_path, trace_path):
+            HugoConverter(self.config).convert()
+        
+        assert pstats_path == self.temp_dir / "profile" / "run.pstats"
+        assert pstats.Stats(str(pstats_path)).total_calls > 0
+        
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        names = {event["name"] for event in events}
+        assert {"parse", "transform", "write", "note0.md"} <= names
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
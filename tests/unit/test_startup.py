@@ -0,0 +1,89 @@
+"""Unit tests for the command-line start-up cost."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import obsidian_to_hugo
+
+# Modules only the commands that need them may load
+HEAVY_MODULES = (
+    "rich",
+    "pydantic",
+    "yaml",
+    "frontmatter",
+    "toml",
+    "watchdog",
+    "PyQt6",
+    "obsidian_to_hugo.converters",
+    "obsidian_to_hugo.benchmarks",
+)
+
+# Generous bound on the cumulative import time of the CLI, in microseconds
+IMPORT_BUDGET_US = 200_000
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    """Run Python in a fresh interpreter that imports this checkout."""
+    env = dict(os.environ, PYTHONPATH=str(Path(obsidian_to_hugo.__file__).parents[1]))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _import_times(code: str) -> dict:
+    """Run code in a fresh interpreter and return the cumulative import time of each module."""
+    result = _run("-X", "importtime", "-c", code)
+    
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def _heavy(modules) -> list:
+    return sorted(
+        module for module in modules
+        if any(module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+class TestStartup:
+    """Test cases for lazy imports in the CLI."""
+    
+    def test_importing_the_cli_is_cheap(self):
+        """Test that importing the CLI loads no heavy dependency and stays within budget."""
+        times = _import_times("import obsidian_to_hugo.cli")
+        
+        assert _heavy(times) == []
+        assert times["obsidian_to_hugo.cli"] < IMPORT_BUDGET_US
+    
+    def test_help_does_not_import_commands(self):
+        """Test that --help lists every command without importing their dependencies."""
+        code = (
+            "import json, sys\n"
+            "from obsidian_to_hugo.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(json.dumps(sorted(sys.modules)))\n"
+        )
+        *help_lines, modules = _run("-c", code).stdout.splitlines()
+        
+        assert _heavy(json.loads(modules)) == []
+        for command in ("analyze", "bench", "convert", "serve", "stats", "watch"):
+            assert any(line.strip().startswith(command) for line in help_lines)
+    
+    def test_lazy_command_is_loaded_on_use(self):
+        """Test that a lazy subcommand resolves to the real command."""
+        from click import Context
+        
+        from obsidian_to_hugo.benchmarks.suite import main as bench
+        from obsidian_to_hugo.cli import cli
+        
+        assert cli.get_command(Context(cli), "bench") is bench
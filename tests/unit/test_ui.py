@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QThread
 
-from obsidian_to_hugo.ui.main_window import MainWindow, ConversionWorker, WatchWorker
+from obsidian_to_hugo.ui.main_window import MainWindow, AnalysisWorker, ConversionWorker, WatchWorker
 from obsidian_to_hugo.core.models import ConversionConfig, ConversionStats
 
 
@@ -173,6 +173,56 @@ class TestConversionWorker:
         worker.finished.assert_not_called()
 
 
+class TestAnalysisWorker:
+    """Test AnalysisWorker functionality."""
+    
+    @pytest.fixture
+    def vault(self, tmp_path):
+        """Create a vault with notes in two directories."""
+        vault = tmp_path / "vault"
+        (vault / "folder").mkdir(parents=True)
+        for i in range(150):
+            note = vault / ("folder" if i % 2 else "") / f"note{i}.md"
+            note.write_text(f"# Note {i}\n\n#tag{i % 3} [[note{i + 1}]]\n")
+        return vault
+    
+    def _worker(self, vault: Path) -> AnalysisWorker:
+        worker = AnalysisWorker(vault)
+        worker.batch_ready = Mock()
+        worker.finished = Mock()
+        worker.error = Mock()
+        return worker
+    
+    @patch('obsidian_to_hugo.ui.main_window.default_cache_dir')
+    def test_analysis_worker_streams_batches(self, mock_cache_dir, vault, tmp_path):
+        """Test that results arrive in batches grouped by directory."""
+        mock_cache_dir.return_value = tmp_path / "cache"
+        worker = self._worker(vault)
+        
+        worker.run()
+        
+        batches = [call.args for call in worker.batch_ready.emit.call_args_list]
+        assert len(batches) == 2
+        assert sum(len(batch.notes) for batch, _ in batches) == 150
+        assert sum(len(names) for _, directories in batches for names in directories.values()) == 150
+        assert {dir_name for _, directories in batches for dir_name in directories} == {"Root", "folder"}
+        assert sum(len(batch.tags) for batch, _ in batches) == 3
+        worker.finished.emit.assert_called_once_with(True)
+        worker.error.emit.assert_not_called()
+    
+    @patch('obsidian_to_hugo.ui.main_window.default_cache_dir')
+    def test_analysis_worker_stops_when_interrupted(self, mock_cache_dir, vault, tmp_path):
+        """Test that a cancelled analysis stops after the current batch."""
+        mock_cache_dir.return_value = tmp_path / "cache"
+        worker = self._worker(vault)
+        worker.isInterruptionRequested = Mock(return_value=True)
+        
+        worker.run()
+        
+        worker.batch_ready.emit.assert_called_once()
+        worker.finished.emit.assert_called_once_with(False)
+
+
 class TestWatchWorker:
     """Test WatchWorker functionality."""
     
@@ -0,0 +1,60 @@
+"""Unit tests for vault analysis."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.utils.obsidian_parser import ObsidianParser
+from obsidian_to_hugo.utils.vault_analysis import VaultAnalysis, analyze_vault, iter_vault_analysis
+
+
+class TestVaultAnalysis:
+    """Test cases for analyze_vault and iter_vault_analysis."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.vault = self.temp_dir / "vault"
+        self.vault.mkdir()
+        for i in range(5):
+            (self.vault / f"note{i}.md").write_text(
+                f"---\naliases: [alias{i}]\n---\n# Note {i}\n\n#common #tag{i} [[note{(i + 1) % 5}]]\n"
+            )
+        (self.vault / "single.md").write_text("---\nalias: Solo\n---\n# Single\n")
+        (self.vault / "image.png").write_bytes(b"png")
+        self.parser = ObsidianParser()
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_batches_only_carry_new_tags_and_links(self):
+        """Test that each batch reports the names the earlier batches did not."""
+        batches = list(iter_vault_analysis(self.vault, self.parser, batch_size=2))
+        
+        assert [len(batch.notes) for batch in batches] == [2, 2, 2]
+        assert all((batch.total_files, batch.attachments) == (6, 1) for batch in batches)
+        assert "common" in batches[0].tags
+        assert all("common" not in batch.tags for batch in batches[1:])
+        assert sum(len(batch.tags) for batch in batches) == 6
+        assert sum(len(batch.links) for batch in batches) == 5
+    
+    def test_batches_add_up_to_the_full_analysis(self):
+        """Test that folding the batches gives the same result as analyze_vault."""
+        folded = VaultAnalysis()
+        for batch in iter_vault_analysis(self.vault, self.parser, batch_size=2):
+            folded.add_batch(batch)
+        
+        assert folded == analyze_vault(self.vault, self.parser)
+        # 'alias' counts like 'aliases', as when the converter resolves links
+        assert folded.aliases == 6
+    
+    def test_empty_vault_yields_one_batch(self):
+        """Test that an empty vault still reports its counts."""
+        empty = self.temp_dir / "empty"
+        empty.mkdir()
+        
+        batches = list(iter_vault_analysis(empty, self.parser))
+        
+        assert len(batches) == 1
+        assert (batches[0].total_files, batches[0].notes) == (0, [])
@@ -0,0 +1,65 @@
+"""Unit tests for the vault scanner."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from obsidian_to_hugo.utils.vault_scanner import VaultScanner
+
+
+class TestVaultScanner:
+    """Test cases for VaultScanner."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.vault = self.temp_dir / "vault"
+        for relative_path, content in {
+            "note1.md": "# Note 1",
+            "folder/note2.md": "# Note 2",
+            "folder/image.PNG": "png",
+            "folder/data.csv": "a,b",
+            "draft/note3.md": "# Draft",
+            ".obsidian/workspace.md": "state",
+            ".obsidian/plugins/icon.png": "icon",
+            ".trash/old.md": "# Old",
+            ".git/HEAD.md": "ref",
+        }.items():
+            path = self.vault / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_single_walk_finds_notes_and_attachments(self):
+        """Test that one scan sorts files into notes and attachments."""
+        inventory = VaultScanner(self.vault, attachment_extensions={"png"}).scan()
+        
+        assert [note.relative_path for note in inventory.notes] == [
+            "note1.md", "draft/note3.md", "folder/note2.md",
+        ]
+        assert [attachment.relative_path for attachment in inventory.attachments] == ["folder/image.PNG"]
+    
+    def test_ignored_directories_are_not_entered(self):
+        """Test that .obsidian, .trash and .git are pruned."""
+        inventory = VaultScanner(self.vault, attachment_extensions={"png"}).scan()
+        paths = [vault_file.relative_path for vault_file in inventory.notes + inventory.attachments]
+        
+        assert not any(path.startswith((".obsidian", ".trash", ".git")) for path in paths)
+        assert inventory.directories == 3
+    
+    def test_exclude_patterns(self):
+        """Test that excluded notes are left out."""
+        inventory = VaultScanner(self.vault, exclude_patterns=["draft/"]).scan()
+        
+        assert sorted(note.path.name for note in inventory.notes) == ["note1.md", "note2.md"]
+    
+    def test_stat_data_is_collected(self):
+        """Test that scanned files carry their size and mtime."""
+        inventory = VaultScanner(self.vault).scan()
+        note = next(note for note in inventory.notes if note.relative_path == "note1.md")
+        stat = (self.vault / "note1.md").stat()
+        
+        assert (note.size, note.mtime_ns) == (stat.st_size, stat.st_mtime_ns)